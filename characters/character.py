@@ -3,17 +3,121 @@ Character module for LLM-RPG
 Defines the base Character class used for both player and NPCs
 """
 
+import itertools
 import logging
-import time
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple
-from characters.character_types import CharacterClass, CharacterRace
+from characters.character_types import (
+    CLASS_VALUES, RACE_VALUES, CharacterClass, CharacterRace,
+)
 
 logger = logging.getLogger("llm_rpg.character")
 
-@dataclass
+STAT_NAMES = ("strength", "dexterity", "constitution",
+              "intelligence", "wisdom", "charisma")
+# Spellings callers actually pass -> slot name, so get_stat_modifier skips
+# the per-call str.lower() allocation. Modifiers stay computed live: stats
+# are assigned directly all over the engine, so a cached value would go stale.
+_STAT_ALIASES = {alias: s for s in STAT_NAMES
+                 for alias in (s, s.capitalize(), s.upper())}
+
+# Relationship bands: a value >= _REL_THRESHOLDS[i] earns _REL_LABELS[i + 1].
+_REL_THRESHOLDS = (-60, -30, 0, 30, 60, 80)
+_REL_LABELS = ("sworn enemy", "enemy", "dislikes", "neutral",
+               "acquaintance", "friend", "close friend")
+
+
+def item_name(item: Any) -> str:
+    """Name of an inventory entry: its `.name`, or str() for plain strings."""
+    name = getattr(item, "name", None)
+    return name if name is not None else str(item)
+
+
+class Memory:
+    """One remembered event. Slotted, so an NPC's memory list doesn't carry a
+    hash table per entry; reads like the legacy dict entries (`m["event"]`,
+    `m.get("game_time")`) because saved games and npc_memory still hold
+    those alongside."""
+
+    __slots__ = ("event", "importance", "time", "game_time")
+
+    def __init__(self, event: str, importance: int = 1, time: Any = None,
+                 game_time: Optional[int] = None):
+        self.event = event
+        self.importance = importance
+        self.time = time
+        self.game_time = game_time
+
+    def __getitem__(self, key: str) -> Any:
+        if key in Memory.__slots__:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in Memory.__slots__:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        return default
+
+    def __repr__(self) -> str:
+        return f"Memory({self.to_dict()!r})"
+
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> "Memory":
+        return cls(d.get("event", ""), d.get("importance", 1),
+                   d.get("time"), d.get("game_time"))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-safe dict in the legacy shape (unset fields omitted)."""
+        d = {"event": self.event, "importance": self.importance}
+        if self.time is not None:
+            d["time"] = self.time
+        if self.game_time is not None:
+            d["game_time"] = self.game_time
+        return d
+
+
+# Process-wide insertion counter stamped on add_memory entries. Only their
+# relative order matters (game time rides `game_time`), so a C-level int
+# increment replaces the old time.time() wall-clock read. Pre-change saves
+# still carry float timestamps there; nothing compares the two.
+_memory_ticks = itertools.count()
+
+
+def _memory_rank(memory: Memory) -> int:
+    """Sort key putting `memories` in descending-importance order."""
+    return -memory["importance"]
+
+
+@dataclass(frozen=True, slots=True)
+class NPCSnapshot:
+    """The per-turn half of an NPC's prompt, copied out for an NPC process
+    (Character.snapshot): small to pickle, and later main-thread edits to
+    the live character cannot reach it. The profile half (class, race,
+    stats, description) goes across once, with update_npc."""
+
+    id: str
+    position: Tuple[int, int]
+    hp: int
+    max_hp: int
+    status: str
+    personality: Dict[str, Any]
+    goals: Tuple[str, ...]
+    relationships: Dict[str, int]
+    memories: Tuple[Dict[str, Any], ...]   # the last few, as prompts show
+
+
+@dataclass(slots=True)
 class Character:
-    """Base class for all characters (PC and NPCs)"""
+    """Base class for all characters (PC and NPCs).
+
+    Slotted: every attribute the engine assigns must be declared here —
+    the late-bound ones (home_location, last_position, equipment) included.
+    """
 
     id: str
     name: str
@@ -36,31 +140,38 @@ class Character:
     personality: Dict[str, Any] = field(default_factory=dict)
     goals: List[str] = field(default_factory=list)
     relationships: Dict[str, int] = field(default_factory=dict)
-    memories: List[Dict[str, Any]] = field(default_factory=list)
+    memories: List[Memory] = field(default_factory=list)  # or legacy dicts
     status: str = field(default="alive")  # alive, defeated, dead
     faction: str = field(default="neutral")
     metadata: Dict[str, Any] = field(default_factory=dict)  # xp, bank, mana, spells, effects, faction_rep
+    home_location: str = field(default="")  # owning location name ("" = none)
+    last_position: Optional[Tuple[int, int]] = field(default=None)  # where they fell
+    equipment: Optional[Dict[str, Any]] = field(default=None)  # slot -> Item (characters.equipment)
 
     def add_memory(self, event: str, importance: int = 1) -> None:
         """Add a memory to the character's memory list"""
-        memory = {
-            "event": event,
-            "importance": importance,
-            "time": time.time()  # Real-world timestamp for easy tracking
-        }
+        memory = Memory(event, importance, next(_memory_ticks))
         self.memories.append(memory)
 
-        # Sort memories by importance
-        self.memories.sort(key=lambda m: m["importance"], reverse=True)
+        # Sort memories by importance. A full (stable) sort, not an insort:
+        # npc_memory.remember appends in game-time order without sorting,
+        # so the list is not guaranteed ordered here.
+        self.memories.sort(key=_memory_rank)
 
-        logger.debug(f"Added memory to {self.name}: {event} (importance: {importance})")
+        logger.debug("Added memory to %s: %s (importance: %s)",
+                     self.name, event, importance)
 
     def modify_relationship(self, character_id: str, change: int) -> None:
         """Modify relationship with another character"""
-        current = self.relationships.get(character_id, 0)
-        self.relationships[character_id] = max(-100, min(100, current + change))
+        value = self.relationships.get(character_id, 0) + change
+        if value > 100:
+            value = 100
+        elif value < -100:
+            value = -100
+        self.relationships[character_id] = value
 
-        logger.debug(f"Modified relationship: {self.name} -> {character_id} by {change} (now: {self.relationships[character_id]})")
+        logger.debug("Modified relationship: %s -> %s by %s (now: %s)",
+                     self.name, character_id, change, value)
 
     def get_relationship(self, character_id: str) -> int:
         """Get relationship value with another character"""
@@ -68,22 +179,8 @@ class Character:
 
     def get_relationship_description(self, character_id: str) -> str:
         """Get description of relationship with another character"""
-        value = self.get_relationship(character_id)
-
-        if value >= 80:
-            return "close friend"
-        elif value >= 60:
-            return "friend"
-        elif value >= 30:
-            return "acquaintance"
-        elif value >= 0:
-            return "neutral"
-        elif value >= -30:
-            return "dislikes"
-        elif value >= -60:
-            return "enemy"
-        else:
-            return "sworn enemy"
+        return _REL_LABELS[bisect_right(_REL_THRESHOLDS,
+                                        self.get_relationship(character_id))]
 
     def add_item(self, item: Any) -> bool:
         """Add an item to the character's inventory, MERGING identical stackable
@@ -96,54 +193,56 @@ class Character:
             self.inventory.append(item)
             merged = False
 
-        item_name = item.name if hasattr(item, "name") else str(item)
-        logger.debug(f"{self.name} added item to inventory: {item_name}")
+        logger.debug("%s added item to inventory: %s", self.name, item)
         return merged
 
     def remove_item(self, item: Any) -> bool:
         """Remove an item from the character's inventory"""
-        item_name = item.name if hasattr(item, "name") else str(item)
+        name = item_name(item)
 
-        # Check if we have this exact item
-        if item in self.inventory:
-            self.inventory.remove(item)
-            logger.debug(f"{self.name} removed item from inventory: {item_name}")
+        # Check if we have this exact item (one scan, not `in` + remove)
+        try:
+            i = self.inventory.index(item)
+        except ValueError:
+            # Check by name if we have a similar item
+            i = self.find_item_index(name)
+        if i >= 0:
+            del self.inventory[i]
+            logger.debug("%s removed item from inventory: %s", self.name, name)
             return True
 
-        # Check by name if we have a similar item
-        for inv_item in list(self.inventory):
-            inv_item_name = inv_item.name if hasattr(inv_item, "name") else str(inv_item)
-            if inv_item_name == item_name:
-                self.inventory.remove(inv_item)
-                logger.debug(f"{self.name} removed item from inventory: {item_name}")
-                return True
-
-        logger.debug(f"{self.name} failed to remove item: {item_name} (not found)")
+        logger.debug("%s failed to remove item: %s (not found)", self.name, name)
         return False
 
+    def find_item_index(self, name: str) -> int:
+        """Slot index of the first inventory item called `name`, or -1."""
+        for i, item in enumerate(self.inventory):
+            if item_name(item) == name:
+                return i
+        return -1
+
     def has_item(self, item_name: str) -> bool:
         """Check if character has an item by name"""
-        for item in self.inventory:
-            if (hasattr(item, "name") and item.name == item_name) or str(item) == item_name:
-                return True
-        return False
+        return self.find_item_index(item_name) >= 0
 
     def modify_gold(self, amount: int) -> int:
         """Add or remove gold, returns new amount"""
         self.gold += amount
-        logger.debug(f"{self.name} gold modified by {amount} (now: {self.gold})")
+        logger.debug("%s gold modified by %s (now: %s)", self.name, amount, self.gold)
         return self.gold
 
     def take_damage(self, amount: int) -> int:
         """Character takes damage, returns remaining HP"""
         self.hp = max(0, self.hp - amount)
-        logger.debug(f"{self.name} took {amount} damage (now: {self.hp}/{self.max_hp})")
+        logger.debug("%s took %s damage (now: %s/%s)",
+                     self.name, amount, self.hp, self.max_hp)
         return self.hp
 
     def heal(self, amount: int) -> int:
         """Character heals damage, returns new HP"""
         self.hp = min(self.max_hp, self.hp + amount)
-        logger.debug(f"{self.name} healed {amount} HP (now: {self.hp}/{self.max_hp})")
+        logger.debug("%s healed %s HP (now: %s/%s)",
+                     self.name, amount, self.hp, self.max_hp)
         return self.hp
 
     def is_alive(self) -> bool:
@@ -154,15 +253,15 @@ class Character:
         """Add a goal to the character"""
         if goal not in self.goals:
             self.goals.append(goal)
-            logger.debug(f"{self.name} added goal: {goal}")
+            logger.debug("%s added goal: %s", self.name, goal)
 
     def remove_goal(self, goal: str) -> bool:
         """Remove a goal from the character"""
         if goal in self.goals:
             self.goals.remove(goal)
-            logger.debug(f"{self.name} removed goal: {goal}")
+            logger.debug("%s removed goal: %s", self.name, goal)
             return True
-        logger.debug(f"{self.name} failed to remove goal: {goal} (not found)")
+        logger.debug("%s failed to remove goal: %s (not found)", self.name, goal)
         return False
 
     def defeat(self):
@@ -170,7 +269,7 @@ class Character:
         old_status = getattr(self, 'status', 'alive')
         self.hp = 0
         self.status = "defeated"
-        logger.debug(f"Character {self.name} was defeated")
+        logger.debug("Character %s was defeated", self.name)
 
         # If we have a process manager, update the process
         if hasattr(self, 'engine') and hasattr(self.engine, 'process_manager'):
@@ -184,7 +283,7 @@ class Character:
         """Mark character as permanently dead"""
         self.hp = 0
         self.status = "dead"
-        logger.debug(f"Character {self.name} was killed")
+        logger.debug("Character %s was killed", self.name)
 
     def revive(self, hp_percent=0.5):
         """Revive a defeated character"""
@@ -192,7 +291,7 @@ class Character:
             old_status = self.status
             self.status = "alive"
             self.hp = int(self.max_hp * hp_percent)
-            logger.debug(f"Character {self.name} was revived with {self.hp} HP")
+            logger.debug("Character %s was revived with %s HP", self.name, self.hp)
 
             # If we have a process manager, update the process
             if hasattr(self, 'engine') and hasattr(self.engine, 'process_manager'):
@@ -200,7 +299,7 @@ class Character:
                     # Unsuspend the process
                     self.engine.process_manager.send_command(self.id, "unsuspend")
                     # And update the NPC data
-                    self.engine.process_manager.send_command(self.id, "update_npc", self.to_dict())
+                    self.engine.process_manager.update_npc(self)
 
             return True
         return False
@@ -212,16 +311,30 @@ class Character:
 
     def get_stat_modifier(self, stat: str) -> int:
         """Get the modifier for a stat"""
-        stat_value = getattr(self, stat.lower(), 10)
+        name = _STAT_ALIASES.get(stat)
+        if name is None:                     # unusual spelling: slow path
+            name = stat.lower()
+        stat_value = getattr(self, name, 10)
         return (stat_value - 10) // 2
 
+    def snapshot(self, recent_memories: int = 5) -> NPCSnapshot:
+        """Copy the volatile prompt fields into an NPCSnapshot"""
+        return NPCSnapshot(
+            self.id, tuple(self.position), self.hp, self.max_hp, self.status,
+            {k: list(v) if isinstance(v, list) else v
+             for k, v in self.personality.items()},
+            tuple(self.goals), dict(self.relationships),
+            tuple(m.to_dict() if isinstance(m, Memory) else dict(m)
+                  for m in self.memories[-recent_memories:]))
+
     def to_dict(self) -> Dict:
-        """Convert character to dictionary"""
+        """Convert character to dictionary (shares the personality/goals/
+        relationships/metadata containers rather than copying them)"""
         return {
             "id": self.id,
             "name": self.name,
-            "class": self.character_class.value,
-            "race": self.race.value,
+            "class": CLASS_VALUES[self.character_class],
+            "race": RACE_VALUES[self.race],
             "level": self.level,
             "stats": {
                 "strength": self.strength,
@@ -234,17 +347,17 @@ class Character:
             "hp": self.hp,
             "max_hp": self.max_hp,
             "position": self.position,
-            "inventory": [item.name if hasattr(item, "name") else str(item) for item in self.inventory],
+            "inventory": list(map(item_name, self.inventory)),
             "gold": self.gold,
             "description": self.description,
             "personality": self.personality,
             "goals": self.goals,
             "relationships": self.relationships,
-            "faction": getattr(self, "faction", "neutral"),
+            "faction": self.faction,
             "symbol": self.symbol,
-            "metadata": getattr(self, "metadata", {}),
+            "metadata": self.metadata,
         }
 
     def __str__(self) -> str:
         """String representation of the character"""
-        return f"{self.name} (Level {self.level} {self.race.value} {self.character_class.value})"
+        return f"{self.name} (Level {self.level} {RACE_VALUES[self.race]} {CLASS_VALUES[self.character_class]})"
@@ -46,6 +46,12 @@ class CharacterRace(Enum):
     TROLL = "troll"  # New race
 
 
+# Member -> value string, built once: a dict hit skips Enum's `.value`
+# descriptor on hot paths (Character.__str__ / to_dict, NPC descriptions)
+CLASS_VALUES = {m: m.value for m in CharacterClass}
+RACE_VALUES = {m: m.value for m in CharacterRace}
+
+
 class Alignment(Enum):
     """D&D-style character alignment"""
     LAWFUL_GOOD = "lawful good"
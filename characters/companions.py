@@ -307,8 +307,8 @@ class CompanionManager:
             if focus is not None:
                 fx, fy = focus.position
                 cx, cy = npc.position
-                d = ((cx - fx) ** 2 + (cy - fy) ** 2) ** 0.5
-                if d <= 1.5:
+                d2 = (cx - fx) ** 2 + (cy - fy) ** 2
+                if d2 <= 2.25:
                     # One free sidestep onto the flanking tile first —
                     # every later swing earns the +2
                     goal = flank_tile(self.engine, npc, focus)
@@ -322,7 +322,7 @@ class CompanionManager:
                         npc, focus, "attack")
                     self.engine.memory_manager.add_event(result)
                     continue
-                if d <= FOCUS_RADIUS:
+                if d2 <= FOCUS_RADIUS * FOCUS_RADIUS:
                     goal = flank_tile(self.engine, npc, focus)
                     if goal and npc.position != goal:
                         from engine.squad_tactics import path_step
@@ -361,8 +361,7 @@ class CompanionManager:
             if klass not in ("brigand", "monster", "troll"):
                 continue
             nx, ny = npc.position
-            d = ((cx - nx) ** 2 + (cy - ny) ** 2) ** 0.5
-            if d <= 1.5:
+            if (cx - nx) ** 2 + (cy - ny) ** 2 <= 2.25:
                 self.engine.combat_system.npc_attack(comp, npc.name, "attack")
                 return True
         return False
@@ -370,14 +369,14 @@ class CompanionManager:
     def _companion_step_toward(self, comp, target_pos) -> None:
         cx, cy = comp.position
         tx, ty = target_pos
-        d = ((cx - tx) ** 2 + (cy - ty) ** 2) ** 0.5
-        if d <= 1.5:  # Already adjacent — stay put
+        d2 = (cx - tx) ** 2 + (cy - ty) ** 2
+        if d2 <= 2.25:  # Already adjacent — stay put
             return
         # CATCH UP when left far behind (George: a fast away-hero out-ran its
         # party across the map and stranded them ~100 tiles back). Like any
         # RPG, a companion that falls out of sight rejoins near the leader
         # instead of pathing forever across the whole world.
-        if d > CATCHUP_DIST:
+        if d2 > CATCHUP_DIST * CATCHUP_DIST:
             spot = self._catchup_spot(tx, ty)
             if spot is not None:
                 self.engine.world.map.place_character(comp, *spot)
@@ -62,7 +62,7 @@ def gossip_for(npc, engine, max_lines: int = 1) -> List[str]:
                 spouse = engine.npc_manager.get_npc(fam.spouse)
                 if spouse and rng.random() < 0.35:
                     lines.append(f"My spouse, {spouse.name}, "
-                                 f"runs the {spouse.home_location if hasattr(spouse, 'home_location') else 'place'}.")
+                                 f"runs the {spouse.home_location or 'place'}.")
             if fam.siblings and rng.random() < 0.25:
                 sib_id = rng.choice(fam.siblings)
                 sib = engine.npc_manager.get_npc(sib_id)
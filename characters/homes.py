@@ -87,7 +87,7 @@ class HomeSystem:
             home = getattr(npc, "home_location", "")
             if home and home in engine.interiors:
                 continue
-            npc.home_location = watch[0].name
+            engine.npc_manager.set_home_location(npc, watch[0].name)
 
     def _spawn_resident(self, loc, npc_class: str) -> bool:
         from characters.character import Character
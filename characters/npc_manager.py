@@ -4,21 +4,124 @@ Manages creation and tracking of NPC characters
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from collections import defaultdict
+from typing import Dict, List, Optional, Any, Tuple
+import os
 import random
-import uuid
+import re
 
-from characters.character import Character
-from characters.character_types import CharacterClass, CharacterRace
+from characters.character import Character, STAT_NAMES
+from characters.character_types import (
+    CLASS_VALUES, RACE_VALUES, CharacterClass, CharacterRace,
+)
 import config
 
 logger = logging.getLogger("llm_rpg.npc_manager")
 
+# Random-NPC content pools: module-level tuples, built once at import rather
+# than re-allocated on every create_random_npc call.
+_HUMAN_NAMES = (
+    "Aldric", "Bran", "Cedric", "Dorn", "Eadric", "Fendrel", "Gavin",
+    "Hector", "Ivar", "Jorah", "Kade", "Leif", "Marek", "Nyles",
+    "Oswald", "Phelan", "Quincy", "Rowan", "Silas", "Tristan",
+    "Adela", "Brenna", "Cora", "Delia", "Eliza", "Faye", "Greta",
+    "Hilda", "Ida", "Jenna", "Kira", "Lyra", "Mira", "Nora",
+    "Ophelia", "Piper", "Quinn", "Rose", "Sylvia", "Thea")
+_DWARF_NAMES = (
+    "Balin", "Dwalin", "Thorin", "Dain", "Gimli", "Gloin", "Durin",
+    "Thrain", "Bombur", "Fili", "Kili", "Nori", "Ori", "Bifur",
+    "Bofur", "Dori", "Darva", "Helga", "Sigrid", "Thyra", "Britta")
+_ELF_NAMES = (
+    "Legolas", "Elrond", "Thranduil", "Celeborn", "Haldir", "Aegnor",
+    "Finrod", "Orophin", "Galadriel", "Arwen", "Celebrian", "Tauriel",
+    "Luthien", "Nimrodel", "Elwing", "Maedhros", "Maglor", "Fingon")
+_NAMES_BY_RACE = {CharacterRace.DWARF: _DWARF_NAMES,
+                  CharacterRace.ELF: _ELF_NAMES}
+
+_RACES = tuple(CharacterRace)
+_COMMON_CLASSES = (CharacterClass.VILLAGER, CharacterClass.MERCHANT,
+                   CharacterClass.GUARD, CharacterClass.WARRIOR)
+
+# Fixed stat bonuses by class and by race (stats not listed get +0)
+_CLASS_STAT_DELTAS = {
+    CharacterClass.WARRIOR: {"strength": 4, "constitution": 2},
+    CharacterClass.WIZARD: {"intelligence": 4, "wisdom": 2},
+    CharacterClass.ROGUE: {"dexterity": 4, "charisma": 2},
+    CharacterClass.CLERIC: {"wisdom": 4, "charisma": 2},
+    CharacterClass.MERCHANT: {"charisma": 4, "intelligence": 2},
+}
+_RACE_STAT_DELTAS = {
+    CharacterRace.DWARF: {"constitution": 2, "wisdom": 1},
+    CharacterRace.ELF: {"dexterity": 2, "intelligence": 1},
+    CharacterRace.HALFLING: {"dexterity": 2, "charisma": 1},
+}
+_NO_DELTAS: Dict[str, int] = {}
+_STAT_JITTER = (-1, 0, 1, 2)
+
+_CLASS_SYMBOLS = {
+    CharacterClass.WARRIOR: "W",
+    CharacterClass.WIZARD: "M",
+    CharacterClass.ROGUE: "R",
+    CharacterClass.CLERIC: "C",
+    CharacterClass.BARD: "B",
+    CharacterClass.MERCHANT: "T",
+    CharacterClass.VILLAGER: "V",
+    CharacterClass.GUARD: "G",
+    CharacterClass.MONSTER: "X",
+}
+
+_PERSONALITY_TRAITS = ("friendly", "curious", "cautious", "brave", "grumpy",
+                       "cheerful", "suspicious", "honest", "clever", "stubborn")
+_LIKES = ("gold", "food", "music", "stories", "weapons", "animals", "art")
+_DISLIKES = ("thieves", "loud noises", "rudeness", "danger", "dirt", "monsters")
+
+_GOAL_TEMPLATES = (
+    "Make a living selling goods",
+    "Protect the village from threats",
+    "Find a rare ingredient for a special recipe",
+    "Pay off debt to the local guild",
+    "Discover information about family history",
+    "Learn a new craft or skill",
+    "Find romance or companionship",
+    "Earn enough gold to retire comfortably",
+    "Avenge a past wrong",
+    "Escape a troubled past",
+)
+
+_DESCRIPTION_ADJECTIVES = {
+    CharacterClass.MERCHANT: ("shrewd", "friendly", "busy", "well-dressed"),
+    CharacterClass.WARRIOR: ("battle-worn", "muscular", "scarred", "confident"),
+    CharacterClass.WIZARD: ("mysterious", "elderly", "eccentric", "scholarly"),
+    CharacterClass.ROGUE: ("nimble", "shadowy", "quick-eyed", "charming"),
+    CharacterClass.CLERIC: ("devout", "serene", "helpful", "wise"),
+    CharacterClass.GUARD: ("vigilant", "stern", "dutiful", "alert"),
+    CharacterClass.VILLAGER: ("simple", "hardworking", "friendly", "modest"),
+}
+
+_BIRTHPLACES = ("small village", "bustling town", "quiet hamlet", "busy city")
+_CALLING_REASONS = ("I wanted to", "my family tradition",
+                    "I had a talent for it", "it was my only option")
+
 class NPCManager:
     """Manages all NPC characters in the game"""
 
     def __init__(self):
         self.npcs = {}  # Key: NPC ID, Value: NPC Character
+        # lowercased name -> {npc_id: None} in registration order. A cache,
+        # not the truth: a few systems pop/replace self.npcs directly, so
+        # every hit is verified and a miss falls back to a scan.
+        self._by_name: Dict[str, Dict[str, None]] = defaultdict(dict)
+        # class / home-location -> {npc_id: None} (dicts as ordered sets, so
+        # queries keep insertion order). Same cache discipline: members are
+        # re-checked on read; set_home_location / reindex keep them whole.
+        self._by_class: Dict[CharacterClass, Dict[str, None]] = defaultdict(dict)
+        self._by_location: Dict[str, Dict[str, None]] = defaultdict(dict)
+        # _name_table: lowercased name -> NPCs, and one regex over every
+        # name; add_npc / remove_npc / reindex drop it, and it is also
+        # rebuilt when self.npcs is replaced or changes size
+        self._mentions: Dict[str, List[Character]] = {}
+        self._mention_re = None
+        self._mention_key = None
         logger.info("NPC Manager initialized")
 
     def add_npc(self, npc: Character) -> None:
@@ -36,34 +139,145 @@ class NPCManager:
         except Exception:
             pass
         self.npcs[npc.id] = npc
+        self._index(npc)
+        self._mention_key = None
         logger.info(f"Added NPC: {npc.name} (ID: {npc.id}, faction: {getattr(npc, 'faction', '?')})")
 
+    def _index(self, npc: Character) -> None:
+        self._by_name[npc.name.lower()][npc.id] = None
+        self._by_class[npc.character_class][npc.id] = None
+        if npc.home_location:
+            self._by_location[npc.home_location][npc.id] = None
+
+    def reindex(self) -> None:
+        """Rebuild the lookup indexes from `self.npcs` (after a bulk load
+        that filled the dict directly)."""
+        self._by_name.clear()
+        self._by_class.clear()
+        self._by_location.clear()
+        self._mention_key = None
+        for npc in self.npcs.values():
+            self._index(npc)
+
+    def set_home_location(self, npc: Character, location_name: str) -> None:
+        """Re-home an NPC, keeping the by-location index current."""
+        old = npc.home_location
+        if old in self._by_location:
+            self._by_location[old].pop(npc.id, None)
+        npc.home_location = location_name
+        if location_name and npc.id in self.npcs:
+            self._by_location[location_name][npc.id] = None
+
     def get_npc(self, npc_id: str) -> Optional[Character]:
         """Get an NPC by ID"""
         return self.npcs.get(npc_id)
 
     def get_npc_by_name(self, name: str) -> Optional[Character]:
         """Get an NPC by name (returns first match)"""
-        for npc in self.npcs.values():
-            if npc.name.lower() == name.lower():
-                return npc
-        return None
+        named = self.get_npcs_by_name(name)
+        return named[0] if named else None
+
+    def get_npcs_by_name(self, name: str) -> List[Character]:
+        """Every NPC called `name` (case-insensitive), in registration
+        order — names can collide (two Wandering Trolls)."""
+        key = name.lower()
+        npcs = self.npcs
+        named = [npc for nid in self._by_name.get(key, ())
+                 if (npc := npcs.get(nid)) is not None
+                 and npc.name.lower() == key]
+        if named:
+            return named
+        # stale/missing bucket: rescan, and heal it for next time
+        named = [npc for npc in npcs.values() if npc.name.lower() == key]
+        if named:
+            self._by_name[key] = dict.fromkeys(npc.id for npc in named)
+        else:
+            self._by_name.pop(key, None)
+        return named
+
+    def _name_table(self) -> Dict[str, List[Character]]:
+        """lowercased name -> NPCs of that name (registration order), with
+        the regex mentioned_in searches. Rebuilt after add_npc, remove_npc
+        or reindex, and when self.npcs is replaced or changes size (for the
+        systems that edit the dict directly); a name changed after add_npc
+        is not picked up until then, so every caller re-checks the name it
+        matched."""
+        npcs = self.npcs
+        key = (id(npcs), len(npcs))
+        if key != self._mention_key:
+            self._mentions = {}
+            for npc in npcs.values():
+                if npc.name:
+                    self._mentions.setdefault(npc.name.lower(), []).append(npc)
+            # longest first, so "Goren the Younger" wins over "Goren"
+            names = sorted(self._mentions, key=len, reverse=True)
+            self._mention_re = re.compile(
+                "|".join(map(re.escape, names))) if names else None
+            self._mention_key = key
+        return self._mentions
+
+    def mentioned_in(self, text: str) -> List[Character]:
+        """NPCs whose name occurs in lowercased `text`, in the order the
+        names are mentioned (same-named NPCs in registration order). One
+        regex search replaces a lower()-and-`in` test per NPC."""
+        table, npcs = self._name_table(), self.npcs
+        if self._mention_re is None:
+            return []
+        return [npc for m in self._mention_re.finditer(text)
+                for npc in table[m.group()]
+                if npcs.get(npc.id) is npc and npc.name.lower() == m.group()]
+
+    def named_like(self, text: str) -> List[Character]:
+        """NPCs whose name contains lowercased `text` or occurs in it — the
+        loose match behind find_character — tested once per distinct name
+        rather than lowering every NPC's name."""
+        npcs = self.npcs
+        return [npc for lname, group in self._name_table().items()
+                if lname in text or text in lname
+                for npc in group
+                if npcs.get(npc.id) is npc and npc.name.lower() == lname]
 
     def get_npcs_by_location(self, location_name: str) -> List[Character]:
         """Get all NPCs associated with a location"""
-        return [npc for npc in self.npcs.values()
-                if hasattr(npc, 'home_location') and npc.home_location == location_name]
+        npcs = self.npcs
+        return [npc for nid in self._by_location.get(location_name, ())
+                if (npc := npcs.get(nid)) is not None
+                and npc.home_location == location_name]
 
     def get_npcs_by_class(self, character_class: CharacterClass) -> List[Character]:
         """Get all NPCs of a specific class"""
-        return [npc for npc in self.npcs.values()
-                if npc.character_class == character_class]
+        npcs = self.npcs
+        return [npc for nid in self._by_class.get(character_class, ())
+                if (npc := npcs.get(nid)) is not None
+                and npc.character_class == character_class]
+
+    def npcs_within(self, center: Tuple[int, int],
+                    radius: float) -> List[Character]:
+        """NPCs standing within `radius` tiles (straight-line) of `center`,
+        in registration order. Positions are assigned directly all over the
+        engine, so this reads them live rather than keeping a cell index.
+        (A NumPy mask over live-read positions measured slower than this
+        loop from 50 to 5000 NPCs: gathering the array costs more than the
+        arithmetic it saves.)"""
+        cx, cy = center
+        r2 = radius * radius
+        near = []
+        for npc in self.npcs.values():
+            x, y = npc.position
+            dx, dy = x - cx, y - cy
+            if dx * dx + dy * dy <= r2:
+                near.append(npc)
+        return near
 
     def remove_npc(self, npc_id: str) -> bool:
         """Remove an NPC from the manager"""
         if npc_id in self.npcs:
             npc = self.npcs[npc_id]
             del self.npcs[npc_id]
+            self._by_name.get(npc.name.lower(), {}).pop(npc_id, None)
+            self._by_class.get(npc.character_class, {}).pop(npc_id, None)
+            self._by_location.get(npc.home_location, {}).pop(npc_id, None)
+            self._mention_key = None
             logger.info(f"Removed NPC: {npc.name} (ID: {npc_id})")
             return True
         # a benign no-op: two paths can retire the same dead thing (a predator
@@ -74,113 +288,44 @@ class NPCManager:
 
     def create_random_npc(self, location=None, char_class=None, race=None) -> Character:
         """Create a random NPC with optional constraints"""
-        # Generate a unique ID
-        npc_id = f"npc_{uuid.uuid4().hex[:8]}"
-
-        # Random name generation (simplified)
-        human_names = ["Aldric", "Bran", "Cedric", "Dorn", "Eadric", "Fendrel", "Gavin",
-                      "Hector", "Ivar", "Jorah", "Kade", "Leif", "Marek", "Nyles",
-                      "Oswald", "Phelan", "Quincy", "Rowan", "Silas", "Tristan",
-                      "Adela", "Brenna", "Cora", "Delia", "Eliza", "Faye", "Greta",
-                      "Hilda", "Ida", "Jenna", "Kira", "Lyra", "Mira", "Nora",
-                      "Ophelia", "Piper", "Quinn", "Rose", "Sylvia", "Thea"]
+        # Bind the RNG entry points once: ~15 draws below read locals, not
+        # module attributes
+        choice, sample, randint = random.choice, random.sample, random.randint
 
-        dwarf_names = ["Balin", "Dwalin", "Thorin", "Dain", "Gimli", "Gloin", "Durin",
-                      "Thrain", "Bombur", "Fili", "Kili", "Nori", "Ori", "Bifur",
-                      "Bofur", "Dori", "Darva", "Helga", "Sigrid", "Thyra", "Britta"]
-
-        elf_names = ["Legolas", "Elrond", "Thranduil", "Celeborn", "Haldir", "Aegnor",
-                    "Finrod", "Orophin", "Galadriel", "Arwen", "Celebrian", "Tauriel",
-                    "Luthien", "Nimrodel", "Elwing", "Maedhros", "Maglor", "Fingon"]
+        # Generate a unique ID (4 random bytes; uuid4() built a whole UUID
+        # object just to keep 8 of its hex digits)
+        npc_id = f"npc_{os.urandom(4).hex()}"
 
         # Select race if not provided
         if not race:
-            race = random.choice(list(CharacterRace))
+            race = choice(_RACES)
 
         # Select name based on race
-        if race == CharacterRace.DWARF:
-            name = random.choice(dwarf_names)
-        elif race == CharacterRace.ELF:
-            name = random.choice(elf_names)
-        else:
-            name = random.choice(human_names)
+        name = choice(_NAMES_BY_RACE.get(race, _HUMAN_NAMES))
 
         # Select class if not provided
         if not char_class:
-            common_classes = [CharacterClass.VILLAGER, CharacterClass.MERCHANT,
-                             CharacterClass.GUARD, CharacterClass.WARRIOR]
-            char_class = random.choice(common_classes)
-
-        # Generate stats based on class
-        base_stats = {
-            "strength": 10,
-            "dexterity": 10,
-            "constitution": 10,
-            "intelligence": 10,
-            "wisdom": 10,
-            "charisma": 10
-        }
+            char_class = choice(_COMMON_CLASSES)
 
-        # Adjust stats based on class
-        if char_class == CharacterClass.WARRIOR:
-            base_stats["strength"] += 4
-            base_stats["constitution"] += 2
-        elif char_class == CharacterClass.WIZARD:
-            base_stats["intelligence"] += 4
-            base_stats["wisdom"] += 2
-        elif char_class == CharacterClass.ROGUE:
-            base_stats["dexterity"] += 4
-            base_stats["charisma"] += 2
-        elif char_class == CharacterClass.CLERIC:
-            base_stats["wisdom"] += 4
-            base_stats["charisma"] += 2
-        elif char_class == CharacterClass.MERCHANT:
-            base_stats["charisma"] += 4
-            base_stats["intelligence"] += 2
-
-        # Adjust stats based on race
-        if race == CharacterRace.DWARF:
-            base_stats["constitution"] += 2
-            base_stats["wisdom"] += 1
-        elif race == CharacterRace.ELF:
-            base_stats["dexterity"] += 2
-            base_stats["intelligence"] += 1
-        elif race == CharacterRace.HALFLING:
-            base_stats["dexterity"] += 2
-            base_stats["charisma"] += 1
-
-        # Add some randomness
-        for stat in base_stats:
-            base_stats[stat] += random.randint(-1, 2)
+        # Base 10, plus the class and race bonuses, plus a -1..+2 jitter
+        class_deltas = _CLASS_STAT_DELTAS.get(char_class, _NO_DELTAS)
+        race_deltas = _RACE_STAT_DELTAS.get(race, _NO_DELTAS)
+        jitter = random.choices(_STAT_JITTER, k=len(STAT_NAMES))
+        base_stats = {stat: 10 + class_deltas.get(stat, 0)
+                      + race_deltas.get(stat, 0) + roll
+                      for stat, roll in zip(STAT_NAMES, jitter)}
 
         # Set symbol based on class
-        symbol_map = {
-            CharacterClass.WARRIOR: "W",
-            CharacterClass.WIZARD: "M",
-            CharacterClass.ROGUE: "R",
-            CharacterClass.CLERIC: "C",
-            CharacterClass.BARD: "B",
-            CharacterClass.MERCHANT: "T",
-            CharacterClass.VILLAGER: "V",
-            CharacterClass.GUARD: "G",
-            CharacterClass.MONSTER: "X"
-        }
-        symbol = symbol_map.get(char_class, "N")
+        symbol = _CLASS_SYMBOLS.get(char_class, "N")
 
         # Create the NPC
-        level = random.randint(1, 3)
+        level = randint(1, 3)
         max_hp = base_stats["constitution"] + (level * 4)
 
-        # Generate personality traits
-        personality_traits = ["friendly", "curious", "cautious", "brave", "grumpy",
-                             "cheerful", "suspicious", "honest", "clever", "stubborn"]
-        likes = ["gold", "food", "music", "stories", "weapons", "animals", "art"]
-        dislikes = ["thieves", "loud noises", "rudeness", "danger", "dirt", "monsters"]
-
         # Select random traits
-        selected_traits = random.sample(personality_traits, 3)
-        selected_likes = random.sample(likes, 2)
-        selected_dislikes = random.sample(dislikes, 2)
+        selected_traits = sample(_PERSONALITY_TRAITS, 3)
+        selected_likes = sample(_LIKES, 2)
+        selected_dislikes = sample(_DISLIKES, 2)
 
         personality = {
             "traits": selected_traits,
@@ -188,22 +333,8 @@ class NPCManager:
             "dislikes": selected_dislikes
         }
 
-        # Generate goals
-        goal_templates = [
-            "Make a living selling goods",
-            "Protect the village from threats",
-            "Find a rare ingredient for a special recipe",
-            "Pay off debt to the local guild",
-            "Discover information about family history",
-            "Learn a new craft or skill",
-            "Find romance or companionship",
-            "Earn enough gold to retire comfortably",
-            "Avenge a past wrong",
-            "Escape a troubled past"
-        ]
-
         # Select 1-3 goals
-        goals = random.sample(goal_templates, random.randint(1, 3))
+        goals = sample(_GOAL_TEMPLATES, randint(1, 3))
 
         # Create inventory based on class
         inventory = []
@@ -224,23 +355,14 @@ class NPCManager:
             inventory.append("personal items")
 
         # Add some money
-        gold = random.randint(5, 20) * level
-
-        # Create basic description
-        descriptions = {
-            CharacterClass.MERCHANT: f"A {random.choice(['shrewd', 'friendly', 'busy', 'well-dressed'])} merchant",
-            CharacterClass.WARRIOR: f"A {random.choice(['battle-worn', 'muscular', 'scarred', 'confident'])} warrior",
-            CharacterClass.WIZARD: f"A {random.choice(['mysterious', 'elderly', 'eccentric', 'scholarly'])} wizard",
-            CharacterClass.ROGUE: f"A {random.choice(['nimble', 'shadowy', 'quick-eyed', 'charming'])} rogue",
-            CharacterClass.CLERIC: f"A {random.choice(['devout', 'serene', 'helpful', 'wise'])} cleric",
-            CharacterClass.GUARD: f"A {random.choice(['vigilant', 'stern', 'dutiful', 'alert'])} guard",
-            CharacterClass.VILLAGER: f"A {random.choice(['simple', 'hardworking', 'friendly', 'modest'])} villager"
-        }
+        gold = randint(5, 20) * level
 
-        description = descriptions.get(
-            char_class,
-            f"A {race.value} {char_class.value}"
-        )
+        # Create basic description (only the chosen class rolls an adjective)
+        adjectives = _DESCRIPTION_ADJECTIVES.get(char_class)
+        if adjectives:
+            description = f"A {choice(adjectives)} {CLASS_VALUES[char_class]}"
+        else:
+            description = f"A {RACE_VALUES[race]} {CLASS_VALUES[char_class]}"
 
         # Create the NPC
         npc = Character(
@@ -270,8 +392,8 @@ class NPCManager:
             npc.home_location = location
 
         # Add initial memories
-        npc.add_memory(f"I was born in a {random.choice(['small village', 'bustling town', 'quiet hamlet', 'busy city'])}", 2)
-        npc.add_memory(f"I became a {char_class.value} because {random.choice(['I wanted to', 'my family tradition', 'I had a talent for it', 'it was my only option'])}", 2)
+        npc.add_memory(f"I was born in a {choice(_BIRTHPLACES)}", 2)
+        npc.add_memory(f"I became a {CLASS_VALUES[char_class]} because {choice(_CALLING_REASONS)}", 2)
 
         # Add the NPC to our manager
         self.add_npc(npc)
@@ -308,15 +430,14 @@ class NPCManager:
         # Determine position to place the revived NPC
         if position is None:
             # Use last position if available
-            if hasattr(npc, 'last_position'):
+            if npc.last_position is not None:
                 position = npc.last_position
             else:
                 # Use home location if available
-                if hasattr(npc, 'home_location'):
-                    for location in self.world.locations:
-                        if location.name == npc.home_location:
-                            position = location.center()
-                            break
+                if npc.home_location:
+                    home = self.world.get_location_by_name(npc.home_location)
+                    if home is not None:
+                        position = home.center()
 
                 # If still no position, use a default
                 if position is None:
@@ -8,6 +8,8 @@ DEFAULT_MODEL = "llama3"
 DEFAULT_PROVIDER = "heuristic"  # heuristic | ollama | anthropic | openai
 DEFAULT_TEMPERATURE = 0.7
 DEFAULT_MAX_TOKENS = 1000
+NPC_ACTION_CACHE_SIZE = 256  # LRU of NPC actions keyed on an unchanged prompt
+NPC_ACTION_BATCH_SIZE = 8  # Granted LLM actions per batch; a full one flushes mid-scan
 
 # Save/Load
 SAVE_DIRECTORY = "saves"
@@ -6,19 +6,15 @@ to combat, economy, social, movement, interaction, rest, work handlers.
 
 import logging
 import random
+import re
 from typing import Dict, Optional, Tuple, List
 
-logger = logging.getLogger("llm_rpg.action_router")
+from characters.character import item_name as name_of
+from engine.directions import first_direction, mentions_player, step_toward
+from engine.squad_tactics import straight_step
 
+logger = logging.getLogger("llm_rpg.action_router")
 
-_DIRECTIONS = {
-    "north": (0, -1), "south": (0, 1), "east": (1, 0), "west": (-1, 0),
-    "northeast": (1, -1), "northwest": (-1, -1),
-    "southeast": (1, 1), "southwest": (-1, 1),
-    "up": (0, -1), "down": (0, 1), "right": (1, 0), "left": (-1, 0),
-    "forward": (0, -1), "backward": (0, 1),
-    "forwards": (0, -1), "backwards": (0, 1),
-}
 
 # When a scheduled NPC has arrived at its location it ambles around it (mills
 # about) rather than freezing, so idle towns keep moving (George). Bounded so it
@@ -28,12 +24,55 @@ LOITER_PAUSE_CHANCE = 0.15
 _LOITER_DIRS = [(1, 0), (-1, 0), (0, 1), (0, -1),
                 (1, 1), (-1, -1), (1, -1), (-1, 1)]
 
+# Action verbs by handler, for ActionRouter's dispatch table
+_MOVE_VERBS = frozenset("move walk run approach go patrol".split())
+_ATTACK_VERBS = frozenset("attack fight strike slash stab shoot cast".split())
+_TRADE_VERBS = frozenset("buy sell trade offer pay gift give".split())
+_INTERACT_VERBS = frozenset("open close examine search take drop use activate "
+                            "deactivate pick".split())
+_SOCIAL_VERBS = frozenset("talk greet threaten compliment insult befriend "
+                          "persuade".split())
+_REST_VERBS = frozenset("wait rest sleep sit stand".split())
+_WORK_VERBS = frozenset("craft forge brew cook build repair work".split())
+
+# Social verb -> (npc's change toward them, theirs toward npc, event line)
+_SOCIAL_MOODS = {
+    "befriend": (10, 5, "{npc} makes a friendly gesture toward {char}."),
+    "threaten": (-5, -15, "{npc} threatens {char}!"),
+    "compliment": (5, 5, "{npc} compliments {char}."),
+    "insult": (-10, -10, "{npc} insults {char}!"),
+}
+
+# Keyword in a forge target -> the item it produces
+_FORGE_TARGETS = {"sword": "sword", "blade": "sword", "weapon": "dagger",
+                  "armor": "leather", "shield": "shield", "dagger": "dagger"}
+
+# Place words in move targets -> the location "type" they resolve to
+_PLACE_KEYWORDS = (("tavern", "tavern"), ("shop", "shop"), ("store", "shop"),
+                   ("forge", "forge"), ("smith", "forge"),
+                   ("temple", "temple"), ("chapel", "temple"),
+                   ("shrine", "temple"), ("inn", "tavern"))
+_PLACE_WORD = re.compile("|".join(k for k, _ in _PLACE_KEYWORDS))
+
 
 class ActionRouter:
     """Route LLM-decided actions to the right handler."""
 
     def __init__(self, engine):
         self.engine = engine
+        # verb -> handler(npc, target, action, action_data). The lambdas look
+        # handlers and systems up per call, so swapped-in systems still route
+        e = engine
+        self._dispatch = {"howl": lambda n, t, a, d: self._handle_howl(n)}
+        for verbs, fn in (
+                (_MOVE_VERBS, lambda n, t, a, d: self._handle_move(n, t, d.get("activity", ""))),
+                (_ATTACK_VERBS, lambda n, t, a, d: e.combat_system.npc_attack(n, t, a)),
+                (_TRADE_VERBS, lambda n, t, a, d: e.economy_system.handle(n, t, a)),
+                (_INTERACT_VERBS, lambda n, t, a, d: self._handle_interact(n, t, a)),
+                (_SOCIAL_VERBS, lambda n, t, a, d: self._handle_social(n, t, a)),
+                (_REST_VERBS, lambda n, t, a, d: self._handle_rest(n, t, a)),
+                (_WORK_VERBS, lambda n, t, a, d: self._handle_work(n, t, a))):
+            self._dispatch.update(dict.fromkeys(verbs, fn))
 
     def process(self, npc, action_data: Dict[str, str]) -> bool:
         # Skip the turn if paralyzed/stunned
@@ -77,25 +116,10 @@ class ActionRouter:
             self.engine.memory_manager.add_event(f"{npc.name} says: \"{dialog}\"")
             npc.add_memory(f"I said: \"{dialog}\"", 1)
 
-        # Action dispatch
-        if action in ("move", "walk", "run", "approach", "go", "patrol"):
-            return self._handle_move(npc, target, action_data.get("activity", ""))
-        if action in ("attack", "fight", "strike", "slash", "stab", "shoot", "cast"):
-            return self.engine.combat_system.npc_attack(npc, target, action)
-        if action in ("buy", "sell", "trade", "offer", "pay", "gift", "give"):
-            return self.engine.economy_system.handle(npc, target, action)
-        if action in ("open", "close", "examine", "search", "take",
-                      "drop", "use", "activate", "deactivate", "pick"):
-            return self._handle_interact(npc, target, action)
-        if action in ("talk", "greet", "threaten", "compliment", "insult",
-                      "befriend", "persuade"):
-            return self._handle_social(npc, target, action)
-        if action in ("wait", "rest", "sleep", "sit", "stand"):
-            return self._handle_rest(npc, target, action)
-        if action in ("craft", "forge", "brew", "cook", "build", "repair", "work"):
-            return self._handle_work(npc, target, action)
-        if action == "howl":
-            return self._handle_howl(npc)
+        # Action dispatch: one dict lookup per NPC, not a chain of set tests
+        handler = self._dispatch.get(action)
+        if handler is not None:
+            return handler(npc, target, action, action_data)
 
         # Default — log as flavor
         self.engine.memory_manager.add_event(f"{npc.name} {action} {target}.")
@@ -133,7 +157,7 @@ class ActionRouter:
         text = (target or "").lower()
         # An arrived NPC PERFORMS its scheduled activity (A1: a smith hammers, a
         # cleric prays) or, for a non-work activity, MILLS ABOUT its spot.
-        if not any(w in text for w in _DIRECTIONS):
+        if first_direction(text) is None:
             loc = self._resolve_location_target(npc, text)
             if loc is not None:
                 d2 = (loc[0] - npc.position[0]) ** 2 + \
@@ -220,24 +244,21 @@ class ActionRouter:
 
     def _interpret_direction(self, npc, target: str) -> Tuple[int, int]:
         text = (target or "").lower()
-        for word, vec in _DIRECTIONS.items():
-            if word in text:
-                return vec
+        vec = first_direction(text)
+        if vec is not None:
+            return vec
 
         # Target is the player?
-        player_terms = ("player", "adventurer", "traveler", "stranger", "newcomer")
         target_pos = None
-        if any(t in text for t in player_terms):
+        if mentions_player(text):
             target_pos = self.engine.player.position
 
         # Target is an NPC by name?
         if target_pos is None:
-            for other in self.engine.npc_manager.npcs.values():
-                if other.id == npc.id:
-                    continue
-                if other.name.lower() in text:
-                    target_pos = other.position
-                    break
+            other = next((o for o in self.engine.npc_manager.mentioned_in(text)
+                          if o.id != npc.id), None)
+            if other is not None:
+                target_pos = other.position
 
         # Target is a location? Try by direct name first, then by keyword.
         if target_pos is None:
@@ -246,21 +267,8 @@ class ActionRouter:
         if target_pos is None:
             return (0, 0)
 
-        # If already at the target, don't move
-        if target_pos == npc.position:
-            return (0, 0)
-
-        dx = target_pos[0] - npc.position[0]
-        dy = target_pos[1] - npc.position[1]
-        dx = (dx > 0) - (dx < 0)
-        dy = (dy > 0) - (dy < 0)
-        if dx and dy:
-            if abs(target_pos[0] - npc.position[0]) > \
-                    abs(target_pos[1] - npc.position[1]):
-                dy = 0
-            else:
-                dx = 0
-        return (dx, dy)
+        # One unit step along the dominant axis; (0, 0) once there
+        return step_toward(npc.position, target_pos)
 
     # --------------- social ------------------------------------------
 
@@ -275,43 +283,30 @@ class ActionRouter:
         if action in ("talk", "greet"):
             self.engine.memory_manager.add_event(f"{npc.name} greets {char.name}.")
             return True
-        if action == "befriend":
-            npc.modify_relationship(char.id, 10)
-            char.modify_relationship(npc.id, 5)
-            self.engine.memory_manager.add_event(
-                f"{npc.name} makes a friendly gesture toward {char.name}.")
-            return True
-        if action == "threaten":
-            npc.modify_relationship(char.id, -5)
-            char.modify_relationship(npc.id, -15)
-            self.engine.memory_manager.add_event(f"{npc.name} threatens {char.name}!")
-            if char.get_relationship(npc.id) < -50 and random.random() < 0.5:
-                self.engine.combat_system.npc_attack(char, npc.name)
-            return True
-        if action == "compliment":
-            npc.modify_relationship(char.id, 5)
-            char.modify_relationship(npc.id, 5)
-            self.engine.memory_manager.add_event(
-                f"{npc.name} compliments {char.name}.")
-            return True
-        if action == "insult":
-            npc.modify_relationship(char.id, -10)
-            char.modify_relationship(npc.id, -10)
-            self.engine.memory_manager.add_event(
-                f"{npc.name} insults {char.name}!")
-            return True
-        return False
+        mood = _SOCIAL_MOODS.get(action)
+        if mood is None:
+            return False
+        mine, theirs, line = mood
+        npc.modify_relationship(char.id, mine)
+        char.modify_relationship(npc.id, theirs)
+        self.engine.memory_manager.add_event(
+            line.format(npc=npc.name, char=char.name))
+        if action == "threaten" and char.get_relationship(npc.id) < -50 \
+                and random.random() < 0.5:
+            self.engine.combat_system.npc_attack(char, npc.name)
+        return True
 
     # --------------- interaction -------------------------------------
 
     def _handle_interact(self, npc, target: str, action: str) -> bool:
         nx, ny = npc.position
         ground = self.engine.world.get_items_at(nx, ny)
+        tgt = target.lower()
 
         if action in ("take", "pick"):
             for item in list(ground):
-                item_name = item.name if hasattr(item, "name") else str(item)
-                if target.lower() in item_name.lower() or target.lower() == "item":
+                item_name = name_of(item)
+                if tgt in item_name.lower() or tgt == "item":
                     npc.add_item(item)
                     self.engine.world.remove_item_from_ground(item, nx, ny)
                     self.engine.memory_manager.add_event(
@@ -320,10 +315,10 @@ class ActionRouter:
             return False
 
         if action == "drop":
-            for item in list(npc.inventory):
-                item_name = item.name if hasattr(item, "name") else str(item)
-                if target.lower() in item_name.lower():
-                    npc.inventory.remove(item)
+            for i, item in enumerate(npc.inventory):
+                item_name = name_of(item)
+                if tgt in item_name.lower():
+                    del npc.inventory[i]
                     self.engine.world.add_item_to_ground(item, nx, ny)
                     self.engine.memory_manager.add_event(
                         f"{npc.name} drops {item_name}.")
@@ -331,13 +326,13 @@ class ActionRouter:
             return False
 
         if action == "use":
-            for item in list(npc.inventory):
-                item_name = item.name if hasattr(item, "name") else str(item)
-                if target.lower() in item_name.lower():
+            for i, item in enumerate(npc.inventory):
+                item_name = name_of(item)
+                if tgt in item_name.lower():
                     heal = getattr(item, "heal_amount", 0)
                     if heal and npc.hp < npc.max_hp:
                         npc.heal(heal)
-                        npc.inventory.remove(item)
+                        del npc.inventory[i]
                         self.engine.memory_manager.add_event(
                             f"{npc.name} uses {item_name} (+{heal} HP).")
                     else:
@@ -395,12 +390,9 @@ class ActionRouter:
         forge = action in ("forge", "craft", "smith") or prof in ("smith",
                                                                    "carpenter")
         if forge:
-            forge_targets = {
-                "sword": "sword", "blade": "sword", "weapon": "dagger",
-                "armor": "leather", "shield": "shield", "dagger": "dagger",
-            }
-            for keyword, item_id in forge_targets.items():
-                if keyword in (target or "").lower():
+            wanted = (target or "").lower()
+            for keyword, item_id in _FORGE_TARGETS.items():
+                if keyword in wanted:
                     item = create_item(item_id)
                     if item:
                         npc.add_item(item)
@@ -417,24 +409,14 @@ class ActionRouter:
         if not text:
             return None
         # Direct name match (exact or substring)
-        for loc in self.engine.world.locations:
-            if loc.name.lower() == text or loc.name.lower() in text or \
-                    text in loc.name.lower():
+        named = self.engine.world.lowered_names()
+        for lname, loc in named:
+            if lname in text or text in lname:
                 return loc.center()
 
-        # Generic keywords -> by location type
-        keyword_to_property = {
-            "tavern": "tavern",
-            "shop": "shop",
-            "store": "shop",
-            "forge": "forge",
-            "smith": "forge",
-            "temple": "temple",
-            "chapel": "temple",
-            "shrine": "temple",
-            "inn": "tavern",
-        }
-        for keyword, prop in keyword_to_property.items():
+        # Generic keywords -> by location type (one regex skips the table
+        # for the usual targets that name no place at all)
+        for keyword, prop in _PLACE_KEYWORDS if _PLACE_WORD.search(text) else ():
             if keyword in text:
                 # Prefer one matching the NPC's home_location if set
                 home_name = getattr(npc, "home_location", "")
@@ -448,7 +430,7 @@ class ActionRouter:
                     if loc.get_property("type", "") == prop]
                 if candidates:
                     nearest = min(candidates,
-                                  key=lambda l: self._dist_to(npc, l.center()))
+                                  key=lambda l: self._dist2_to(npc, l.center()))
                     return nearest.center()
 
         # "home" -> the NPC's home_location
@@ -461,39 +443,30 @@ class ActionRouter:
 
         # "village" -> nearest village center
         if "village" in text or "town" in text or "hamlet" in text:
-            for loc in self.engine.world.locations:
-                lname = loc.name.lower()
+            for lname, loc in named:
                 if "village" in lname or "hamlet" in lname:
                     return loc.center()
         return None
 
-    def _dist_to(self, npc, pos) -> float:
+    def _dist2_to(self, npc, pos) -> float:
+        """Squared distance — ranks the same as the true one, sans sqrt."""
         return ((npc.position[0] - pos[0]) ** 2 +
-                (npc.position[1] - pos[1]) ** 2) ** 0.5
+                (npc.position[1] - pos[1]) ** 2)
 
     def _adjacent(self, a, b) -> bool:
         return ((a.position[0] - b.position[0]) ** 2 +
-                (a.position[1] - b.position[1]) ** 2) ** 0.5 <= 1.5
+                (a.position[1] - b.position[1]) ** 2) <= 2.25   # 1.5 tiles
 
     def _step_toward(self, mover, target) -> bool:
-        dx = target.position[0] - mover.position[0]
-        dy = target.position[1] - mover.position[1]
-        dx = (dx > 0) - (dx < 0)
-        dy = (dy > 0) - (dy < 0)
-        if dx and dy:
-            if abs(target.position[0] - mover.position[0]) > \
-                    abs(target.position[1] - mover.position[1]):
-                dy = 0
-            else:
-                dx = 0
-        nx, ny = mover.position[0] + dx, mover.position[1] + dy
-        return self.engine.world.map.move_character(mover, nx, ny)
+        return straight_step(self.engine.world.map, mover, target.position)
 
     def _update_goals(self, npc, goal_update: str) -> None:
         # Replace existing goal that overlaps, else append
+        update = goal_update.lower()
         for i, goal in enumerate(npc.goals):
-            if goal.lower() in goal_update.lower() or \
-                    goal_update.lower() in goal.lower():
+            goal = goal.lower()
+            if goal in update or update in goal:
                 npc.goals[i] = goal_update
-                return
-        npc.goals.append(goal_update)
+                break
+        else:
+            npc.goals.append(goal_update)
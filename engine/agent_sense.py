@@ -23,7 +23,7 @@ def _colocated(zone_name, npc) -> bool:
 def _healing_item(char):
     """A drinkable in the bag that mends wounds (id-matched — the heal
     payload isn't on `use_effect`)."""
-    for it in getattr(char, "inventory", []):
+    for it in char.inventory:
         try:
             if not it.is_consumable():
                 continue
@@ -57,7 +57,7 @@ def _can_shoot(char) -> bool:
             return True
         return any(isinstance(it, Item) and it.is_ammo()
                    and it.ammo_type == ammo and it.quantity > 0
-                   for it in getattr(char, "inventory", []))
+                   for it in char.inventory)
     except Exception:
         return False
 
@@ -92,8 +92,8 @@ def _attack_spell(char, dist, target=None, foes=None):
         if area > 0 and target is not None and foes:
             tx, ty = target.position
             hit = sum(1 for f, _ in foes
-                      if ((f.position[0] - tx) ** 2
-                          + (f.position[1] - ty) ** 2) ** 0.5 <= area)
+                      if (f.position[0] - tx) ** 2
+                      + (f.position[1] - ty) ** 2 <= area * area)
             eff *= max(1, min(hit, 4))
         cand.append((sp, eff))
     if not cand:
@@ -119,7 +119,7 @@ def _surplus_items(char):
     except Exception:
         worn = set()
     out = []
-    for it in getattr(char, "inventory", []):
+    for it in char.inventory:
         if id(it) in worn:
             continue
         iid = (getattr(it, "id", "") or "").lower()
@@ -172,7 +172,7 @@ def _learn_item(char):
     whose worth is timing-sensitive.) Returns the item, or None — so a
     learn-it-forever item doesn't just rot in the pack."""
     known = set((getattr(char, "metadata", {}) or {}).get("spells_known", []))
-    for it in getattr(char, "inventory", []):
+    for it in char.inventory:
         eff = getattr(it, "use_effect", None) or {}
         if "permanent_stat" in eff:
             return it
@@ -235,7 +235,7 @@ def _provisioned(char, need: int = 8) -> bool:
     hungry doze). Gating rest on this is what keeps a wounded hero from
     sleeping the same fruitless night over and over (M.8a)."""
     total = 0
-    for it in getattr(char, "inventory", []):
+    for it in char.inventory:
         eff = getattr(it, "use_effect", None) or {}
         heal = getattr(it, "heal_amount", 0)
         if eff.get("food") and heal > 0:
@@ -272,7 +272,7 @@ def _tired(char) -> bool:
 def _drink_item(char):
     """A carried drink that slakes thirst (a P12.3 drink carries a `thirst`
     payload on `use_effect`)."""
-    for it in getattr(char, "inventory", []):
+    for it in char.inventory:
         eff = getattr(it, "use_effect", None) or {}
         if isinstance(eff, dict) and eff.get("thirst"):
             return it
@@ -282,7 +282,7 @@ def _drink_item(char):
 def _food_item(char):
     """A carried edible that quiets hunger (P12.5 food — `use_effect.food`
     with a heal payload)."""
-    for it in getattr(char, "inventory", []):
+    for it in char.inventory:
         eff = getattr(it, "use_effect", None) or {}
         if isinstance(eff, dict) and eff.get("food") \
                 and getattr(it, "heal_amount", 0) > 0:
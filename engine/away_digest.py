@@ -17,7 +17,7 @@ def snapshot(engine, character) -> None:
     """Stamp the away-start state so a later digest can show the deltas."""
     try:
         character.metadata["away_snapshot"] = {
-            "mem_len": len(engine.memory_manager.game_history),
+            "mem_len": _log_mark(engine),
             "day": engine.world.time // (24 * 60),
             "level": getattr(character, "level", 1),
             "gold": getattr(character, "gold", 0),
@@ -27,9 +27,17 @@ def snapshot(engine, character) -> None:
         pass
 
 
+def _log_mark(engine) -> int:
+    hist = engine.memory_manager.game_history
+    return getattr(hist, "appended", len(hist))
+
+
 def _log_slice(engine, start: int) -> List[str]:
+    # The log is bounded: shift the mark by whatever has fallen off since
+    hist = engine.memory_manager.game_history
+    start = max(0, start - (_log_mark(engine) - len(hist)))
     out = []
-    for e in engine.memory_manager.game_history[start:]:
+    for e in hist[start:]:
         out.append(e.get("event", "") if isinstance(e, dict) else str(e))
     return out
 
@@ -49,8 +49,8 @@ def boss_tick(engine, boss) -> bool:
     # aim afresh at the player if in range and in sight
     px, py = engine.player.position
     gx, gy = boss.position
-    dist = ((gx - px) ** 2 + (gy - py) ** 2) ** 0.5
-    if dist <= tele.get("range", 8) and engine.active_zone() is None:
+    reach = tele.get("range", 8)
+    if (gx - px) ** 2 + (gy - py) ** 2 <= reach * reach and engine.active_zone() is None:
         try:
             from world.fov import overworld_los
             if not overworld_los(engine, (gx, gy), (px, py)):
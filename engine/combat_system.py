@@ -9,12 +9,25 @@ from typing import Any, Optional, Tuple
 
 logger = logging.getLogger("llm_rpg.combat")
 
+# Squared reach of an NPC attack by action verb; everything else is melee
+# (adjacent, diagonals included: 1.5 tiles)
+_REACH2 = {"shoot": 5.0 ** 2, "cast": 5.0 ** 2}
+_MELEE_REACH2 = 1.5 ** 2
+# Attack ability and log verb by action verb; everything else swings
+# with strength
+_ATTACK_STYLE = {"cast": ("intelligence", "casts a spell at"),
+                 "shoot": ("dexterity", "shoots at")}
+_MELEE_STYLE = ("strength", "attacks")
+
 
 class CombatSystem:
     """Resolves combat between any two characters."""
 
     def __init__(self, engine):
         self.engine = engine
+        # Any object with randint/random will do (tests swap in fixed
+        # rolls). An attack draws only a few numbers; a numpy-buffered
+        # stream measured no faster than random.random() per float
         self.rng = random.Random()
 
     # --------------------------------------------------------- player attack
@@ -54,10 +67,9 @@ class CombatSystem:
 
         ax, ay = attacker.position
         tx, ty = target.position
-        dist = ((ax - tx) ** 2 + (ay - ty) ** 2) ** 0.5
+        dist2 = (ax - tx) ** 2 + (ay - ty) ** 2
 
-        attack_range = 5.0 if action_type in ("shoot", "cast") else 1.5
-        if dist > attack_range:
+        if dist2 > _REACH2.get(action_type, _MELEE_REACH2):
             # Move toward
             return self._step_toward(attacker, target)
 
@@ -142,19 +154,12 @@ class CombatSystem:
                     pass
 
         # Determine ability + verb by action type
+        atk_ability, verb = _ATTACK_STYLE.get(action_type, _MELEE_STYLE)
         if action_type == "cast":
-            atk_ability = "intelligence"
-            verb = "casts a spell at"
             try:   # a spell casts a CASTING gesture, not a melee swing (P34.11)
                 attacker.metadata["_emote"] = "cast"
             except Exception:
                 pass
-        elif action_type in ("shoot",):
-            atk_ability = "dexterity"
-            verb = "shoots at"
-        else:
-            atk_ability = "strength"
-            verb = "attacks"
 
         atk_mod = effective_ability_mod(attacker, atk_ability)
         prof = proficiency_bonus(attacker)
@@ -317,12 +322,12 @@ class CombatSystem:
 
     def _handle_defeat(self, attacker, defender, damage: int) -> str:
         # The player's defeat is a story beat, not always a game over
-        if defender.id == self.engine.player.id:
+        if defender is self.engine.player:
             return self._handle_player_defeat(attacker, damage)
 
         # An elite you strike down may escape as a nemesis instead (P19.6)
         # — before the person/monster split, so it works for either.
-        if attacker.id == self.engine.player.id:
+        if attacker is self.engine.player:
             try:
                 escape = self.engine.nemesis.intercept_death(defender)
                 if escape is not None:
@@ -363,7 +368,7 @@ class CombatSystem:
             if self.engine.quest_manager:
                 self.engine.quest_manager.on_npc_defeated(
                     defender.id, kls)
-            if attacker.id == self.engine.player.id:
+            if attacker is self.engine.player:
                 self._award_xp(defender)
                 self._update_faction_rep(kls)
                 try:
@@ -380,8 +385,8 @@ class CombatSystem:
             f"{attacker.name} attacks {defender.name} for {damage} damage. "
             f"{defender.name} is defeated!"
         )
-        seen = (attacker.id == self.engine.player.id or
-                defender.id == self.engine.player.id)
+        seen = (attacker is self.engine.player or
+                defender is self.engine.player)
         if not seen:
             try:   # only report a defeat the player could see (P15.11)
                 from engine.discovery import can_witness
@@ -425,7 +430,7 @@ class CombatSystem:
         except Exception:
             pass
         # XP + faction rep changes for player kills
-        if attacker.id == self.engine.player.id:
+        if attacker is self.engine.player:
             self._award_xp(defender)
             self._update_faction_rep(kls)
             try:   # felling a wild beast trains Hunting (P15.9b)
@@ -558,7 +563,7 @@ class CombatSystem:
         # Fallback: best weapon in inventory (unarmed strikes deal 1)
         from items.item import Item
         best = 0
-        for it in getattr(char, "inventory", []):
+        for it in char.inventory:
             if isinstance(it, Item) and it.is_weapon() and it.damage > best:
                 best = it.damage
         if best == 0:
@@ -578,7 +583,7 @@ class CombatSystem:
             pass
         from items.item import Item
         total = 0
-        for it in getattr(char, "inventory", []):
+        for it in char.inventory:
             if isinstance(it, Item) and it.is_armor():
                 total += it.armor
         return total
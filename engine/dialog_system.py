@@ -250,7 +250,7 @@ class DialogSystem:
         try:
             pm.send_command(npc_id, "get_dialog",
                             {"message": message, "recent_history": recent})
-            resp = pm.get_response(npc_id, timeout=3.0)
+            resp = pm.get_response(npc_id, timeout=3.0, kind="dialog")
             if resp and resp.get("type") == "dialog":
                 return resp["response"]
         except Exception as e:
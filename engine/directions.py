@@ -0,0 +1,47 @@
+"""Direction and player words in NPC move targets.
+
+The action router reads free text from the LLM/heuristic ("walk north",
+"approach the stranger"). Directions are a plain scan of the table in
+order; the player words are compiled once at import into a single
+alternation search. `step_toward` is the matching one-tile approach step.
+"""
+
+import re
+from typing import Optional, Tuple
+
+DIRECTIONS = {
+    "north": (0, -1), "south": (0, 1), "east": (1, 0), "west": (-1, 0),
+    "northeast": (1, -1), "northwest": (-1, -1),
+    "southeast": (1, 1), "southwest": (-1, 1),
+    "up": (0, -1), "down": (0, 1), "right": (1, 0), "left": (-1, 0),
+    "forward": (0, -1), "backward": (0, 1),
+    "forwards": (0, -1), "backwards": (0, 1),
+}
+PLAYER_TERMS = ("player", "adventurer", "traveler", "stranger", "newcomer")
+
+
+_PLAYER_SEARCH = re.compile("|".join(map(re.escape, PLAYER_TERMS)))
+
+
+def first_direction(text: str) -> Optional[Tuple[int, int]]:
+    """Step vector of the first DIRECTIONS word (table order) found in the
+    lower-cased `text`, or None. Note "north" outranks "northeast"."""
+    for word, vec in DIRECTIONS.items():
+        if word in text:
+            return vec
+    return None
+
+
+def step_toward(frm, to) -> Tuple[int, int]:
+    """One unit step from `frm` toward `to` along the dominant axis (ties go
+    vertical; (0, 0) when already there). Signs are `(d > 0) - (d < 0)`."""
+    dx = to[0] - frm[0]
+    dy = to[1] - frm[1]
+    if abs(dx) > abs(dy):
+        return ((dx > 0) - (dx < 0), 0)
+    return (0, (dy > 0) - (dy < 0))
+
+
+def mentions_player(text: str) -> bool:
+    """Does the lower-cased `text` refer loosely to the hero?"""
+    return _PLAYER_SEARCH.search(text) is not None
@@ -176,9 +176,7 @@ def install_module(engine, module: dict) -> Tuple[bool, str]:
         bname = building["name"]
 
         def _unbuild(name=bname):
-            engine.world.locations[:] = [
-                loc for loc in engine.world.locations
-                if loc.name != name]
+            engine.world.remove_location(name)
         undo.append(_unbuild)
     for spawn in module.get("spawns", []):
         ok, note = dm.spawn_npc(spawn["template_id"],
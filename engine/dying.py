@@ -165,12 +165,12 @@ def ko_person(engine, attacker, npc) -> str:
     msg = (f"{attacker.name} beats {npc.name} senseless — they crumple "
            f"where they stand.")
     from engine.presence import in_earshot
-    if attacker.id == engine.player.id or \
+    if attacker is engine.player or \
             in_earshot(engine, npc.position):
         engine.memory_manager.add_event(msg)
     try:   # assaulting citizens feeds the ledger (P12.9)
         klass = getattr(npc.character_class, "value", "")
-        if attacker.id == engine.player.id and klass != "brigand":
+        if attacker is engine.player and klass != "brigand":
             engine.law.add_bounty(
                 20, reason=f"{npc.name} was assaulted")
     except Exception:
@@ -178,12 +178,19 @@ def ko_person(engine, attacker, npc) -> str:
     return msg
 
 
+def ko_body_owner(engine, marker: str):
+    """The knocked-out NPC a "<name>'s body" ground marker stands for, or
+    None. Goes through the NPC manager's name index rather than scanning
+    every NPC; names can collide, so the first one actually out cold wins."""
+    name = marker[:-7] if marker.endswith("'s body") else marker
+    return next((n for n in engine.npc_manager.get_npcs_by_name(name)
+                 if n.name == name and not n.is_active()
+                 and n.metadata.get("ko_until")), None)
+
+
 def rob_body(engine, marker: str, x: int, y: int) -> Optional[str]:
     """E on a KO'd person's body: take their purse. They'll know."""
-    name = marker[:-7] if marker.endswith("'s body") else marker
-    npc = next((n for n in engine.npc_manager.npcs.values()
-                if n.name == name and not n.is_active()
-                and n.metadata.get("ko_until")), None)
+    npc = ko_body_owner(engine, marker)
     if npc is None or npc.gold <= 0:
         return None
     taken = npc.gold
@@ -196,10 +203,10 @@ def rob_body(engine, marker: str, x: int, y: int) -> Optional[str]:
                       f"while I lay senseless.", 8, engine.world.time)
     except Exception:
         pass
-    msg = f"You go through {name}'s pockets: {taken}g. They'll remember."
+    msg = f"You go through {npc.name}'s pockets: {taken}g. They'll remember."
     engine.memory_manager.add_event(msg)
     try:   # robbery feeds the ledger (P12.9)
-        engine.law.add_bounty(15, reason=f"{name} was robbed")
+        engine.law.add_bounty(15, reason=f"{npc.name} was robbed")
     except Exception:
         pass
     return msg
@@ -223,7 +230,7 @@ def wake_the_fallen(engine) -> int:
         npc.metadata.pop("ko_until", None)
         npc.status = "alive"
         npc.hp = max(1, npc.max_hp // 3)
-        pos = getattr(npc, "last_position", npc.position)
+        pos = getattr(npc, "last_position", None) or npc.position
         if engine.world.map.get_character_at(*pos) is None:
             npc.position = pos
             engine.world.map.place_character(npc, *pos)
@@ -4,8 +4,18 @@ import logging
 import re
 from typing import Any, Optional
 
+from characters.character import item_name as name_of
+from engine.squad_tactics import straight_step
+
 logger = logging.getLogger("llm_rpg.economy")
 
+# the first number in a gift ("give 5 gold to Mira"), if any
+_NUM_RE = re.compile(r"\d+")
+# "<item> from|to|with <partner>": one match; the alternation order keeps
+# "from" ahead of "to" ahead of "with", each split at its first occurrence
+_TRADE_RE = re.compile(r"(.*?) from (.*)|(.*?) to (.*)|(.*?) with (.*)",
+                       re.DOTALL)
+
 
 class EconomySystem:
     """Handle buy/sell/trade/give between characters."""
@@ -60,17 +70,18 @@ class EconomySystem:
     # ---- buy / sell core ---------------------------------------------
 
     def _buy(self, buyer, seller, item_name: str) -> bool:
-        item = self._find_in_inventory(seller, item_name)
-        if not item:
+        i = self._inventory_index(seller, item_name)
+        if i < 0:
             return False
+        item = seller.inventory[i]
         price = self._price_of(item)
         if buyer.gold < price:
             return False
         buyer.gold -= price
         seller.gold += price
-        seller.inventory.remove(item)
+        seller.inventory.pop(i)
         buyer.add_item(item)
-        name = item.name if hasattr(item, "name") else str(item)
+        name = name_of(item)
         self._log(f"{buyer.name} buys {name} from {seller.name} for {price} gold.")
         return True
 
@@ -79,9 +90,10 @@ class EconomySystem:
 
     def _give(self, giver, receiver, target_text: str) -> bool:
         # Gold gift?
-        nums = re.findall(r"\d+", target_text)
-        if "gold" in target_text.lower() or "coin" in target_text.lower():
-            amount = int(nums[0]) if nums else 1
+        text = target_text.lower()
+        if "gold" in text or "coin" in text:
+            m = _NUM_RE.search(text)
+            amount = int(m.group()) if m else 1
             if giver.gold < amount:
                 return False
             giver.gold -= amount
@@ -89,12 +101,12 @@ class EconomySystem:
             self._log(f"{giver.name} gives {amount} gold to {receiver.name}.")
             return True
 
-        item = self._find_in_inventory(giver, target_text)
-        if not item:
+        i = self._inventory_index(giver, target_text)
+        if i < 0:
             return False
-        giver.inventory.remove(item)
+        item = giver.inventory.pop(i)
         receiver.add_item(item)
-        name = item.name if hasattr(item, "name") else str(item)
+        name = name_of(item)
         self._log(f"{giver.name} gives {name} to {receiver.name}.")
 
         # Notify quest manager (delivery)
@@ -111,15 +123,16 @@ class EconomySystem:
     # ---- player buy/sell variants -------------------------------------
 
     def _exec_buy_player(self, item_name: str, seller) -> str:
-        item = self._find_in_inventory(seller, item_name)
-        if not item:
+        i = self._inventory_index(seller, item_name)
+        if i < 0:
             return f"{seller.name} doesn't have any {item_name}."
+        item = seller.inventory[i]
         price = self._price_of(item)
         if self.engine.player.gold < price:
             return f"You can't afford the {item.name} ({price}g)."
         self.engine.player.gold -= price
         seller.gold += price
-        seller.inventory.remove(item)
+        seller.inventory.pop(i)
         self.engine.player.add_item(item)
         msg = f"You buy {item.name} for {price}g."
         self._log(msg)
@@ -127,13 +140,14 @@ class EconomySystem:
         return msg
 
     def _exec_sell_player(self, item_name: str, buyer) -> str:
-        item = self._find_in_inventory(self.engine.player, item_name)
-        if not item:
+        i = self._inventory_index(self.engine.player, item_name)
+        if i < 0:
             return f"You don't have any {item_name}."
+        item = self.engine.player.inventory[i]
         price = max(1, self._price_of(item) // 2)
         buyer.gold = max(0, buyer.gold - price)
         self.engine.player.gold += price
-        self.engine.player.inventory.remove(item)
+        self.engine.player.inventory.pop(i)
         buyer.add_item(item)
         msg = f"You sell {item.name} for {price}g."
         self._log(msg)
@@ -151,42 +165,40 @@ class EconomySystem:
     # ---- helpers ------------------------------------------------------
 
     def _parse_target(self, target_text: str):
-        if " from " in target_text:
-            i, p = target_text.split(" from ", 1)
-            return i.strip(), p.strip()
-        if " to " in target_text:
-            i, p = target_text.split(" to ", 1)
-            return i.strip(), p.strip()
-        if " with " in target_text:
-            i, p = target_text.split(" with ", 1)
-            return i.strip(), p.strip()
-        return target_text.strip(), None
+        m = _TRADE_RE.fullmatch(target_text)
+        if m is None:
+            return target_text.strip(), None
+        k = m.lastindex
+        return m.group(k - 1).strip(), m.group(k).strip()
 
     def _adjacent(self, a, b) -> bool:
         # Player pairs go through the interior-aware check (P9A.7)
         player = self.engine.player
-        if a.id == player.id or b.id == player.id:
+        if a is player or b is player:
             from engine.presence import npc_adjacent_to_player
-            other = b if a.id == player.id else a
+            other = b if a is player else a
             return npc_adjacent_to_player(self.engine, other)
         return ((a.position[0] - b.position[0]) ** 2 +
-                (a.position[1] - b.position[1]) ** 2) ** 0.5 <= 1.5
+                (a.position[1] - b.position[1]) ** 2) <= 2.25   # 1.5 tiles
 
-    def _find_in_inventory(self, char, name: str):
+    def _inventory_index(self, char, name: str) -> int:
+        """Slot of the best match for `name` in char's inventory, or -1.
+        Callers pop this slot rather than re-scanning with list.remove
+        (which would also take the first EQUAL twin, not this item)."""
         name = name.lower().strip()
         if not name:
-            return None
+            return -1
         # Exact name match
-        for it in char.inventory:
-            it_name = it.name.lower() if hasattr(it, "name") else str(it).lower()
+        for i, it in enumerate(char.inventory):
+            it_name = name_of(it).lower()
             if it_name == name:
-                return it
+                return i
         # Substring
-        for it in char.inventory:
-            it_name = it.name.lower() if hasattr(it, "name") else str(it).lower()
+        for i, it in enumerate(char.inventory):
+            it_name = name_of(it).lower()
             if name in it_name or it_name in name:
-                return it
-        return None
+                return i
+        return -1
 
     def _price_of(self, item) -> int:
         if hasattr(item, "value"):
@@ -194,39 +206,29 @@ class EconomySystem:
         return 10
 
     def _nearest_other(self, npc):
-        nearest, best = None, 999
+        nearest, best = None, 999 * 999          # squared distances
+        nx, ny = npc.position
         for pos, ch in self.engine.world.map.characters.items():
             if ch.id == npc.id:
                 continue
-            d = ((pos[0] - npc.position[0]) ** 2 +
-                 (pos[1] - npc.position[1]) ** 2) ** 0.5
-            if d < best:
-                best, nearest = d, ch
+            dx, dy = pos[0] - nx, pos[1] - ny
+            d2 = dx * dx + dy * dy
+            if d2 < best:
+                best, nearest = d2, ch
         return nearest
 
     def _find_partner_for_player(self, name: str = None):
         if name:
             return self.engine.find_character(name)
         for pos, ch in self.engine.world.map.characters.items():
-            if ch.id == self.engine.player.id:
+            if ch is self.engine.player:
                 continue
             if self._adjacent(self.engine.player, ch):
                 return ch
         return None
 
     def _step_toward(self, mover, target) -> bool:
-        dx = target.position[0] - mover.position[0]
-        dy = target.position[1] - mover.position[1]
-        dx = (dx > 0) - (dx < 0)
-        dy = (dy > 0) - (dy < 0)
-        if dx and dy:
-            if abs(target.position[0] - mover.position[0]) > \
-                    abs(target.position[1] - mover.position[1]):
-                dy = 0
-            else:
-                dx = 0
-        nx, ny = mover.position[0] + dx, mover.position[1] + dy
-        return self.engine.world.map.move_character(mover, nx, ny)
+        return straight_step(self.engine.world.map, mover, target.position)
 
     def _log(self, msg: str) -> None:
         self.engine.memory_manager.add_event(msg)
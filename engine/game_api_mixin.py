@@ -222,10 +222,11 @@ class GameAPIMixin:
     # ---- equipment --------------------------------------------------
 
     def equip_item(self, item_name: str) -> str:
+        from characters.character import item_name as name_of
         from characters.equipment import equip
+        wanted = item_name.lower()
         for it in self.player.inventory:
-            name = it.name if hasattr(it, "name") else str(it)
-            if item_name.lower() in name.lower():
+            if wanted in name_of(it).lower():
                 msg = equip(self.player, it)
                 self.memory_manager.add_event(msg)
                 return msg
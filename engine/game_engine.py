@@ -22,24 +22,12 @@ from characters.npc_manager import NPCManager
 from characters.character import Character
 from llm.llm_interface import LLMInterface
 from engine.memory_manager import MemoryManager
+from engine.directions import mentions_player
 from engine.game_api_mixin import GameAPIMixin
 
 logger = logging.getLogger("llm_rpg.engine")
 
 
-def _driven_elsewhere(npc, turn_counter) -> bool:
-    """True when the ambient NPC AI must NOT drive this NPC because another
-    system owns it this turn: a roster player-character or adventurer (its
-    controller), a townsperson away on a venture (TownsfolkVentureSystem), a
-    wildlife animal (WildlifeSystem), an arena combatant (ColosseumSystem), or
-    a hostile that already bit via the per-turn AggressionSystem."""
-    m = getattr(npc, "metadata", {}) or {}
-    return bool(m.get("player_char") or m.get("adventurer")
-                or m.get("venturing") or m.get("wildlife")
-                or m.get("arena_fighter")
-                or m.get("_aggro_turn") == turn_counter)
-
-
 class GameEngine(GameAPIMixin):
     """High-level game engine. UIs interact through this object."""
 
@@ -74,7 +62,12 @@ class GameEngine(GameAPIMixin):
         self.player: Optional[Character] = None
         self.running = False
         self.turn_counter = 0
-        self.processing_npcs = set()
+        # npc id -> monotonic time of its get_action. Main thread only (the
+        # NPC processes answer through queues), so it needs no lock
+        self.processing_npcs = {}
+        self._shared_game_state = None  # last game_state pushed to them
+        self.npc_worker = None     # engine/npc_worker, enabled by frame loops
+        self._state_cache = None   # (key, derived dict) for get_game_state
         self.player_dead = False  # set by combat_system when player defeated
 
         # Initialize demo world
@@ -153,6 +146,9 @@ class GameEngine(GameAPIMixin):
         self.memory_manager.add_event("The adventure has ended.")
         if self.process_manager:
             self.process_manager.stop_processes()
+        if self.npc_worker is not None:
+            self.npc_worker.shutdown()
+            self.npc_worker = None
         if hasattr(self.llm_interface, "shutdown"):
             self.llm_interface.shutdown()
 
@@ -281,143 +277,49 @@ class GameEngine(GameAPIMixin):
 
     def process_npc_turns(self) -> None:
         """Synchronous NPC turn (kept for terminal mode)."""
-        if not self._npc_turns_due():
-            return
-        try:   # re-assert after any map swap (streaming keeps it; a fresh
-            from engine.movement import ensure_wall_guard  # map re-installs)
-            ensure_wall_guard(self)
-        except Exception:
-            pass
-        try:   # band nearby hostiles into packs before they act (P19.3)
-            self.monster_packs.update()
-        except Exception as e:
-            logger.debug(f"Monster packs: {e}")
-        for npc_id, npc in list(self.npc_manager.npcs.items()):
-            if hasattr(npc, "is_active") and not npc.is_active():
-                continue
-            if npc_id.startswith("tut_"):
-                continue  # tutorial cast stands still
-            # Party members are the companion system's to move —
-            # schedules were marching them home mid-adventure (PT3.3)
-            try:
-                if npc_id in self.companion_manager.party:
-                    continue
-            except Exception:
-                pass
-            # NPCs another system owns this turn (controllers, ventures,
-            # wildlife, arena, the AggressionSystem) skip the ambient AI
-            if _driven_elsewhere(npc, self.turn_counter):
-                continue
-            try:
-                npc_x, npc_y = npc.position
-                if self._distance_to_player(npc_x, npc_y) > \
-                        self.effective_visibility() * 2:
-                    continue
-                visible_map = self.world.map.get_visible_description(npc_x, npc_y)
-                world_state = self._world_state_for(npc_x, npc_y)
-                history = self.memory_manager.get_recent_history()
-                # Budget: monsters + cooling-down NPCs act heuristically
-                from engine.llm_budget import (llm_action_allowed,
-                                               heuristic_provider)
-                if llm_action_allowed(self, npc):
-                    action = self.llm_interface.get_npc_action(
-                        npc, world_state, history, visible_map)
-                else:
-                    action = heuristic_provider(self).get_npc_action(
-                        npc, world_state, history, visible_map)
-                self.action_router.process(npc, action)
-            except Exception as e:
-                logger.error(f"NPC {npc_id} error: {e}")
+        from engine.npc_turns import run_npc_turns
+        run_npc_turns(self)
 
     def process_npc_turns_async(self) -> None:
         """Async / multiprocess NPC processing — falls back to sync if PM absent."""
-        if not self.process_manager:
-            self.process_npc_turns()
-            return
-
-        # Shared state
-        self.process_manager.update_shared_state("game_state", {
-            "time_of_day": self.world.get_time_of_day(),
-            "turn_counter": self.turn_counter,
-            "player_position": self.player.position,
-        })
-        self.process_manager.check_process_health()
-
-        # Collect responses
-        for npc_id, resp in self.process_manager.get_responses().items():
-            npc = self.npc_manager.get_npc(npc_id)
-            if not npc or not npc.is_active():
-                continue
-            if resp.get("type") == "action":
-                self.action_router.process(npc, resp["action_data"])
-            elif resp.get("type") == "error":
-                logger.error(f"NPC {npc_id}: {resp.get('error')}")
-            self.processing_npcs.discard(npc_id)
-
-        # Send new commands — on the NPC cadence, not per frame
-        if not self._npc_turns_due():
-            return
-        from engine.llm_budget import llm_action_allowed, heuristic_provider
-        for npc_id, npc in self.npc_manager.npcs.items():
-            if not npc.is_active() or npc_id in self.processing_npcs:
-                continue
-            if npc_id.startswith("tut_"):
-                continue  # tutorial cast stands still
-            # Party members are the companion system's to move —
-            # schedules were marching them home mid-adventure (PT3.3)
-            try:
-                if npc_id in self.companion_manager.party:
-                    continue
-            except Exception:
-                pass
-            # NPCs another system owns this turn (controllers, ventures,
-            # wildlife, arena, the AggressionSystem) skip the ambient AI
-            if _driven_elsewhere(npc, self.turn_counter):
-                continue
-            nx, ny = npc.position
-            if self._distance_to_player(nx, ny) > \
-                    self.effective_visibility() * 2:
-                continue
-            # Budget: only NPCs off cooldown burn a subprocess LLM call;
-            # the rest act heuristically inline (cheap)
-            if not llm_action_allowed(self, npc):
-                try:
-                    action = heuristic_provider(self).get_npc_action(
-                        npc, self._world_state_for(nx, ny),
-                        self.memory_manager.get_recent_history(),
-                        self.world.map.get_visible_description(nx, ny))
-                    self.action_router.process(npc, action)
-                except Exception as e:
-                    logger.debug(f"Heuristic fallback error: {e}")
-                continue
-            self.processing_npcs.add(npc_id)
-            self.process_manager.send_command(npc_id, "get_action", {
-                "world_state": self._world_state_for(nx, ny),
-                "game_history": self.memory_manager.get_recent_history(),
-                "visible_map": self.world.map.get_visible_description(nx, ny),
-            })
+        from engine.npc_turns import run_npc_turns_async
+        run_npc_turns_async(self)
 
     # ====================================================================
     # Game state
     # ====================================================================
 
     def get_game_state(self) -> Dict[str, Any]:
-        return {
-            "player": self.player,
-            "map": self.world.map,
-            "world": self.world,
-            "npcs": list(self.npc_manager.npcs.values()),
-            "visible_map": self.world.map.get_visible_description(
-                *self.player.position) if self.player else "",
-            "location": self.world.get_location_at(
-                *self.player.position) if self.player else None,
-            "time_of_day": self.world.get_time_of_day(),
-            "formatted_time": self.world.get_formatted_time(),
-            "recent_events": self.memory_manager.get_recent_history(8),
-            "turn": self.turn_counter,
-            "quests": self.quest_manager.summary() if self.quest_manager else "",
-            "xp": (self.player.metadata or {}).get("xp", 0) if self.player else 0,
-        }
+        """Snapshot for the UI. Frames redraw far more often than turns
+        pass, so the per-turn parts (location, clock text, quest summary)
+        are reused until the turn, clock, player tile, map or event log
+        moves on. The NPC list and view text are built live: NPCs can be
+        added, removed or moved between turns, and the view text has its
+        own memo; recent events and XP are read live too."""
+        p = self.player
+        mm = self.memory_manager
+        key = (self.turn_counter, self.world.time, id(self.world.map),
+               id(p), p.position if p else None,
+               id(mm.game_history), getattr(mm.game_history, "appended", None))
+        if self._state_cache is None or self._state_cache[0] != key:
+            self._state_cache = (key, {
+                "player": p,
+                "map": self.world.map,
+                "world": self.world,
+                "location": self.world.get_location_at(
+                    *p.position) if p else None,
+                "time_of_day": self.world.get_time_of_day(),
+                "formatted_time": self.world.get_formatted_time(),
+                "turn": self.turn_counter,
+                "quests": self.quest_manager.summary() if self.quest_manager else "",
+            })
+        state = dict(self._state_cache[1])
+        state["npcs"] = list(self.npc_manager.npcs.values())
+        state["visible_map"] = self.world.map.get_visible_description(
+            *p.position) if p else ""
+        state["recent_events"] = mm.get_recent_history(8)
+        state["xp"] = (p.metadata or {}).get("xp", 0) if p else 0
+        return state
 
     # ====================================================================
     # Save / load
@@ -449,24 +351,22 @@ class GameEngine(GameAPIMixin):
         # below, so casting at a real foe named "Ghost of Player" hits the
         # GHOST, not the caster (George: away-casters froze plinking a
         # never-dying phantom because "player" ⊂ its name).
-        exact = [n for n in self.npc_manager.npcs.values()
-                 if n.name.lower() == text]
+        exact = self.npc_manager.get_npcs_by_name(text)
         if exact:
             return self._nearest_active(exact)
         # Player keywords — a loose LLM/NPC reference to the hero ("the
         # traveler", "the player") when no concrete entity matched.
-        if any(t in text for t in ("player", "adventurer", "traveler",
-                                   "stranger", "newcomer")):
+        if mentions_player(text):
             return self.player
         # Substring match
-        subs = [n for n in self.npc_manager.npcs.values()
-                if n.name.lower() in text or text in n.name.lower()]
+        subs = self.npc_manager.named_like(text)
         if subs:
             return self._nearest_active(subs)
         # Symbol
         if len(name_or_id) == 1:
+            either = (text, text.upper())       # no per-NPC lower() calls
             for npc in self.npc_manager.npcs.values():
-                if npc.symbol.lower() == text:
+                if npc.symbol in either:
                     return npc
         return None
 
@@ -481,16 +381,3 @@ class GameEngine(GameAPIMixin):
                     (px - x) ** 2 + (py - y) ** 2)
 
         return min(candidates, key=key)
-
-    def _distance_to_player(self, x: int, y: int) -> float:
-        px, py = self.player.position
-        return ((px - x) ** 2 + (py - y) ** 2) ** 0.5
-
-    def _world_state_for(self, x: int, y: int) -> Dict[str, Any]:
-        loc = self.world.get_location_at(x, y)
-        return {
-            "current_location": loc.name if loc else "wilderness",
-            "time_of_day": self.world.get_time_of_day(),
-            "player_position": tuple(self.player.position)
-            if self.player else None,
-        }
@@ -69,8 +69,8 @@ def giant_tick(engine, giant) -> bool:
             return True
     # HURL a boulder at the player
     px, py = engine.player.position
-    dist = ((gx - px) ** 2 + (gy - py) ** 2) ** 0.5
-    if BOULDER_MIN_RANGE <= dist <= BOULDER_RANGE and \
+    dist2 = (gx - px) ** 2 + (gy - py) ** 2
+    if BOULDER_MIN_RANGE ** 2 <= dist2 <= BOULDER_RANGE ** 2 and \
             engine.active_zone() is None:
         try:
             from world.fov import overworld_los
@@ -7,6 +7,8 @@ heals and feeds. `use_item(engine, name)` is the single entry.
 
 import logging
 
+from characters.character import item_name as name_of
+
 logger = logging.getLogger("llm_rpg.item_use")
 
 
@@ -14,9 +16,10 @@ def use_item(engine, item_name: str) -> str:
     if not item_name:
         return "Specify which item to use."
     player = engine.player
+    wanted = item_name.lower()
     for it in player.inventory:
-        it_name = it.name if hasattr(it, "name") else str(it)
-        if item_name.lower() not in it_name.lower():
+        it_name = name_of(it)
+        if wanted not in it_name.lower():
             continue
 
         use_eff = getattr(it, "use_effect", None) or {}
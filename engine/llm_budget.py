@@ -9,7 +9,8 @@ The budget rules, enforced at the call sites:
   ACTION_COOLDOWN_MIN of game time — everything between runs on the free
   heuristic provider.
 - Plain greetings (T with no message) are cached per NPC for
-  GREETING_TTL_MIN game minutes.
+  GREETING_TTL_MIN game minutes, while the time of day and the NPC's
+  location stay the same.
 """
 
 import logging
@@ -46,6 +47,16 @@ def llm_action_allowed(engine, npc) -> bool:
     return True
 
 
+def _greeting_context(engine, npc) -> list:
+    """What a greeting may mention besides the NPC: a "good morning" at
+    the forge is stale at dusk, or once the NPC has walked to the tavern."""
+    try:
+        loc = engine.world.get_location_at(*npc.position)
+        return [engine.world.get_time_of_day(), loc.name if loc else ""]
+    except Exception:
+        return []
+
+
 def cached_greeting(engine, npc):
     """Return a still-fresh cached greeting, or None."""
     cache = npc.metadata.get("greet_cache")
@@ -53,9 +64,12 @@ def cached_greeting(engine, npc):
         return None
     if engine.world.time - cache.get("at", -10**9) > GREETING_TTL_MIN:
         return None
+    if cache.get("ctx", []) != _greeting_context(engine, npc):
+        return None
     return cache.get("text")
 
 
 def store_greeting(engine, npc, text: str) -> None:
     npc.metadata["greet_cache"] = {"text": text,
-                                   "at": engine.world.time}
+                                   "at": engine.world.time,
+                                   "ctx": _greeting_context(engine, npc)}
@@ -5,23 +5,59 @@ Handles tracking game events, history, and memory management
 
 import time
 import logging
+from collections import deque
+from itertools import islice
 from typing import List, Dict, Any
 import config
 
 logger = logging.getLogger("llm_rpg.memory")
 
+
+class EventLog(deque):
+    """Bounded game history: O(1) appends, the oldest entries fall off
+    past `maxlen`. Indexes and slices like the list it replaced (a slice
+    is a list). `appended` counts every entry ever added, so a position
+    noted earlier can still be found after old entries have dropped off."""
+
+    def __init__(self, iterable=(), maxlen=None):
+        super().__init__(iterable, maxlen)
+        self.appended = len(self)
+
+    def append(self, item):
+        super().append(item)
+        self.appended += 1
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return super().__getitem__(index)
+        start, stop, step = index.indices(len(self))
+        if step < 0:
+            return list(self)[index]
+        return list(islice(self, start, stop, step))
+
+
 class MemoryManager:
     """Manages game events, history, and character memories"""
     
     def __init__(self, max_history=config.MAX_HISTORY_ITEMS):
-        self.game_history = []
         self.max_history = max_history
+        self.game_history = []
         # Observers — subsystems that react to every event the player
         # sees (topic journal, sound). Must not call add_event back.
         self.on_event = None          # legacy single-observer slot
         self._observers = []
+        self._recent = (None, 0, 0, [])   # (log, appended, count, events)
         logger.info(f"Memory Manager initialized with max history: {max_history}")
 
+    @property
+    def game_history(self) -> EventLog:
+        return self._history
+
+    @game_history.setter
+    def game_history(self, entries) -> None:
+        # Loads and resets assign plain lists; keep the bounded buffer
+        self._history = EventLog(entries, maxlen=self.max_history)
+
     def add_event(self, event: str):
         """Add an event to the game history"""
         # Suppress consecutive duplicates (idle NPC barks repeat)
@@ -36,28 +72,37 @@ class MemoryManager:
         }
 
         self.game_history.append(timestamped_event)
-        logger.debug(f"Added event: {event}")
+        logger.debug("Added event: %s", event)
 
-        for observer in ([self.on_event] if self.on_event else []) + \
-                self._observers:
-            try:
-                observer(event)
-            except Exception as e:
-                logger.debug(f"Event observer error: {e}")
+        if self.on_event:
+            self._notify(self.on_event, event)
+        for observer in self._observers:
+            self._notify(observer, event)
+
+    @staticmethod
+    def _notify(observer, event: str) -> None:
+        try:
+            observer(event)
+        except Exception as e:
+            logger.debug(f"Event observer error: {e}")
 
     def add_observer(self, fn) -> None:
         if fn not in self._observers:
             self._observers.append(fn)
-        
-        # Trim history if needed
-        if len(self.game_history) > self.max_history:
-            self.game_history = self.game_history[-self.max_history:]
-            logger.debug(f"Trimmed history to {self.max_history} items")
     
     def get_recent_history(self, count=10) -> List[str]:
-        """Get a list of recent events"""
-        events = self.game_history[-count:] if len(self.game_history) >= count else self.game_history
-        return [e["event"] for e in events]
+        """Get a list of recent events. An NPC tick asks once per NPC, so
+        the list is reused until an event is logged or the log is replaced;
+        callers must not mutate it."""
+        log = self.game_history
+        log_seen, appended, seen_count, recent = self._recent
+        if log_seen is log and appended == log.appended and seen_count == count:
+            return recent
+        # Walk back from the newest entry: O(count), no copy of the log
+        events = list(islice(reversed(log), count))
+        recent = [e["event"] for e in reversed(events)]
+        self._recent = (log, log.appended, count, recent)
+        return recent
     
     def get_history_summary(self) -> str:
         """Generate a summary of the game history"""
@@ -71,27 +116,24 @@ class MemoryManager:
     
     def get_location_history(self, location_name: str, count=5) -> List[str]:
         """Get events that occurred at a specific location"""
-        location_events = []
-        
-        for event in reversed(self.game_history):
-            if location_name.lower() in event["event"].lower():
-                location_events.append(event["event"])
-                if len(location_events) >= count:
-                    break
-        
-        return location_events
+        return self._mentioning(location_name, count)
     
     def get_character_history(self, character_name: str, count=5) -> List[str]:
         """Get events related to a specific character"""
-        character_events = []
-        
-        for event in reversed(self.game_history):
-            if character_name.lower() in event["event"].lower():
-                character_events.append(event["event"])
-                if len(character_events) >= count:
+        return self._mentioning(character_name, count)
+
+    def _mentioning(self, name: str, count: int) -> List[str]:
+        """Newest-first events whose text contains `name`, case-blind. The
+        name is lowered once, not once per entry scanned."""
+        needle = name.lower()
+        found = []
+        for entry in reversed(self.game_history):
+            text = entry["event"]
+            if needle in text.lower():
+                found.append(text)
+                if len(found) >= count:
                     break
-        
-        return character_events
+        return found
     
     def clear_history(self):
         """Clear all history"""
@@ -103,7 +145,7 @@ class MemoryManager:
         try:
             import json
             with open(filename, 'w') as f:
-                json.dump(self.game_history, f, indent=2)
+                json.dump(list(self.game_history), f, separators=(",", ":"))
             logger.info(f"Game history saved to {filename}")
             return True
         except Exception as e:
@@ -128,7 +128,7 @@ class NPCConflictSystem:
         try:
             ax, ay = attacker.position
             dx, dy = defender.position
-            if ((ax - dx) ** 2 + (ay - dy) ** 2) ** 0.5 > 1.5:
+            if (ax - dx) ** 2 + (ay - dy) ** 2 > 2.25:   # beyond 1.5 tiles
                 combat._step_toward(attacker, defender)
                 return
             result = combat._resolve(attacker, defender)
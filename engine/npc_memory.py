@@ -21,6 +21,8 @@ import logging
 import re
 from typing import List
 
+from characters.character import Memory
+
 logger = logging.getLogger("llm_rpg.npc_memory")
 
 MAX_DIALOG_LOG = 10
@@ -41,11 +43,8 @@ def _words(text: str) -> set:
 # ---- write ----------------------------------------------------------------
 
 def remember(npc, event: str, importance: int, world_time: int) -> None:
-    npc.memories.append({
-        "event": event,
-        "importance": max(1, min(10, importance)),
-        "game_time": world_time,
-    })
+    npc.memories.append(Memory(event, max(1, min(10, importance)),
+                               game_time=world_time))
 
 
 def log_exchange(npc, player_line: str, npc_line: str) -> None:
@@ -3,10 +3,11 @@
 # ===========================================================
 
 import logging
-import time
 import json
 import os
+import pickle
 import sys
+from queue import Empty
 from typing import Dict, Any
 
 from config import NPC_ACTION_ENHANCED_PROMPT
@@ -22,6 +23,50 @@ logging.basicConfig(
 )
 logger = logging.getLogger(f"npc_process")
 
+def _npc_record(data):
+    """The dict carried by an update_npc command (NPCProcessManager.update_npc
+    sends it pickled)"""
+    return pickle.loads(data) if isinstance(data, bytes) else data
+
+# The per-turn NPCSnapshot fields a cached Character takes over from
+# npc_data; the profile (class, race, stats) only changes with update_npc
+_VOLATILE = ("position", "hp", "max_hp", "status", "personality", "goals",
+             "relationships", "memories")
+
+def _character(npc_data):
+    """Build the prompt Character from an update_npc record (simplified)"""
+    from characters.character import Character
+    from characters.character_types import CharacterClass, CharacterRace
+
+    stats = npc_data["stats"]
+    char = Character(
+        id=npc_data["id"],
+        name=npc_data["name"],
+        character_class=CharacterClass(npc_data["class"]),
+        race=CharacterRace(npc_data["race"]),
+        level=npc_data["level"],
+        strength=stats["strength"],
+        dexterity=stats["dexterity"],
+        constitution=stats["constitution"],
+        intelligence=stats["intelligence"],
+        wisdom=stats["wisdom"],
+        charisma=stats["charisma"],
+        hp=npc_data["hp"],
+        max_hp=npc_data["max_hp"],
+        position=npc_data["position"],
+        goals=npc_data["goals"],
+        personality=npc_data["personality"],
+        relationships=npc_data["relationships"]
+    )
+    _fold_snapshot(char, npc_data)
+    return char
+
+def _fold_snapshot(char, npc_data):
+    """Copy this turn's volatile fields onto the cached Character"""
+    for f in _VOLATILE:
+        if f in npc_data:
+            setattr(char, f, npc_data[f])
+
 def npc_process_main(npc_id, command_queue, response_queue, shared_state, llm_model):
     """Main function for an NPC process"""
     try:
@@ -33,20 +78,26 @@ def npc_process_main(npc_id, command_queue, response_queue, shared_state, llm_mo
 
         # Process initialization
         npc_data = None
+        char = None     # built from npc_data once, then kept up to date
         running = True
 
         while running and shared_state.get("game_running", True):
             try:
-                # Check for commands
-                if not command_queue.empty():
-                    command = command_queue.get()
+                # Block for the next command; the timeout tick rechecks
+                # game_running, so there is no poll-and-sleep loop
+                try:
+                    command = command_queue.get(timeout=1.0)
+                except Empty:
+                    command = None
+                if command is not None:
 
                     if command["command"] == "shutdown":
                         running = False
                         logger.info(f"NPC process {npc_id} shutting down")
 
                     elif command["command"] == "update_npc":
-                        npc_data = command["data"]
+                        npc_data = _npc_record(command["data"])
+                        char = None
                         logger.info(f"NPC {npc_id} data updated: {npc_data.get('name', 'unknown')}")
 
 
@@ -60,8 +111,24 @@ def npc_process_main(npc_id, command_queue, response_queue, shared_state, llm_mo
 
 
                     elif command["command"] == "get_action":
+                        # Skip if we don't have NPC data yet
+                        if not npc_data:
+                            logger.warning(f"Cannot generate action for NPC {npc_id}: No NPC data")
+                            continue
+
+                        # Fold in this turn's NPCSnapshot (position, hp,
+                        # goals, ...) over the data sent at startup
+                        snap = command["data"].get("npc")
+                        if snap is not None:
+                            npc_data.update(
+                                (f, getattr(snap, f)) for f in snap.__slots__)
+                            npc_data["goals"] = list(snap.goals)
+                            npc_data["memories"] = list(snap.memories)
+                            if char is not None:
+                                _fold_snapshot(char, npc_data)
+
                         # Skip generating actions for non-active NPCs
-                        if npc_data and npc_data.get("status") != "alive":
+                        if npc_data.get("status", "alive") != "alive":
                             logger.debug(f"Skipping action generation for non-active NPC {npc_id} (status: {npc_data.get('status')})")
                             response_queue.put({
                                 "type": "status",
@@ -69,13 +136,6 @@ def npc_process_main(npc_id, command_queue, response_queue, shared_state, llm_mo
                             })
                             continue
 
-
-                    elif command["command"] == "get_action":
-                        # Skip if we don't have NPC data yet
-                        if not npc_data:
-                            logger.warning(f"Cannot generate action for NPC {npc_id}: No NPC data")
-                            continue
-
                         # Extract data needed for decision
                         world_state = command["data"]["world_state"]
                         game_history = command["data"]["game_history"]
@@ -85,33 +145,8 @@ def npc_process_main(npc_id, command_queue, response_queue, shared_state, llm_mo
 
                         # Generate NPC action using LLM
                         try:
-                            # Convert dict back to Character object (simplified)
-                            from characters.character import Character
-                            from characters.character_types import CharacterClass, CharacterRace
-
-                            char = Character(
-                                id=npc_data["id"],
-                                name=npc_data["name"],
-                                character_class=CharacterClass(npc_data["class"]),
-                                race=CharacterRace(npc_data["race"]),
-                                level=npc_data["level"],
-                                strength=npc_data["stats"]["strength"],
-                                dexterity=npc_data["stats"]["dexterity"],
-                                constitution=npc_data["stats"]["constitution"],
-                                intelligence=npc_data["stats"]["intelligence"],
-                                wisdom=npc_data["stats"]["wisdom"],
-                                charisma=npc_data["stats"]["charisma"],
-                                hp=npc_data["hp"],
-                                max_hp=npc_data["max_hp"],
-                                position=npc_data["position"],
-                                goals=npc_data["goals"],
-                                personality=npc_data["personality"],
-                                relationships=npc_data["relationships"]
-                            )
-
-                            # Get character memories
-                            if "memories" in npc_data:
-                                char.memories = npc_data["memories"]
+                            if char is None:
+                                char = _character(npc_data)
 
                             # Generate action
                             try:
@@ -157,29 +192,8 @@ def npc_process_main(npc_id, command_queue, response_queue, shared_state, llm_mo
                         logger.info(f"Generating dialog for NPC {npc_data.get('name', npc_id)}")
 
                         try:
-                            # Convert dict back to Character object (simplified)
-                            from characters.character import Character
-                            from characters.character_types import CharacterClass, CharacterRace
-
-                            char = Character(
-                                id=npc_data["id"],
-                                name=npc_data["name"],
-                                character_class=CharacterClass(npc_data["class"]),
-                                race=CharacterRace(npc_data["race"]),
-                                level=npc_data["level"],
-                                strength=npc_data["stats"]["strength"],
-                                dexterity=npc_data["stats"]["dexterity"],
-                                constitution=npc_data["stats"]["constitution"],
-                                intelligence=npc_data["stats"]["intelligence"],
-                                wisdom=npc_data["stats"]["wisdom"],
-                                charisma=npc_data["stats"]["charisma"],
-                                hp=npc_data["hp"],
-                                max_hp=npc_data["max_hp"],
-                                position=npc_data["position"],
-                                goals=npc_data["goals"],
-                                personality=npc_data["personality"],
-                                relationships=npc_data["relationships"]
-                            )
+                            if char is None:
+                                char = _character(npc_data)
 
                             # Generate response
                             response = llm.generate_npc_dialog(char, player_message, recent_history)
@@ -214,8 +228,13 @@ def npc_process_main(npc_id, command_queue, response_queue, shared_state, llm_mo
                         suspended = True
                         while suspended and shared_state.get("game_running", True):
                             try:
-                                if not command_queue.empty():
-                                    cmd = command_queue.get()
+                                # Blocking get: no CPU while asleep, and a
+                                # command wakes it at once, not on a 0.5s tick
+                                try:
+                                    cmd = command_queue.get(timeout=0.5)
+                                except Empty:
+                                    cmd = None
+                                if cmd is not None:
 
                                     if cmd["command"] == "shutdown":
                                         # Exit suspend mode and terminate
@@ -229,7 +248,8 @@ def npc_process_main(npc_id, command_queue, response_queue, shared_state, llm_mo
 
                                         # If this was an update_npc command, process it
                                         if cmd["command"] == "update_npc":
-                                            npc_data = cmd["data"]
+                                            npc_data = _npc_record(cmd["data"])
+                                            char = None
                                             logger.info(f"NPC {npc_id} data updated during unsuspend")
 
                                     # Acknowledge the command
@@ -240,12 +260,6 @@ def npc_process_main(npc_id, command_queue, response_queue, shared_state, llm_mo
                             except Exception as e:
                                 logger.error(f"Error during suspension for NPC {npc_id}: {str(e)}")
 
-                            # Sleep longer while suspended to save resources
-                            time.sleep(0.5)
-
-
-                # Small delay to prevent CPU overuse
-                time.sleep(0.01)
 
             except Exception as e:
                 logger.error(f"Error in NPC process {npc_id}: {str(e)}")
@@ -7,8 +7,10 @@ Key implementation files for multiprocess LLM-RPG
 # ===========================================================
 
 import logging
+import pickle
 import time
 import os
+from queue import Empty
 from multiprocessing import Process, Queue, Manager
 from typing import Dict, List, Any, Optional
 
@@ -21,9 +23,11 @@ class NPCProcessManager:
 
     def __init__(self, npcs, llm_model=config.DEFAULT_MODEL):
         self.npcs = npcs
+        self.npcs_by_id = {n.id: n for n in npcs}   # restarts look up by id
         self.processes = {}
         self.command_queues = {}
         self.response_queues = {}
+        self.held_responses = {}  # npc id -> answers set aside by get_response(kind=)
         self.shared_manager = Manager()
         self.shared_state = self.shared_manager.dict()
         self.llm_model = llm_model
@@ -35,31 +39,53 @@ class NPCProcessManager:
 
     def start_processes(self):
         """Start a process for each NPC"""
-        from engine.npc_process import npc_process_main
-
         for npc in self.npcs:
-            cmd_queue = Queue()
-            resp_queue = Queue()
-
-            # Create and start the process
-            proc = Process(
-                target=npc_process_main,
-                args=(npc.id, cmd_queue, resp_queue, self.shared_state, self.llm_model),
-                daemon=True,
-                name=f"NPC-{npc.name}"
-            )
-            proc.start()
-
-            # Store process and queues
-            self.processes[npc.id] = proc
-            self.command_queues[npc.id] = cmd_queue
-            self.response_queues[npc.id] = resp_queue
-
-            # Send initial NPC data
-            self.send_command(npc.id, "update_npc", npc.to_dict())
-
+            self._spawn(npc)
             logger.info(f"Started process for NPC: {npc.name}")
 
+    def _spawn(self, npc):
+        """Start (or replace) the process and fresh queues for one NPC"""
+        from engine.npc_process import npc_process_main
+
+        cmd_queue = Queue()
+        resp_queue = Queue()
+
+        # Create and start the process
+        proc = Process(
+            target=npc_process_main,
+            args=(npc.id, cmd_queue, resp_queue, self.shared_state, self.llm_model),
+            daemon=True,
+            name=f"NPC-{npc.name}"
+        )
+        proc.start()
+
+        # Store process and queues
+        self.processes[npc.id] = proc
+        self.command_queues[npc.id] = cmd_queue
+        self.response_queues[npc.id] = resp_queue
+        self.held_responses.pop(npc.id, None)
+
+        # Send initial NPC data
+        self.update_npc(npc)
+
+    def restart_process(self, npc_id):
+        """Kill an NPC process stuck past its deadline and start a fresh one.
+
+        A process blocked inside a hung LLM call never reads its command
+        queue again, and it still looks alive to check_process_health. So
+        it is terminated outright rather than asked to shut down. The new
+        queues also drop any answer the old process had left behind.
+        """
+        npc = self.npcs_by_id.get(npc_id)
+        proc = self.processes.get(npc_id)
+        if npc is None or proc is None:
+            return False
+        proc.terminate()
+        proc.join(timeout=0.5)
+        self._spawn(npc)
+        logger.warning(f"Restarted hung process for NPC: {npc.name}")
+        return True
+
     def stop_processes(self):
         """Stop all NPC processes"""
         # Update shared state to indicate game is stopping
@@ -92,11 +118,24 @@ class NPCProcessManager:
                 return False
         return False
 
+    def update_npc(self, npc):
+        """Send an NPC's full record to its process. It is pickled here,
+        once, at the highest protocol; left to the Queue it would be pickled
+        later on the feeder thread, while the goals/metadata containers
+        to_dict shares may still be changing."""
+        return self.send_command(
+            npc.id, "update_npc",
+            pickle.dumps(npc.to_dict(), pickle.HIGHEST_PROTOCOL))
+
     def get_responses(self, timeout=0.0):
         """Collect responses from all NPC processes"""
         responses = {}
 
         for npc_id, queue in self.response_queues.items():
+            held = self.held_responses.get(npc_id)
+            if held:
+                responses[npc_id] = held.pop(0)
+                continue
             try:
                 # Non-blocking check for responses
                 if not queue.empty():
@@ -106,17 +145,30 @@ class NPCProcessManager:
 
         return responses
 
-    def get_response(self, npc_id, timeout=5.0):
-        """Wait for a response from a specific NPC with timeout"""
+    def get_response(self, npc_id, timeout=5.0, kind=None):
+        """Wait for a response from a specific NPC with timeout.
+
+        Blocks on the queue itself, so the answer is returned the moment it
+        arrives rather than on the next 0.1s poll. With `kind`, only a
+        response of that type is returned. Others that arrive first (an
+        action answer racing a dialog request) are held for get_responses
+        instead of being dropped.
+        """
         if npc_id not in self.response_queues:
             return None
 
+        deadline = time.monotonic() + timeout
         try:
-            start_time = time.time()
-            while time.time() - start_time < timeout:
-                if not self.response_queues[npc_id].empty():
-                    return self.response_queues[npc_id].get(block=False)
-                time.sleep(0.1)  # Small delay to prevent CPU overuse
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                resp = self.response_queues[npc_id].get(timeout=remaining)
+                if kind is None or resp.get("type") == kind:
+                    return resp
+                self.held_responses.setdefault(npc_id, []).append(resp)
+        except Empty:
+            pass
         except Exception as e:
             logger.error(f"Error waiting for response from NPC {npc_id}: {str(e)}")
 
@@ -132,36 +184,9 @@ class NPCProcessManager:
             if not proc.is_alive():
                 logger.warning(f"NPC process {npc_id} died, restarting")
 
-                # Get the NPC object
-                npc = None
-                for n in self.npcs:
-                    if n.id == npc_id:
-                        npc = n
-                        break
-
+                npc = self.npcs_by_id.get(npc_id)
                 if npc:
-                    # Create new queues
-                    cmd_queue = Queue()
-                    resp_queue = Queue()
-
-                    # Start a new process
-                    from engine.npc_process import npc_process_main
-                    new_proc = Process(
-                        target=npc_process_main,
-                        args=(npc_id, cmd_queue, resp_queue, self.shared_state, self.llm_model),
-                        daemon=True,
-                        name=f"NPC-{npc.name}"
-                    )
-                    new_proc.start()
-
-                    # Update process and queues
-                    self.processes[npc_id] = new_proc
-                    self.command_queues[npc_id] = cmd_queue
-                    self.response_queues[npc_id] = resp_queue
-
-                    # Send initial NPC data
-                    self.send_command(npc_id, "update_npc", npc.to_dict())
-
+                    self._spawn(npc)
                     logger.info(f"Restarted process for NPC: {npc.name}")
 
     # Add a method to check and update NPC statuses
@@ -215,7 +240,7 @@ class NPCProcessManager:
     # Add a method to pause/suspend processes for inactive NPCs
     def suspend_inactive_npcs(self):
         """Suspend processes for inactive NPCs to save resources"""
-        for npc_id, npc in self.npcs.items():
+        for npc_id, npc in self.npcs_by_id.items():
             # Skip if NPC doesn't have a process
             if npc_id not in self.processes:
                 continue
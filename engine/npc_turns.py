@@ -0,0 +1,233 @@
+"""Ambient NPC turns (split from game_engine).
+
+`run_npc_turns(engine)` drives every nearby NPC the ambient AI owns
+for one NPC tick, in-process (LLM batches optionally fetched by the
+background engine/npc_worker); `run_npc_turns_async(engine)` does the
+same through the NPC subprocess manager. game_engine's
+process_npc_turns / process_npc_turns_async delegate here.
+"""
+
+import logging
+import time
+
+import config
+
+logger = logging.getLogger("llm_rpg.engine")
+
+
+def _driven_elsewhere(npc, turn_counter) -> bool:
+    """True when the ambient NPC AI must NOT drive this NPC because another
+    system owns it this turn: a roster player-character or adventurer (its
+    controller), a townsperson away on a venture (TownsfolkVentureSystem), a
+    wildlife animal (WildlifeSystem), an arena combatant (ColosseumSystem), or
+    a hostile that already bit via the per-turn AggressionSystem."""
+    m = getattr(npc, "metadata", {}) or {}
+    return bool(m.get("player_char") or m.get("adventurer")
+                or m.get("venturing") or m.get("wildlife")
+                or m.get("arena_fighter")
+                or m.get("_aggro_turn") == turn_counter)
+
+
+def ambient_npcs(engine, skip=()):
+    """Yield (id, npc) for every NPC the ambient AI drives this turn:
+    active, not in `skip`, owned by no other system, and within twice
+    the player's visibility."""
+    # Range first: the cheap squared-distance cut leaves only the handful
+    # of NPCs near the player for the metadata / party checks below
+    near = engine.npc_manager.npcs_within(
+        engine.player.position, engine.effective_visibility() * 2)
+    for npc in near:
+        npc_id = npc.id
+        if not npc.is_active() or npc_id in skip:
+            continue
+        if npc_id.startswith("tut_"):
+            continue  # tutorial cast stands still
+        # Party members are the companion system's to move —
+        # schedules were marching them home mid-adventure (PT3.3)
+        try:
+            if npc_id in engine.companion_manager.party:
+                continue
+        except Exception:
+            pass
+        # NPCs another system owns this turn (controllers, ventures,
+        # wildlife, arena, the AggressionSystem) skip the ambient AI
+        if _driven_elsewhere(npc, engine.turn_counter):
+            continue
+        yield npc_id, npc
+
+
+def _tick_states(engine):
+    """A world_state builder for one NPC tick. Everything but the location
+    is the same for every NPC this tick, so NPCs standing in the same
+    place share one dict instead of each getting a fresh copy. Prompt
+    builders only read world_state."""
+    tod = engine.world.get_time_of_day()
+    ppos = tuple(engine.player.position) if engine.player else None
+    shared = {}
+
+    def state_for(x, y):
+        loc = engine.world.get_location_at(x, y)
+        name = loc.name if loc else "wilderness"
+        state = shared.get(name)
+        if state is None:
+            state = shared[name] = {"current_location": name,
+                                    "time_of_day": tod,
+                                    "player_position": ppos}
+        return state
+    return state_for
+
+
+def _route_late(engine, npc, action) -> None:
+    """Route an action fetched after the scan that granted it."""
+    try:   # the NPC may have fallen or been retired since the scan
+        if npc.is_active() and engine.npc_manager.npcs.get(npc.id) is npc:
+            engine.action_router.process(npc, action)
+    except Exception as e:
+        logger.error(f"NPC {npc.id} error: {e}")
+
+
+def run_npc_turns(engine) -> None:
+    worker = getattr(engine, "npc_worker", None)
+    if worker is not None:   # every call (frame), not just on the cadence
+        for npc, action in worker.drain():
+            _route_late(engine, npc, action)
+    if not engine._npc_turns_due():
+        return
+    try:   # re-assert after any map swap (streaming keeps it; a fresh
+        from engine.movement import ensure_wall_guard  # map re-installs)
+        ensure_wall_guard(engine)
+    except Exception:
+        pass
+    try:   # band nearby hostiles into packs before they act (P19.3)
+        engine.monster_packs.update()
+    except Exception as e:
+        logger.debug(f"Monster packs: {e}")
+    from engine.llm_budget import llm_action_allowed, heuristic_provider
+    iface = engine.llm_interface
+    # Network providers get granted LLM actions in concurrent rounds of
+    # NPC_ACTION_BATCH_SIZE (not N serial requests); a full round flushes
+    # mid-scan, so its actions land without waiting on the slowest NPC
+    batching = getattr(iface.provider, "concurrent_actions", False)
+    batch, batch_npcs = [], []
+
+    def flush():
+        nonlocal batch, batch_npcs
+        reqs, npcs, batch, batch_npcs = batch, batch_npcs, [], []
+        if worker is not None:   # the frame goes on; actions land via drain()
+            worker.submit(npcs, reqs)
+            return
+        for npc, action in zip(npcs, iface.get_npc_actions(reqs)):
+            _route_late(engine, npc, action)
+
+    waiting = worker.pending if worker is not None else ()
+    state_for = _tick_states(engine)
+    for npc_id, npc in ambient_npcs(engine, skip=waiting):
+        try:
+            npc_x, npc_y = npc.position
+            request = (npc, state_for(npc_x, npc_y),
+                       engine.memory_manager.get_recent_history(),
+                       engine.world.map.get_visible_description(npc_x, npc_y))
+            # Budget: monsters + cooling-down NPCs act heuristically
+            if not llm_action_allowed(engine, npc):
+                action = heuristic_provider(engine).get_npc_action(*request)
+            elif batching:
+                batch.append(request)
+                batch_npcs.append(npc)
+                if len(batch) >= config.NPC_ACTION_BATCH_SIZE:
+                    flush()
+                continue
+            else:
+                action = iface.get_npc_action(*request)
+            engine.action_router.process(npc, action)
+        except Exception as e:
+            logger.error(f"NPC {npc_id} error: {e}")
+    if batch:
+        flush()
+
+
+def run_npc_turns_async(engine) -> None:
+    if not engine.process_manager:
+        engine.process_npc_turns()
+        return
+
+    # Shared state. This runs every frame and each write to the Manager
+    # dict is a round trip to its server process, so only changes go out
+    shared = {
+        "time_of_day": engine.world.get_time_of_day(),
+        "turn_counter": engine.turn_counter,
+        "player_position": engine.player.position,
+    }
+    if shared != engine._shared_game_state:
+        engine.process_manager.update_shared_state("game_state", shared)
+        engine._shared_game_state = shared
+
+    # Collect responses. An answer whose request already expired (below) is
+    # stale — the NPC has since acted without it — so it is dropped. An
+    # action answer settles the in-flight request, and so does an error
+    # (the process is alive and said so; holding the NPC until the timeout
+    # sweep would freeze it and respawn a healthy process). A status reply
+    # (suspend / revive / update_npc) or a late dialog answer queued ahead
+    # of it must not. With nothing in flight there is nothing to route, so
+    # the per-process queue polls are skipped; anything queued waits for a
+    # later frame.
+    inflight = engine.processing_npcs
+    for npc_id, resp in (engine.process_manager.get_responses().items()
+                         if inflight else ()):
+        kind = resp.get("type")
+        if kind == "error":
+            logger.error(f"NPC {npc_id}: {resp.get('error')}")
+            inflight.pop(npc_id, None)
+            continue
+        if kind != "action":
+            continue
+        sent = inflight.pop(npc_id, None)
+        npc = engine.npc_manager.get_npc(npc_id)
+        if sent is not None and npc and npc.is_active():
+            engine.action_router.process(npc, resp["action_data"])
+
+    # Send new commands — on the NPC cadence, not per frame (the process
+    # health sweep, one is_alive() per process, rides the same cadence)
+    if not engine._npc_turns_due():
+        return
+    engine.process_manager.check_process_health()
+    # Backpressure: requests unanswered past NPC_PROCESS_TIMEOUT are given
+    # up on — and the process, likely wedged in a hung LLM call, is killed
+    # and respawned so it can take commands again — and at most
+    # NPC_MAX_PROCESSES stay in flight, nearest NPCs first; the overflow
+    # acts heuristically this tick instead of queueing
+    now = time.monotonic()
+    for npc_id, sent in list(inflight.items()):
+        if now - sent > config.NPC_PROCESS_TIMEOUT:
+            del inflight[npc_id]
+            engine.process_manager.restart_process(npc_id)
+    px, py = engine.player.position
+
+    def nearest_first(entry):
+        x, y = entry[1].position
+        return (x - px) ** 2 + (y - py) ** 2
+
+    from engine.llm_budget import llm_action_allowed, heuristic_provider
+    state_for = _tick_states(engine)
+    for npc_id, npc in sorted(ambient_npcs(engine, skip=inflight),
+                              key=nearest_first):
+        nx, ny = npc.position
+        # Budget: only NPCs off cooldown burn a subprocess LLM call; the
+        # rest (and any NPC without a live process) act heuristically inline
+        granted = (len(inflight) < config.NPC_MAX_PROCESSES
+                   and llm_action_allowed(engine, npc))
+        if granted and engine.process_manager.send_command(npc_id, "get_action", {
+                "npc": npc.snapshot(),
+                "world_state": state_for(nx, ny),
+                "game_history": engine.memory_manager.get_recent_history(),
+                "visible_map": engine.world.map.get_visible_description(nx, ny),
+        }):
+            inflight[npc_id] = now
+            continue
+        try:
+            action = heuristic_provider(engine).get_npc_action(
+                npc, state_for(nx, ny),
+                engine.memory_manager.get_recent_history(),
+                engine.world.map.get_visible_description(nx, ny))
+            engine.action_router.process(npc, action)
+        except Exception as e:
+            logger.debug(f"Heuristic fallback error: {e}")
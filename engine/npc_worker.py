@@ -0,0 +1,92 @@
+"""Background NPC-action worker (split from npc_turns).
+
+With a network provider and no NPC subprocesses, the batch of granted LLM
+actions was fetched inline: a slow model stalled the frame — and the
+player's input — for the whole round-trip. `NPCActionWorker` takes the
+batch off the main thread. `submit` queues it, one daemon thread runs
+`LLMInterface.get_npc_actions`, and `drain` hands the finished
+(npc, action) pairs back for the main thread to route. Game state is only
+ever touched on the main thread; the worker reads per-NPC snapshots.
+
+Opt-in from the frame loops (`enable(engine)`, like projectile_anim's):
+tests and headless tools keep the synchronous batch.
+"""
+
+import copy
+import logging
+import queue
+import threading
+
+logger = logging.getLogger("llm_rpg.engine")
+
+
+def _snapshot(npc):
+    """A copy of `npc` for prompt building off-thread: the containers the
+    prompt (and the action-cache key) reads are copied so main-thread edits
+    cannot race the dump. metadata nests lists and dicts (dialog_log,
+    opinions), so it is copied all the way down."""
+    snap = copy.copy(npc)
+    snap.inventory = list(npc.inventory)
+    snap.personality = dict(npc.personality)
+    snap.goals = list(npc.goals)
+    snap.relationships = dict(npc.relationships)
+    snap.memories = list(npc.memories)
+    snap.metadata = copy.deepcopy(npc.metadata)
+    return snap
+
+
+class NPCActionWorker:
+    """One background thread fetching batched NPC actions."""
+
+    def __init__(self, llm_interface):
+        self.llm = llm_interface
+        self.pending = set()   # ids with a request out (main thread only)
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="npc-actions",
+                                        daemon=True)
+        self._thread.start()
+
+    def submit(self, npcs, requests) -> None:
+        """Queue one batch: `requests` are get_npc_action argument tuples,
+        `npcs` the live characters they were built for."""
+        self.pending.update(npc.id for npc in npcs)
+        self._jobs.put((list(npcs),
+                        [(_snapshot(r[0]),) + tuple(r[1:]) for r in requests]))
+
+    def drain(self):
+        """Finished (npc, action) pairs, oldest batch first. NPCs whose
+        batch failed are freed to ask again without an action."""
+        done = []
+        while True:
+            try:
+                npcs, actions = self._results.get_nowait()
+            except queue.Empty:
+                return done
+            for npc, action in zip(npcs, actions):
+                self.pending.discard(npc.id)
+                if action is not None:
+                    done.append((npc, action))
+
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            npcs, requests = job
+            try:
+                actions = self.llm.get_npc_actions(requests)
+            except Exception as e:
+                logger.error(f"NPC action batch failed: {e}")
+                actions = [None] * len(npcs)
+            self._results.put((npcs, actions))
+
+    def shutdown(self, timeout: float = 1.0) -> None:
+        self._jobs.put(None)
+        self._thread.join(timeout)
+
+
+def enable(engine) -> None:
+    """Fetch ambient NPC LLM actions in the background (frame loops)."""
+    if getattr(engine, "npc_worker", None) is None:
+        engine.npc_worker = NPCActionWorker(engine.llm_interface)
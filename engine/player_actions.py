@@ -6,6 +6,8 @@ Extracted from the legacy monolithic game_engine.py.
 import logging
 from typing import Optional
 
+from characters.character import item_name as name_of
+
 logger = logging.getLogger("llm_rpg.player_actions")
 
 
@@ -56,9 +58,9 @@ class PlayerActions:
 
         candidates = []
         if item_name:
+            wanted = item_name.lower()
             for it in ground:
-                it_name = it.name if hasattr(it, "name") else str(it)
-                if item_name.lower() in it_name.lower():
+                if wanted in name_of(it).lower():
                     candidates.append(it)
         else:
             candidates = list(ground)
@@ -73,7 +75,7 @@ class PlayerActions:
         candidates.sort(key=lambda it: 0 if hasattr(it, "id") else 1)
 
         item = candidates[0]
-        item_name_str = item.name if hasattr(item, "name") else str(item)
+        item_name_str = name_of(item)
         # Plain-string ground entries are body markers — they belong
         # on the ground (shrines revive from there), and they crashed
         # the inventory panel when carried (George)
@@ -131,10 +133,11 @@ class PlayerActions:
         if not player.inventory:
             return "You have nothing to drop."
 
-        for it in player.inventory:
-            it_name = it.name if hasattr(it, "name") else str(it)
-            if item_name.lower() in it_name.lower():
-                player.inventory.remove(it)
+        wanted = item_name.lower()
+        for i, it in enumerate(player.inventory):
+            it_name = name_of(it)
+            if wanted in it_name.lower():
+                del player.inventory[i]
                 self.engine.world.add_item_to_ground(it, *player.position)
                 msg = f"You drop {it_name}."
                 self.engine.memory_manager.add_event(msg)
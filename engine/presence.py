@@ -120,11 +120,11 @@ def npc_adjacent_to_player(engine, npc,
             zp = npc.position          # zone native (P9.1)
         if zp is None:
             return False
-        return ((zp[0] - px) ** 2 + (zp[1] - py) ** 2) ** 0.5 <= radius
+        return (zp[0] - px) ** 2 + (zp[1] - py) ** 2 <= radius * radius
     if is_indoors(engine, npc):
         return False
     nx, ny = npc.position
-    return ((nx - px) ** 2 + (ny - py) ** 2) ** 0.5 <= radius
+    return (nx - px) ** 2 + (ny - py) ** 2 <= radius * radius
 
 
 EARSHOT_RADIUS = 14
@@ -126,15 +126,14 @@ def _consume_one_ammo(engine, ammo_item) -> None:
 def _nearest_hostile(engine):
     px, py = engine.player.position
     best = None
-    best_d = 999
+    best_d = 999 * 999
     for npc in engine.npc_manager.npcs.values():
         if not npc.is_active():
             continue
         klass = getattr(npc.character_class, "value", "")
         if klass not in ("brigand", "troll", "monster"):
             continue
-        d = ((npc.position[0] - px) ** 2 +
-             (npc.position[1] - py) ** 2) ** 0.5
+        d = (npc.position[0] - px) ** 2 + (npc.position[1] - py) ** 2
         if d < best_d:
             best_d, best = d, npc
     return best
@@ -50,16 +50,13 @@ def hoist_or_deliver(engine) -> str:
 
 
 def _body_here(engine):
+    from engine.dying import ko_body_owner
     x, y = engine.player.position
     for spot in ((x, y), (x + 1, y), (x - 1, y), (x, y + 1),
                  (x, y - 1)):
         for it in engine.world.get_items_at(*spot):
             if isinstance(it, str) and it.endswith("'s body"):
-                name = it[:-7]
-                npc = next(
-                    (n for n in engine.npc_manager.npcs.values()
-                     if n.name == name and not n.is_active()
-                     and n.metadata.get("ko_until")), None)
+                npc = ko_body_owner(engine, it)
                 if npc is not None:
                     return npc, it, spot
     return None, None, None
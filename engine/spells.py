@@ -278,7 +278,7 @@ class SpellSystem:
                     tgt = self._resolve_target(caster, target_name, spell)
                     if tgt is None:
                         return f"No valid target for {spell.name}."
-                    if self._distance(caster, tgt) > spell.range:
+                    if not self._in_range(caster, tgt, spell.range):
                         return f"{spell.name}: target out of range."
                 caster.metadata["mana"] = mana - spell.mana_cost
                 msg = _ss.cast_shapeshift(self.engine, caster, spell, tgt)
@@ -320,8 +320,7 @@ class SpellSystem:
             return f"No valid target for {spell.name}."
 
         # Range check
-        d = self._distance(caster, target)
-        if d > spell.range:
+        if not self._in_range(caster, target, spell.range):
             return f"{spell.name}: target out of range."
         # Player attack spells need true line of sight (P8.7)
         if spell.damage and target.id != caster.id and \
@@ -470,8 +469,7 @@ class SpellSystem:
                 try:
                     locked = self.engine.targeting.current()
                     if locked is not None and \
-                            self._distance(caster, locked) <= \
-                            spell.range:
+                            self._in_range(caster, locked, spell.range):
                         return locked
                 except Exception:
                     pass
@@ -510,26 +508,28 @@ class SpellSystem:
                     except Exception:
                         pass
             nx, ny = ch.position
-            if ((nx - cx) ** 2 + (ny - cy) ** 2) ** 0.5 <= radius:
+            if (nx - cx) ** 2 + (ny - cy) ** 2 <= radius * radius:
                 out.append(ch)
         return out
 
     def _nearest_visible_hostile(self, caster, max_range: float):
-        nearest, best = None, max_range + 0.1
+        nearest, best = None, (max_range + 0.1) ** 2
+        cx, cy = caster.position
         for npc in self.engine.npc_manager.npcs.values():
             if npc.id == caster.id or not npc.is_active():
                 continue
             klass = getattr(npc.character_class, "value", "")
             if klass not in ("brigand", "troll", "monster"):
                 continue
-            d = self._distance(caster, npc)
+            d = (npc.position[0] - cx) ** 2 + (npc.position[1] - cy) ** 2
             if d < best:
                 best, nearest = d, npc
         return nearest
 
-    def _distance(self, a, b) -> float:
+    def _in_range(self, a, b, reach: float) -> bool:
+        """Euclidean range check on squared distances, sans sqrt."""
         return ((a.position[0] - b.position[0]) ** 2 +
-                (a.position[1] - b.position[1]) ** 2) ** 0.5
+                (a.position[1] - b.position[1]) ** 2) <= reach * reach
 
     def _on_kill(self, killer, victim, damage: int = 0) -> None:
         """Route through the ONE defeat handler (PT3.3 finding: spell
@@ -18,10 +18,13 @@ packs alike — pure geometry, zero LLM:
 `greedy_step` is the shared mover: one step toward a goal, sliding
 along obstacles (other axis first, then perpendicular) rather than
 stalling — the fix that killed the historic companion-follow flake.
+`straight_step` is its plain form for the ambient approach-to-partner.
 """
 
 from typing import Optional, Tuple
 
+from engine.directions import step_toward
+
 FOCUS_RADIUS = 8      # companions join the player's fight this far out
 
 _NEIGHBORS = ((1, 0), (-1, 0), (0, 1), (0, -1),
@@ -107,6 +110,14 @@ def path_step(wmap, char, goal: Tuple[int, int],
     return greedy_step(wmap, char, goal)
 
 
+def straight_step(wmap, char, goal: Tuple[int, int]) -> bool:
+    """One step toward goal along the dominant axis, no sliding — how the
+    action router and the economy close on a partner."""
+    x, y = char.position
+    dx, dy = step_toward((x, y), goal)
+    return wmap.move_character(char, x + dx, y + dy)
+
+
 def greedy_step(wmap, char, goal: Tuple[int, int]) -> bool:
     """One step toward goal, sliding along obstacles when blocked."""
     cx, cy = char.position
@@ -52,7 +52,7 @@ class SurfaceLayer:
         r = int(radius)
         for yy in range(y - r, y + r + 1):
             for xx in range(x - r, x + r + 1):
-                if ((xx - x) ** 2 + (yy - y) ** 2) ** 0.5 > radius:
+                if (xx - x) ** 2 + (yy - y) ** 2 > radius * radius:
                     continue
                 if self._paintable(xx, yy):
                     self.surfaces[(xx, yy)] = {
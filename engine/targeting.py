@@ -16,6 +16,7 @@ One target model for missiles AND spells:
 """
 
 import logging
+from math import hypot
 from typing import List, Optional, Tuple
 
 logger = logging.getLogger("llm_rpg.targeting")
@@ -24,7 +25,12 @@ MAX_RANGE = 12
 
 
 def _dist(a: Tuple[int, int], b: Tuple[int, int]) -> float:
-    return ((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2) ** 0.5
+    return hypot(a[0] - b[0], a[1] - b[1])
+
+
+def _dist2(a: Tuple[int, int], b: Tuple[int, int]) -> int:
+    """Squared distance, for range checks and nearest-first ordering."""
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2
 
 
 class TargetingSystem:
@@ -38,7 +44,7 @@ class TargetingSystem:
         engine = self.engine
         ppos = engine.player.position
         tpos = target.position
-        if _dist(ppos, tpos) > MAX_RANGE:
+        if _dist2(ppos, tpos) > MAX_RANGE * MAX_RANGE:
             return False, f"{target.name} is out of range."
         zone = None
         try:
@@ -90,8 +96,8 @@ class TargetingSystem:
             ok, _ = self.can_hit(npc)
             if ok:
                 out.append(npc)
-        out.sort(key=lambda n: _dist(self.engine.player.position,
-                                     n.position))
+        out.sort(key=lambda n: _dist2(self.engine.player.position,
+                                      n.position))
         return out
 
     def current(self):
@@ -131,7 +131,7 @@ class TileDamage:
         r = int(radius) + 1
         for y in range(cy - r, cy + r + 1):
             for x in range(cx - r, cx + r + 1):
-                if ((x - cx) ** 2 + (y - cy) ** 2) ** 0.5 > radius:
+                if (x - cx) ** 2 + (y - cy) ** 2 > radius * radius:
                     continue
                 msg = self.damage_tile(x, y, amount, attack_type)
                 if msg and "rubble" in msg or \
@@ -126,8 +126,8 @@ class TrespassSystem:
             owner.relationships[pid] = \
                 owner.relationships.get(pid, 0) + RELATIONSHIP_HIT
             try:
-                owner.memories.append(
-                    f"{engine.player.name} broke into my home.")
+                owner.add_memory(
+                    f"{engine.player.name} broke into my home.", 5)
             except Exception:
                 pass
 
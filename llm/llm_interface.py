@@ -9,7 +9,9 @@ The legacy positional API LLMInterface(model_name=...) is preserved so
 existing code (and the NPC subprocess) keeps working.
 """
 
+import json
 import logging
+from collections import OrderedDict
 from typing import Any, Dict, List
 
 import config
@@ -17,6 +19,10 @@ from llm.providers import get_provider
 
 logger = logging.getLogger("llm_rpg.llm")
 
+# Budget bookkeeping (engine/llm_budget.py) stamped into NPC metadata on
+# every grant; it never reaches a prompt's meaning, so not the cache key
+_UNKEYED_METADATA = ("last_llm_action", "greet_cache")
+
 
 class LLMInterface:
     """High-level LLM API used throughout the engine.
@@ -47,7 +53,11 @@ class LLMInterface:
 
         self.provider = get_provider(self.provider_name, **provider_kwargs)
         # Observability: how many calls of each kind this session (P3.9)
-        self.call_counts = {"response": 0, "action": 0, "dialog": 0}
+        self.call_counts = {"response": 0, "action": 0, "dialog": 0,
+                            "action_cached": 0}
+        # Prompt fingerprint -> action, least recently used first. Only
+        # consulted for providers that set `cache_actions`
+        self._action_cache: "OrderedDict[tuple, Dict[str, str]]" = OrderedDict()
         logger.info(
             f"LLMInterface initialized (provider={self.provider.name}, model={self.model_name})"
         )
@@ -61,13 +71,75 @@ class LLMInterface:
         return self.provider.generate_response(prompt, system_prompt,
                                                max_tokens, temperature)
 
+    @staticmethod
+    def _action_key(character: Any, world_state: Dict[str, Any],
+                    game_history: List[str], visible_map: str) -> tuple:
+        """Everything an action prompt is built from: the character sheet
+        (less the budget stamps), the last five memory events, location,
+        time of day, the visible map and the last five history lines.
+        Characters carry no version counter (position, memories and goals
+        are assigned directly all over the engine), so the state itself is
+        the key. Off the main thread `character` is NPCActionWorker's
+        snapshot, never the live NPC."""
+        state = character.to_dict()
+        meta = state.get("metadata") or {}
+        state["metadata"] = {k: v for k, v in meta.items()
+                             if k not in _UNKEYED_METADATA}
+        memories = tuple(m.get("event", "")
+                         for m in (character.memories or [])[-5:])
+        return (character.id,
+                json.dumps(state, sort_keys=True, default=str), memories,
+                world_state.get("current_location"),
+                world_state.get("time_of_day"),
+                visible_map, tuple(map(str, game_history[-5:])))
+
+    def _cached_action(self, key: tuple):
+        action = self._action_cache.get(key)
+        if action is None:
+            return None
+        self._action_cache.move_to_end(key)
+        self.call_counts["action_cached"] += 1
+        return dict(action)
+
+    def _remember_action(self, key: tuple, action: Dict[str, str]) -> None:
+        self._action_cache[key] = dict(action)
+        self._action_cache.move_to_end(key)
+        while len(self._action_cache) > config.NPC_ACTION_CACHE_SIZE:
+            self._action_cache.popitem(last=False)
+
     def get_npc_action(self, character: Any, world_state: Dict[str, Any],
                        game_history: List[str], visible_map: str,
                        system_prompt: str = None) -> Dict[str, str]:
         # system_prompt kwarg retained for compatibility with older callers
-        self.call_counts["action"] += 1
-        return self.provider.get_npc_action(character, world_state,
-                                            game_history, visible_map)
+        request = (character, world_state, game_history, visible_map)
+        if not getattr(self.provider, "cache_actions", False):
+            self.call_counts["action"] += 1
+            return self.provider.get_npc_action(*request)
+        key = self._action_key(*request)
+        action = self._cached_action(key)
+        if action is None:
+            self.call_counts["action"] += 1
+            action = self.provider.get_npc_action(*request)
+            self._remember_action(key, action)
+        return action
+
+    def get_npc_actions(self, requests: List[tuple]) -> List[Dict[str, str]]:
+        """Batch form of get_npc_action: one (character, world_state,
+        game_history, visible_map) tuple per NPC, results in order. With
+        action caching only the requests that miss reach the provider."""
+        if not getattr(self.provider, "cache_actions", False):
+            self.call_counts["action"] += len(requests)
+            return self.provider.get_npc_actions(requests)
+        keys = [self._action_key(*r) for r in requests]
+        actions = [self._cached_action(k) for k in keys]
+        misses = [i for i, a in enumerate(actions) if a is None]
+        if misses:
+            self.call_counts["action"] += len(misses)
+            fresh = self.provider.get_npc_actions([requests[i] for i in misses])
+            for i, action in zip(misses, fresh):
+                self._remember_action(keys[i], action)
+                actions[i] = action
+        return actions
 
     def generate_npc_dialog(self, character: Any, player_message: str,
                             recent_history: List[str]) -> str:
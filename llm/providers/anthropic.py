@@ -5,7 +5,6 @@ Requires the `anthropic` SDK and an ANTHROPIC_API_KEY env variable.
 Falls back gracefully if the package isn't installed.
 """
 
-import json
 import logging
 import os
 from typing import Any, Dict, List
@@ -18,6 +17,8 @@ logger = logging.getLogger("llm_rpg.providers.anthropic")
 
 class AnthropicProvider(LLMProvider):
     name = "anthropic"
+    concurrent_actions = True   # network-bound: batch concurrently
+    cache_actions = True        # ...and skip repeats of an unchanged prompt
 
     def __init__(self, model: str = "claude-haiku-4-5-20251001",
                  api_key: str = None, **_):
@@ -49,7 +50,7 @@ class AnthropicProvider(LLMProvider):
     def get_npc_action(self, character: Any, world_state: Dict[str, Any],
                        game_history: List[str], visible_map: str) -> Dict[str, str]:
         prompt = (
-            f"CHARACTER:\n{json.dumps(character.to_dict(), indent=2)}\n\n"
+            f"CHARACTER:\n{self.character_sheet(character)}\n\n"
             f"LOCATION: {world_state.get('current_location', 'wilderness')}\n"
             f"TIME OF DAY: {world_state.get('time_of_day', 'day')}\n\n"
             f"VISIBLE:\n{visible_map}\n\nRECENT:\n{game_history[-5:]}\n\n"
@@ -68,7 +69,7 @@ class AnthropicProvider(LLMProvider):
             "Stay in character. Reply in one or two sentences."
         )
         prompt = (
-            f"CHARACTER:\n{json.dumps(character.to_dict(), indent=2)}\n\n"
+            f"CHARACTER:\n{self.character_sheet(character)}\n\n"
             f"RECENT:\n{recent_history[-3:] if recent_history else []}\n\n"
             f"PLAYER: \"{player_message}\"\n\nReply:"
         )
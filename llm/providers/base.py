@@ -5,19 +5,47 @@ A provider implements 3 entry points used by the game engine:
 - generate_response(prompt, system_prompt, ...) — generic completion
 - get_npc_action(character, world_state, history, visible_map) — structured action dict
 - generate_npc_dialog(character, player_message, history) — dialog string
+
+get_npc_actions(requests) batches get_npc_action; network providers set
+`concurrent_actions` so a batch goes out as concurrent requests.
 """
 
+import json
 import logging
+import re
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List
 
 logger = logging.getLogger("llm_rpg.providers.base")
 
+# The slow-changing half of an NPC's sheet: who they are, not where or
+# how hurt they are. Its JSON is cached per NPC (see character_sheet)
+_PROFILE_KEYS = ("id", "name", "class", "race", "description", "faction",
+                 "symbol")
+_MAX_PROFILES = 1024
+_profiles: Dict[str, tuple] = {}   # character id -> (profile, text)
+# The STATE half's indented text, keyed on its compact JSON: the C encoder
+# only handles indent=None, so the key costs a fraction of the rendering
+_states: Dict[str, tuple] = {}     # character id -> (compact, indented)
+
+# One "FIELD: value" line of an action response; a later repeat wins
+_ACTION_FIELD = re.compile(
+    r"^[^\S\n]*(ACTION|TARGET|DIALOG|THOUGHTS|EMOTION|GOAL_UPDATE):(.*)$",
+    re.IGNORECASE | re.MULTILINE)
+
 
 class LLMProvider(ABC):
     """Abstract LLM provider."""
 
     name: str = "base"
+    # True for I/O-bound providers: get_npc_actions fans a batch out over
+    # threads instead of running it one request at a time
+    concurrent_actions: bool = False
+    max_concurrent_actions: int = 4
+    # True for paid/slow providers: LLMInterface reuses the last action when
+    # an NPC's prompt inputs have not changed since it was generated
+    cache_actions: bool = False
 
     @abstractmethod
     def generate_response(
@@ -48,33 +76,56 @@ class LLMProvider(ABC):
     ) -> str:
         ...
 
+    def get_npc_actions(self, requests: List[tuple]) -> List[Dict[str, str]]:
+        """Actions for a batch of (character, world_state, game_history,
+        visible_map) requests, in request order."""
+        if not self.concurrent_actions or len(requests) < 2:
+            return [self.get_npc_action(*r) for r in requests]
+        workers = min(self.max_concurrent_actions, len(requests))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(lambda r: self.get_npc_action(*r), requests))
+
     # Shared helpers ----------------------------------------------------------
 
+    @staticmethod
+    def character_sheet(character: Any) -> str:
+        """The CHARACTER block of NPC prompts: a frozen profile (identity,
+        description, personality) then the live STATE. The profile text is
+        formatted once per NPC and reused until one of its fields changes,
+        so it also stays a byte-identical prefix across calls for servers
+        that reuse a cached prompt prefix (Ollama's KV cache). The STATE
+        text is likewise reused while the NPC has not changed."""
+        state = character.to_dict()
+        personality = state.pop("personality") or {}
+        profile = {k: state.pop(k) for k in _PROFILE_KEYS}
+        # Lists as tuples: the stored copy must not alias live containers
+        profile["personality"] = {
+            k: tuple(v) if isinstance(v, list) else v
+            for k, v in personality.items() if k != "current_emotion"}
+        if personality.get("current_emotion"):
+            state["current_emotion"] = personality["current_emotion"]
+        cached = _profiles.get(character.id)
+        if cached is None or cached[0] != profile:
+            if len(_profiles) >= _MAX_PROFILES:
+                _profiles.clear()
+            cached = _profiles[character.id] = (
+                profile, json.dumps(profile, indent=2))
+        compact = json.dumps(state)
+        shown = _states.get(character.id)
+        if shown is None or shown[0] != compact:
+            if len(_states) >= _MAX_PROFILES:
+                _states.clear()
+            shown = _states[character.id] = (
+                compact, json.dumps(state, indent=2))
+        return f"{cached[1]}\n\nSTATE:\n{shown[1]}"
+
     @staticmethod
     def parse_action_response(response: str) -> Dict[str, str]:
         """Parse 'ACTION: ...\\nTARGET: ...' style responses into a dict."""
-        data = {
-            "action": "",
-            "target": "",
-            "dialog": "",
-            "thoughts": "",
-            "emotion": "",
-            "goal_update": "",
-        }
-        keys = {
-            "ACTION:": "action",
-            "TARGET:": "target",
-            "DIALOG:": "dialog",
-            "THOUGHTS:": "thoughts",
-            "EMOTION:": "emotion",
-            "GOAL_UPDATE:": "goal_update",
-        }
-        for line in response.split("\n"):
-            line = line.strip()
-            for prefix, key in keys.items():
-                if line.upper().startswith(prefix):
-                    data[key] = line[len(prefix):].strip()
-                    break
+        data = dict.fromkeys(("action", "target", "dialog", "thoughts",
+                              "emotion", "goal_update"), "")
+        for m in _ACTION_FIELD.finditer(response):
+            data[m.group(1).lower()] = m.group(2).strip()
 
         if not data["action"]:
             if "wait" in response.lower():
@@ -79,6 +79,9 @@ _GOAL_REPLIES = {
 
 _EMOTIONS = ["calm", "wary", "cheerful", "tired", "curious", "suspicious", "angry"]
 
+# Representative hour for each time-of-day label
+_HOUR_OF_DAY = {"morning": 9, "afternoon": 14, "evening": 19, "night": 23}
+
 
 # ---------------------------------------------------------------------------
 
@@ -373,10 +376,7 @@ class HeuristicProvider(LLMProvider):
     def _parse_hour(self, world_state: Dict[str, Any]) -> int:
         """Best-effort extraction of the current hour."""
         tod = (world_state or {}).get("time_of_day", "")
-        # Map to representative hours
-        mapping = {"morning": 9, "afternoon": 14,
-                   "evening": 19, "night": 23}
-        return mapping.get(tod, 12)
+        return _HOUR_OF_DAY.get(tod, 12)
 
     # Dialog -----------------------------------------------------------------
 
@@ -5,11 +5,11 @@ Connects to a locally-running Ollama instance.
 Requires the `requests` package (already a project dep).
 """
 
-import json
 import logging
 from typing import Any, Dict, List
 
 import requests
+from requests.adapters import HTTPAdapter
 
 import config
 from .base import LLMProvider
@@ -21,12 +21,21 @@ class OllamaProvider(LLMProvider):
     """Ollama provider — local LLM via HTTP."""
 
     name = "ollama"
+    concurrent_actions = True   # network-bound: batch concurrently
+    cache_actions = True        # ...and skip repeats of an unchanged prompt
 
     def __init__(self, model: str = None, api_url: str = None,
                  timeout: float = 30.0, **_):
         self.model = model or config.DEFAULT_MODEL
         self.api_url = api_url or config.LLM_API_URL
         self.timeout = timeout
+        # One keep-alive session for every call: NPC prompts are short, so a
+        # fresh TCP connect per request was a large share of each round trip
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1,
+                              pool_maxsize=config.NPC_MAX_PROCESSES)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
         logger.info(f"OllamaProvider initialized (model={self.model})")
 
     def generate_response(self, prompt: str, system_prompt: str = "",
@@ -41,7 +50,8 @@ class OllamaProvider(LLMProvider):
             "temperature": temperature,
         }
         try:
-            r = requests.post(self.api_url, json=payload, timeout=self.timeout)
+            r = self.session.post(self.api_url, json=payload,
+                                  timeout=self.timeout)
             r.raise_for_status()
             return r.json().get("response", "")
         except Exception as e:
@@ -51,7 +61,7 @@ class OllamaProvider(LLMProvider):
     def get_npc_action(self, character: Any, world_state: Dict[str, Any],
                        game_history: List[str], visible_map: str) -> Dict[str, str]:
         prompt = (
-            f"CHARACTER:\n{json.dumps(character.to_dict(), indent=2)}\n\n"
+            f"CHARACTER:\n{self.character_sheet(character)}\n\n"
             f"LOCATION: {world_state.get('current_location', 'wilderness')}\n"
             f"TIME OF DAY: {world_state.get('time_of_day', 'day')}\n\n"
             f"VISIBLE ENVIRONMENT:\n{visible_map}\n\n"
@@ -73,7 +83,7 @@ class OllamaProvider(LLMProvider):
             "Stay in character. Brief and conversational."
         )
         prompt = (
-            f"CHARACTER:\n{json.dumps(character.to_dict(), indent=2)}\n\n"
+            f"CHARACTER:\n{self.character_sheet(character)}\n\n"
             f"RECENT CONVERSATION:\n{recent_history[-3:] if recent_history else []}\n\n"
             f"PLAYER SAYS: \"{player_message}\"\n\n"
             f"How does {character.name} respond?"
@@ -82,3 +92,6 @@ class OllamaProvider(LLMProvider):
         if response.startswith('"') and response.endswith('"'):
             response = response[1:-1]
         return response or "..."
+
+    def shutdown(self) -> None:
+        self.session.close()
@@ -4,7 +4,6 @@ OpenAI Chat Completions provider.
 Requires the `openai` SDK and an OPENAI_API_KEY env variable.
 """
 
-import json
 import logging
 import os
 from typing import Any, Dict, List
@@ -17,6 +16,8 @@ logger = logging.getLogger("llm_rpg.providers.openai")
 
 class OpenAIProvider(LLMProvider):
     name = "openai"
+    concurrent_actions = True   # network-bound: batch concurrently
+    cache_actions = True        # ...and skip repeats of an unchanged prompt
 
     def __init__(self, model: str = "gpt-4o-mini", api_key: str = None, **_):
         try:
@@ -49,7 +50,7 @@ class OpenAIProvider(LLMProvider):
     def get_npc_action(self, character: Any, world_state: Dict[str, Any],
                        game_history: List[str], visible_map: str) -> Dict[str, str]:
         prompt = (
-            f"CHARACTER:\n{json.dumps(character.to_dict(), indent=2)}\n\n"
+            f"CHARACTER:\n{self.character_sheet(character)}\n\n"
             f"LOCATION: {world_state.get('current_location', 'wilderness')}\n"
             f"VISIBLE:\n{visible_map}\n\nRECENT:\n{game_history[-5:]}\n\n"
             f"What does {character.name} do next?"
@@ -180,6 +180,8 @@ def main() -> int:
     try:
         ui.start()
         if args.ui == "terminal":
+            from engine import npc_worker
+            npc_worker.enable(engine)   # LLM NPC actions off the input loop
             while engine.running:
                 engine.process_npc_turns_async()
                 ui.update()
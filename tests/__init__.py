@@ -37,9 +37,12 @@ _random.seed(0xA17E5)
 
 def clean_dm_library():
     """Wipe the per-run DM library (tests that define ids call this in
-    setUp — the Legendarium intentionally persists across engines)."""
+    setUp — the Legendarium intentionally persists across engines). Wipes
+    whichever library is ACTIVE: a test module may point the env at its
+    own temp folder at import, and that one is where engines now write."""
     import glob
-    for path in glob.glob(os.path.join(_dm_lib, "*.json")):
+    lib = os.environ.get("LLM_RPG_DM_LIBRARY") or _dm_lib
+    for path in glob.glob(os.path.join(lib, "*.json")):
         try:
             os.remove(path)
         except OSError:
@@ -36,6 +36,26 @@ class TestTargeting(unittest.TestCase):
         self.assertIs(self.e.find_character("player"), self.e.player)
         self.assertIs(self.e.find_character("the traveler"), self.e.player)
 
+    def test_single_letter_finds_by_symbol_either_case(self):
+        g = build_monster("wraith", (self.e.player.position[0] + 2,
+                                     self.e.player.position[1]))
+        g.name, g.id, g.symbol = "Qarth", "q_x", "Q"
+        self.e.npc_manager.add_npc(g)
+        self.assertIs(self.e.find_character("q"), g)
+        self.assertIs(self.e.find_character("Q"), g)
+
+    def test_loose_name_finds_an_npc_added_after_a_removal(self):
+        px, py = self.e.player.position
+        old = build_monster("wraith", (px + 2, py))
+        old.name, old.id = "Alda Reed", "alda_x"
+        self.e.npc_manager.add_npc(old)
+        self.assertIs(self.e.find_character("alda"), old)
+        self.e.npc_manager.remove_npc(old.id)
+        new = build_monster("wraith", (px + 2, py))
+        new.name, new.id = "Cyril Moss", "cyril_x"
+        self.e.npc_manager.add_npc(new)         # roster back to its old size
+        self.assertIs(self.e.find_character("cyril"), new)
+
 
 class TestZombieReaper(unittest.TestCase):
     def test_zero_hp_zombie_is_reaped(self):
@@ -87,6 +87,44 @@ class TestAwayDigest(unittest.TestCase):
         self.engine.roster.set_away(self.p, True)
         self.assertIsNone(build_digest(self.engine, self.p))
 
+    def test_deeds_found_after_the_log_wraps(self):
+        mm = self.engine.memory_manager
+        self.engine.roster.set_away(self.p, True)
+        self._deed("slew the marsh wyrm.")
+        for i in range(mm.max_history - 5):
+            mm.add_event(f"Filler {i}")
+        self.assertEqual(len(mm.game_history), mm.max_history)
+        self.assertIn("marsh wyrm", " ".join(build_digest(self.engine, self.p)[1]))
+
+
+class TestEventLog(unittest.TestCase):
+    def test_bounded_and_list_like(self):
+        from engine.memory_manager import MemoryManager
+        mm = MemoryManager(max_history=5)
+        for i in range(8):
+            mm.add_event(f"e{i}")
+        self.assertEqual([e["event"] for e in mm.game_history[-2:]],
+                         ["e6", "e7"])
+        self.assertEqual(mm.game_history[0]["event"], "e3")
+        self.assertEqual(mm.get_recent_history(3), ["e5", "e6", "e7"])
+        self.assertEqual(mm.get_recent_history(50), [f"e{i}" for i in range(3, 8)])
+        mm.game_history = [{"event": "loaded"}] * 9    # as save_load does
+        self.assertEqual(len(mm.game_history), 5)
+        mm.game_history.append({"event": "direct"})    # as topics does
+        self.assertEqual(mm.get_recent_history(1), ["direct"])
+
+    def test_name_scans_are_case_blind_newest_first(self):
+        from engine.memory_manager import MemoryManager
+        mm = MemoryManager(max_history=10)
+        for ev in ("Goren pours ale.", "A crow calls.",
+                   "GOREN laughs at the forge.", "goren sleeps."):
+            mm.add_event(ev)
+        self.assertEqual(mm.get_character_history("Goren", count=2),
+                         ["goren sleeps.", "GOREN laughs at the forge."])
+        self.assertEqual(mm.get_location_history("the Forge"),
+                         ["GOREN laughs at the forge."])
+        self.assertEqual(mm.get_character_history("Mira"), [])
+
 
 if __name__ == "__main__":
     unittest.main()
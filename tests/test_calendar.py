@@ -58,6 +58,17 @@ class TestCalendar(unittest.TestCase):
         d = date_from_minutes(minutes_from_date(1, 1, 1, hour=23))
         self.assertEqual(d.time_of_day(), "night")
 
+    def test_world_reuses_date_until_time_moves(self):
+        from world.world import World
+        world = World(10, 10)
+        world.time = minutes_from_date(1, 1, 1, hour=13)
+        first = world.get_date()
+        self.assertIs(world.get_date(), first)
+        world.time += 6 * 60                   # direct edits count too
+        self.assertEqual(world.get_time_of_day(), "evening")
+        world.advance_time(4 * 60)
+        self.assertEqual(world.get_date().hour, 23)
+
     def test_season_tint_clamps(self):
         rgb = apply_season_tint((255, 255, 255), Season.WINTER)
         for v in rgb:
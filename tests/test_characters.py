@@ -21,6 +21,11 @@ class TestCharacterTypes:
         assert CharacterRace.HUMAN.value == "human"
         assert CharacterRace.ELF.value == "elf"
 
+    def test_value_tables_cover_every_member(self):
+        from characters.character_types import CLASS_VALUES, RACE_VALUES
+        assert all(CLASS_VALUES[m] == m.value for m in CharacterClass)
+        assert all(RACE_VALUES[m] == m.value for m in CharacterRace)
+
     def test_alignment_values(self):
         assert Alignment.LAWFUL_GOOD.value == "lawful good"
         assert Alignment.CHAOTIC_EVIL.value == "chaotic evil"
@@ -59,11 +64,94 @@ class TestCharacter:
         assert c.memories[0]["event"] == "Met a stranger"
         assert c.memories[0]["importance"] == 2
 
+    def test_memory_entries_read_like_legacy_dicts(self):
+        from characters.character import Memory
+        c = self._make_character()
+        c.add_memory("Saw a comet", importance=3)
+        m = c.memories[0]
+        assert isinstance(m, Memory)
+        assert m.get("game_time") is None
+        assert m.get("missing", "x") == "x"
+        with pytest.raises(KeyError):
+            m["game_time"]
+        d = m.to_dict()
+        assert set(d) == {"event", "importance", "time"}
+        assert Memory.from_dict(d).to_dict() == d
+
+    def test_memories_kept_in_importance_order(self):
+        c = self._make_character()
+        c.add_memory("first low", importance=1)
+        c.add_memory("high", importance=5)
+        c.add_memory("second low", importance=1)
+        c.add_memory("mid", importance=3)
+        assert [m["event"] for m in c.memories] == [
+            "high", "mid", "first low", "second low"]
+        first, second = c.memories[2]["time"], c.memories[3]["time"]
+        assert isinstance(first, int) and first < second
+
+    def test_add_memory_orders_unsorted_remembered_entries(self):
+        # npc_memory.remember appends without sorting; the next add_memory
+        # must still leave the whole list in importance order
+        from engine.npc_memory import remember
+        c = self._make_character()
+        remember(c, "low", 1, world_time=10)
+        remember(c, "high", 8, world_time=20)
+        c.add_memory("mid", importance=4)
+        assert [m["event"] for m in c.memories] == ["high", "mid", "low"]
+
+    def test_snapshot_is_detached_and_picklable(self):
+        import dataclasses
+        import pickle
+        c = self._make_character(personality={"traits": ["brave"]},
+                                 goals=["find the sword"], position=(3, 4))
+        for i in range(7):
+            c.add_memory(f"memory {i}", importance=1)
+        snap = c.snapshot()
+        c.position = (5, 5)
+        c.goals.append("rest")
+        c.personality["traits"].append("rash")
+        assert snap.position == (3, 4)
+        assert snap.goals == ("find the sword",)
+        assert snap.personality == {"traits": ["brave"]}
+        assert [m["event"] for m in snap.memories] == [
+            f"memory {i}" for i in range(2, 7)]
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snap.hp = 0
+        assert pickle.loads(pickle.dumps(snap)) == snap
+
     def test_inventory_starts_empty(self):
         c = self._make_character()
         assert c.inventory == []
         assert c.gold == 0
 
+    def test_has_item_matches_named_and_plain_items(self):
+        from items.item import Item, ItemType
+        c = self._make_character()
+        c.inventory.extend(["torch", Item(id="rope", name="Rope",
+                                          description="", item_type=ItemType.MISC)])
+        assert c.has_item("torch")
+        assert c.has_item("Rope")
+        assert not c.has_item("lantern")
+        assert c.find_item_index("Rope") == 1
+
+    def test_remove_item_by_name_takes_first_match(self):
+        from items.item import Item
+        c = self._make_character()
+        first, second = Item(id="r1", name="Rope"), Item(id="r2", name="Rope")
+        c.inventory.extend(["torch", first, second])
+        assert c.remove_item("Rope")
+        assert c.inventory == ["torch", second]
+        assert not c.remove_item("lantern")
+
+    def test_to_dict_names_inventory_and_shares_metadata(self):
+        from items.item import Item
+        c = self._make_character()
+        c.inventory.extend(["torch", Item(id="rope", name="Rope")])
+        d = c.to_dict()
+        assert d["inventory"] == ["torch", "Rope"]
+        assert d["faction"] == "neutral"
+        assert d["metadata"] is c.metadata
+
     def test_default_status(self):
         c = self._make_character()
         assert c.status == "alive"
@@ -72,6 +160,40 @@ class TestCharacter:
         c = self._make_character()
         assert c.position == (0, 0)
 
+    def test_stat_modifier_reads_live_stats(self):
+        c = self._make_character(strength=14, dexterity=7)
+        assert c.get_stat_modifier("strength") == 2
+        assert c.get_stat_modifier("Dexterity") == -2
+        c.strength = 18
+        assert c.get_stat_modifier("STRENGTH") == 4
+        assert c.get_stat_modifier("luck") == 0
+
+    def test_modify_relationship_clamps(self):
+        c = self._make_character()
+        c.modify_relationship("x", 150)
+        assert c.get_relationship("x") == 100
+        c.modify_relationship("x", -250)
+        assert c.get_relationship("x") == -100
+        c.modify_relationship("x", 30)
+        assert c.get_relationship("x") == -70
+
+    def test_relationship_description_bands(self):
+        c = self._make_character()
+        expected = {100: "close friend", 80: "close friend", 79: "friend",
+                    60: "friend", 30: "acquaintance", 0: "neutral",
+                    -1: "dislikes", -30: "dislikes", -31: "enemy",
+                    -60: "enemy", -61: "sworn enemy", -100: "sworn enemy"}
+        for value, label in expected.items():
+            c.relationships["x"] = value
+            assert c.get_relationship_description("x") == label, value
+
+    def test_slotted_with_late_bound_fields_declared(self):
+        c = self._make_character()
+        assert not hasattr(c, "__dict__")
+        assert c.home_location == ""
+        assert c.last_position is None
+        assert c.equipment is None
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
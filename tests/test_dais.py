@@ -44,7 +44,11 @@ class TestDaisDraw(unittest.TestCase):
 
     def test_draw_all_marks_waystones(self):
         import tempfile
-        os.environ.pop("LLM_RPG_NO_ADVENTURERS", None)
+        flag = os.environ.pop("LLM_RPG_NO_ADVENTURERS", None)
+        # restore the suite default, else every later test runs with the
+        # adventurer band roaming (and dig/log tests see their moves)
+        self.addCleanup(os.environ.__setitem__,
+                        "LLM_RPG_NO_ADVENTURERS", flag or "1")
         os.environ.setdefault("LLM_RPG_DM_LIBRARY",
                               tempfile.mkdtemp(prefix="llmrpg_dais_"))
         pygame.display.set_mode((320, 240))
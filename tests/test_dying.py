@@ -185,6 +185,17 @@ class TestKnockouts(unittest.TestCase):
         self.assertEqual(npc.gold, 0)
         self.assertLess(npc.get_relationship(self.player.id), 0)
 
+    def test_a_body_belongs_to_the_namesake_out_cold(self):
+        from engine.dying import ko_body_owner
+        npc = self._person()
+        twin = self.engine.npc_manager.create_random_npc()
+        twin.name = npc.name                    # up and about
+        self.engine.combat_system._handle_defeat(
+            self.player, npc, damage=5)
+        self.assertIs(ko_body_owner(self.engine, f"{npc.name}'s body"), npc)
+        self.assertIsNone(
+            ko_body_owner(self.engine, f"{npc.name.upper()}'s body"))
+
     def test_the_beaten_wake_with_grudges(self):
         from engine.dying import wake_the_fallen
         npc = self._person()
@@ -51,6 +51,51 @@ class TestEngineSmoke(unittest.TestCase):
                     "recent_events", "turn", "quests", "xp"):
             self.assertIn(key, s)
 
+    def test_game_state_reused_between_turns(self):
+        from unittest.mock import patch
+        first = self.engine.get_game_state()
+        with patch.object(self.engine.quest_manager, "summary",
+                          side_effect=AssertionError("recomputed")):
+            again = self.engine.get_game_state()
+        self.assertEqual(again["quests"], first["quests"])
+        self.engine.memory_manager.add_event("A raven lands.")
+        live = self.engine.get_game_state()
+        self.assertIn("A raven lands.", str(live["recent_events"]))
+        self.engine.move_player(0, 1)
+        self.assertEqual(self.engine.get_game_state()["turn"],
+                         self.engine.turn_counter)
+
+    def test_game_state_npcs_follow_a_same_size_roster_swap(self):
+        mgr = self.engine.npc_manager
+        goren = mgr.get_npc("tavernkeeper_01")
+        self.engine.get_game_state()
+        mgr.remove_npc(goren.id)
+        stranger = mgr.create_random_npc()      # roster back to its old size
+        npcs = self.engine.get_game_state()["npcs"]
+        self.assertNotIn(goren, npcs)
+        self.assertIn(stranger, npcs)
+
+    def test_visible_map_follows_npcs_moving_between_turns(self):
+        wmap = self.engine.world.map
+        x, y = self.engine.player.position
+        goren = self.engine.npc_manager.get_npc("tavernkeeper_01")
+        wmap.remove_character(goren)
+        before = self.engine.get_game_state()["visible_map"]
+        wmap.place_character(goren, x + 1, y)   # an idle-tick NPC step
+        after = self.engine.get_game_state()["visible_map"]
+        self.assertNotEqual(before, after)
+
+    def test_map_moves_find_a_character_whose_position_drifted(self):
+        wmap = self.engine.world.map
+        goren = self.engine.npc_manager.get_npc("tavernkeeper_01")
+        start = goren.position
+        self.assertIs(wmap.characters.get(start), goren)
+        goren.position = (0, 0)                 # assigned behind the map's back
+        self.assertEqual(wmap._tile_of(goren), start)
+        self.assertTrue(wmap.remove_character(goren))
+        self.assertNotIn(start, wmap.characters)
+        self.assertFalse(wmap.remove_character(goren))
+
     def test_pickup_and_drop(self):
         from items.item_registry import create_item
         item = create_item("potion")
@@ -66,6 +111,30 @@ class TestEngineSmoke(unittest.TestCase):
         drop_msg = self.engine.drop_item("Healing Potion")
         self.assertIn("drop", drop_msg.lower())
 
+    def test_npc_gift_hands_over_the_matched_slot(self):
+        from items.item_registry import create_item
+        goren = self.engine.npc_manager.get_npc("tavernkeeper_01")
+        smith = self.engine.npc_manager.get_npc("blacksmith_01")
+        bread, potion = create_item("bread"), create_item("potion")
+        goren.inventory[:] = [bread, potion]
+        self.assertEqual(
+            self.engine.economy_system._inventory_index(goren, "heal"), 1)
+        self.assertTrue(self.engine.economy_system._give(goren, smith,
+                                                         "healing"))
+        self.assertEqual(goren.inventory, [bread])
+        self.assertTrue(any(it is potion for it in smith.inventory))
+        self.assertEqual(
+            self.engine.economy_system._inventory_index(goren, "sword"), -1)
+
+    def test_trade_target_prefers_from_then_to_then_with(self):
+        parse = self.engine.economy_system._parse_target
+        self.assertEqual(parse("sword with gems from Durgan"),
+                         ("sword with gems", "Durgan"))
+        self.assertEqual(parse(" ale to Mira with a wink "),
+                         ("ale", "Mira with a wink"))
+        self.assertEqual(parse("bread with Goren"), ("bread", "Goren"))
+        self.assertEqual(parse(" tomorrow "), ("tomorrow", None))
+
     def test_use_potion_heals(self):
         from items.item_registry import create_item
         self.engine.player.hp = 5
@@ -194,11 +194,12 @@ class TestLiveInIt(unittest.TestCase):
         homestead.deposit(self.engine, herbs.name)
         # the stored payload is plain JSON -> save-safe
         json.dumps(self.p.metadata["home_storage"])
-        self.engine.save_game(name="p157_roundtrip")
+        path = _os.path.join(_tempfile.mkdtemp(), "p157_roundtrip.json")
+        self.engine.save_game(name=path)
         e2 = GameEngine(llm_provider="heuristic",
                         enable_npc_processes=False)
         e2.start_game()
-        self.assertTrue(e2.load_game(name="p157_roundtrip"))
+        self.assertTrue(e2.load_game(name=path))
         self.assertIn(herbs.name, homestead.stored_names(e2.player))
         homestead.withdraw(e2, herbs.name)     # usable after reload
         self.assertTrue(any(getattr(i, "id", "") == "herb_bundle"
@@ -1,8 +1,11 @@
 """LLM cost-discipline tests (P3.9)."""
 
+import threading
+import time
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+import config
 from engine.game_engine import GameEngine
 from engine.llm_budget import (llm_action_allowed, ACTION_COOLDOWN_MIN,
                                cached_greeting, GREETING_TTL_MIN)
@@ -55,6 +58,143 @@ class TestActionBudget(unittest.TestCase):
         self.engine.process_npc_turns()
         spy.assert_not_called()
 
+    def test_network_provider_gets_granted_actions_as_one_batch(self):
+        self._pretend_llm()
+        self.engine.llm_interface.provider.concurrent_actions = True
+        wait = {"action": "wait", "target": "", "dialog": "", "thoughts": "",
+                "emotion": "", "goal_update": ""}
+        single = MagicMock(return_value=wait)
+        batch = MagicMock(side_effect=lambda reqs: [wait] * len(reqs))
+        self.engine.llm_interface.get_npc_action = single
+        self.engine.llm_interface.get_npc_actions = batch
+        px, py = self.engine.player.position
+        self.goren.position = (px + 1, py)
+        self.goren.metadata.pop("last_llm_action", None)
+        self.engine.turn_counter = 0
+        with patch.object(config, "NPC_ACTION_BATCH_SIZE", 100):
+            self.engine.process_npc_turns()
+        single.assert_not_called()
+        batch.assert_called_once()
+        self.assertIn(self.goren, [req[0] for req in batch.call_args[0][0]])
+
+    def test_full_batch_round_flushes_mid_scan(self):
+        self._pretend_llm()
+        self.engine.llm_interface.provider.concurrent_actions = True
+        sizes = []
+        self.engine.llm_interface.get_npc_actions = lambda reqs: (
+            sizes.append(len(reqs)) or [{"action": "wait"}] * len(reqs))
+        px, py = self.engine.player.position
+        for i, npc in enumerate(list(self.engine.npc_manager.npcs.values())[:5]):
+            npc.position = (px + i + 1, py)
+            npc.metadata.pop("last_llm_action", None)
+        self.engine.turn_counter = 0
+        with patch.object(config, "NPC_ACTION_BATCH_SIZE", 2):
+            self.engine.process_npc_turns()
+        self.assertGreaterEqual(len(sizes), 2)
+        self.assertTrue(all(0 < n <= 2 for n in sizes), sizes)
+
+    def test_background_worker_routes_batch_on_a_later_call(self):
+        from engine import npc_worker
+        self._pretend_llm()
+        self.engine.llm_interface.provider.concurrent_actions = True
+        reply = threading.Event()
+        batch = MagicMock(side_effect=lambda reqs: reply.wait(5) and
+                          [{"action": "wait", "target": ""}] * len(reqs))
+        self.engine.llm_interface.get_npc_actions = batch
+        npc_worker.enable(self.engine)
+        worker = self.engine.npc_worker
+        routed = MagicMock(return_value=True)
+        self.engine.action_router.process = routed
+        px, py = self.engine.player.position
+        self.goren.position = (px + 1, py)
+        self.goren.metadata.pop("last_llm_action", None)
+        self.engine.turn_counter = 0
+        with patch.object(config, "NPC_ACTION_BATCH_SIZE", 100):
+            self.engine.process_npc_turns()    # returns while the LLM waits
+        self.assertIn(self.goren.id, worker.pending)
+        reply.set()
+        deadline = time.monotonic() + 5
+        while self.goren.id in worker.pending and time.monotonic() < deadline:
+            self.engine.process_npc_turns()    # each frame drains results
+            time.sleep(0.01)
+        self.assertIn(self.goren, [c[0][0] for c in routed.call_args_list])
+        sent = [req[0] for req in batch.call_args[0][0]]
+        self.assertIn(self.goren.id, [npc.id for npc in sent])
+        self.assertFalse(any(npc is self.goren for npc in sent),
+                         "the worker prompts from a snapshot")
+
+    def test_provider_batch_keeps_request_order(self):
+        from llm.providers.heuristic import HeuristicProvider
+        prov = HeuristicProvider()
+        prov.concurrent_actions = True
+        prov.get_npc_action = lambda npc, *_: {"action": npc}
+        self.assertEqual(prov.get_npc_actions([(n, {}, [], "") for n in "abcde"]),
+                         [{"action": n} for n in "abcde"])
+
+    def test_unchanged_prompt_reuses_cached_action(self):
+        iface = self.engine.llm_interface
+        iface.provider.cache_actions = True
+        spy = MagicMock(side_effect=lambda *_: {"action": "wait"})
+        iface.provider.get_npc_action = spy
+        request = (self.goren, {"time_of_day": "morning"}, ["a", "b"], "map")
+        first = iface.get_npc_action(*request)
+        self.goren.metadata["last_llm_action"] = 99   # budget stamp only
+        self.assertEqual(iface.get_npc_action(*request), first)
+        self.assertEqual(spy.call_count, 1)
+        self.assertEqual(iface.call_counts["action_cached"], 1)
+        self.goren.position = (self.goren.position[0] + 1,
+                               self.goren.position[1])
+        iface.get_npc_actions([request, request[:2] + (["c"], "map")])
+        self.assertEqual(spy.call_count, 3)
+
+    def test_new_memory_misses_the_action_cache(self):
+        # the Ollama prompt lists the last five memories, so the key must too
+        iface = self.engine.llm_interface
+        iface.provider.cache_actions = True
+        spy = MagicMock(side_effect=lambda *_: {"action": "wait"})
+        iface.provider.get_npc_action = spy
+        request = (self.goren, {"time_of_day": "morning"}, ["a"], "map")
+        iface.get_npc_action(*request)
+        self.goren.add_memory("The forge fire went out", 1)
+        iface.get_npc_action(*request)
+        self.assertEqual(spy.call_count, 2)
+
+    def test_worker_snapshot_does_not_share_nested_metadata(self):
+        from engine.npc_worker import _snapshot
+        self.goren.metadata["dialog_log"] = [{"player": "hi", "npc": "ho"}]
+        snap = _snapshot(self.goren)
+        self.goren.metadata["dialog_log"].append({"player": "?", "npc": "!"})
+        self.assertEqual(len(snap.metadata["dialog_log"]), 1)
+
+    def test_character_sheet_freezes_profile_prefix(self):
+        from llm.providers.base import LLMProvider
+        sheet = LLMProvider.character_sheet
+        self.goren.personality["current_emotion"] = "calm"
+        first = sheet(self.goren)
+        profile = first.split("STATE:")[0]
+        self.goren.position = (self.goren.position[0] + 3, 0)
+        self.goren.personality["current_emotion"] = "wary"
+        second = sheet(self.goren)
+        self.assertTrue(second.startswith(profile))
+        self.assertIn('"current_emotion": "wary"', second)
+        self.assertNotIn("current_emotion", profile)
+        self.assertEqual(sheet(self.goren), second)
+        self.goren.hp -= 1
+        self.assertIn(f'"hp": {self.goren.hp},', sheet(self.goren))
+        self.goren.personality.setdefault("traits", []).append("gruff")
+        self.assertIn("gruff", sheet(self.goren).split("STATE:")[0])
+
+    def test_action_response_parsed_in_one_pass(self):
+        from llm.providers.base import LLMProvider
+        data = LLMProvider.parse_action_response(
+            "Sure!\n  action: Move \r\nTARGET: the forge\nEMOTION: calm\n"
+            "ACTION: talk\nGOAL_UPDATE: none")
+        self.assertEqual(data, {"action": "talk", "target": "the forge",
+                                "dialog": "", "thoughts": "",
+                                "emotion": "calm", "goal_update": "none"})
+        self.assertEqual(LLMProvider.parse_action_response("hmm")["action"],
+                         "wait")
+
     def test_call_counters_increment(self):
         counts = self.engine.llm_interface.call_counts
         base = counts["dialog"]
@@ -96,6 +236,15 @@ class TestGreetingCache(unittest.TestCase):
         self.engine.dialog_system.player_to_npc(self.goren.id)
         self.assertEqual(spy.call_count, 2)
 
+    def test_greeting_misses_when_time_of_day_turns(self):
+        from engine.llm_budget import store_greeting
+        store_greeting(self.engine, self.goren, "Good morning!")
+        self.assertEqual(cached_greeting(self.engine, self.goren),
+                         "Good morning!")
+        with patch.object(self.engine.world, "get_time_of_day",
+                          return_value="night-time"):
+            self.assertIsNone(cached_greeting(self.engine, self.goren))
+
     def test_real_messages_never_cached(self):
         spy = MagicMock(return_value="Aye, the troll's a menace.")
         self.engine.llm_interface.generate_npc_dialog = spy
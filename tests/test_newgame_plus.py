@@ -102,6 +102,15 @@ class TestVictoryFlow(unittest.TestCase):
         self.assertEqual(gui.engine.player.metadata.get("ng_plus"), 1)
         gui.engine.end_game()
 
+    def test_restart_gives_the_new_engine_a_worker(self):
+        gui = self._gui()
+        old = gui.engine
+        gui.restart()
+        self.assertIsNot(gui.engine, old)
+        self.assertIsNone(old.npc_worker)       # shut down by end_game
+        self.assertIsNotNone(gui.engine.npc_worker)
+        gui.engine.end_game()
+
     def test_continue_keeps_playing(self):
         gui = self._gui()
         gui.engine.player.metadata.setdefault("quest_flags",
@@ -65,6 +65,203 @@ class TestNpcCadence(unittest.TestCase):
         mm.add_event("Goren sleeps peacefully.")
         self.assertEqual(len(mm.game_history), before + 3)
 
+    def test_recent_history_reused_until_the_log_moves(self):
+        mm = self.engine.memory_manager
+        mm.add_event("Goren wipes the bar.")
+        recent = mm.get_recent_history()
+        self.assertIs(mm.get_recent_history(), recent)
+        mm.add_event("Goren wipes the bar.")    # suppressed duplicate
+        self.assertIs(mm.get_recent_history(), recent)
+        mm.add_event("A raven lands.")
+        self.assertEqual(mm.get_recent_history()[-1], "A raven lands.")
+        mm.game_history = list(mm.game_history)[:-1]   # as a load does
+        self.assertEqual(mm.get_recent_history()[-1], "Goren wipes the bar.")
+        self.assertEqual(mm.get_recent_history(3), mm.get_recent_history()[-3:])
+
+
+
+class _FakeProcesses:
+    """Stand-in NPCProcessManager: records get_action sends, replays
+    queued responses."""
+
+    def __init__(self):
+        self.sent, self.replies, self.restarted = [], {}, []
+        self.pushes, self.health_checks = 0, 0
+
+    def update_shared_state(self, key, value):
+        self.pushes += 1
+
+    def check_process_health(self):
+        self.health_checks += 1
+
+    def get_responses(self):
+        replies, self.replies = self.replies, {}
+        return replies
+
+    def send_command(self, npc_id, command, data=None):
+        self.sent.append(npc_id)
+        return True
+
+    def restart_process(self, npc_id):
+        self.restarted.append(npc_id)
+        return True
+
+
+class TestSubprocessBackpressure(unittest.TestCase):
+    def setUp(self):
+        self.engine = GameEngine(
+            llm_provider="heuristic", enable_npc_processes=False)
+        self.engine.start_game()
+        self.pm = self.engine.process_manager = _FakeProcesses()
+        px, py = self.engine.player.position
+        self.near = list(self.engine.npc_manager.npcs.values())[:4]
+        for i, npc in enumerate(self.near):
+            npc.position = (px + i + 1, py)
+
+    def tearDown(self):
+        self.engine.process_manager = None
+        try:
+            self.engine.end_game()
+        except Exception:
+            pass
+
+    def _tick(self):
+        self.engine._npc_last_turn = None
+        self.engine.turn_counter = 0
+        self.engine.process_npc_turns_async()
+
+    def test_in_flight_requests_are_capped_nearest_first(self):
+        import config
+        from unittest.mock import patch
+        with patch.object(config, "NPC_MAX_PROCESSES", 2):
+            self._tick()
+        self.assertEqual(len(self.pm.sent), 2)
+        self.assertEqual(set(self.engine.processing_npcs), set(self.pm.sent))
+        self.assertLessEqual(set(self.pm.sent),
+                             {n.id for n in self.near[:2]})
+
+    def test_idle_frames_skip_ipc(self):
+        self._tick()
+        pushes, checks = self.pm.pushes, self.pm.health_checks
+        self.engine.processing_npcs.clear()
+        self.pm.get_responses = lambda: self.fail("polled with none in flight")
+        for _ in range(5):                    # frames within the same turn
+            self.engine.process_npc_turns_async()
+        self.assertEqual((self.pm.pushes, self.pm.health_checks),
+                         (pushes, checks))
+        self.engine.player.position = (self.engine.player.position[0] + 1,
+                                       self.engine.player.position[1])
+        self.engine.process_npc_turns_async()
+        self.assertEqual(self.pm.pushes, pushes + 1)
+
+    def test_npcs_in_one_place_share_a_tick_world_state(self):
+        from unittest.mock import patch
+        from engine.npc_turns import _tick_states
+        state_for = _tick_states(self.engine)
+        world = self.engine.world
+        with patch.object(world, "get_location_at", return_value=None):
+            wild = state_for(3, 4)
+            self.assertIs(state_for(90, 12), wild)
+        self.assertEqual(wild, {
+            "current_location": "wilderness",
+            "time_of_day": world.get_time_of_day(),
+            "player_position": tuple(self.engine.player.position)})
+        loc = world.locations[0]
+        with patch.object(world, "get_location_at", return_value=loc):
+            self.assertEqual(state_for(3, 4)["current_location"], loc.name)
+
+    def test_expired_request_drops_its_late_answer(self):
+        import config
+        self._tick()
+        npc_id = self.pm.sent[0]
+        self.engine.processing_npcs[npc_id] -= config.NPC_PROCESS_TIMEOUT + 1
+        self._tick()                              # expires, then re-sent
+        self.assertEqual(self.pm.sent.count(npc_id), 2)
+        self.assertEqual(self.pm.restarted, [npc_id], "hung process replaced")
+        self.engine.processing_npcs.pop(npc_id)   # ...and expires again
+        self.pm.replies[npc_id] = {"type": "action", "action_data": {
+            "action": "shout", "target": "at the sky"}}
+        before = len(self.engine.memory_manager.game_history)
+        self.engine.process_npc_turns_async()
+        events = self.engine.memory_manager.game_history[before:]
+        self.assertFalse(any("at the sky" in e["event"] for e in events))
+
+    def test_status_reply_ahead_of_action_keeps_request_in_flight(self):
+        from unittest.mock import MagicMock
+        self._tick()
+        npc_id = self.pm.sent[0]
+        routed = self.engine.action_router.process = MagicMock()
+        self.pm.replies[npc_id] = {"type": "status",
+                                   "status": "acknowledged"}
+        self.engine.process_npc_turns_async()
+        self.assertIn(npc_id, self.engine.processing_npcs)
+        routed.assert_not_called()
+        action = {"action": "move", "target": "the well"}
+        self.pm.replies[npc_id] = {"type": "action", "action_data": action}
+        self.engine.process_npc_turns_async()
+        self.assertNotIn(npc_id, self.engine.processing_npcs)
+        routed.assert_called_once_with(
+            self.engine.npc_manager.get_npc(npc_id), action)
+
+    def test_error_reply_releases_the_request(self):
+        from unittest.mock import MagicMock
+        self._tick()
+        npc_id = self.pm.sent[0]
+        routed = self.engine.action_router.process = MagicMock()
+        self.pm.replies[npc_id] = {"type": "error", "error": "LLM refused"}
+        self.engine.process_npc_turns_async()
+        self.assertNotIn(npc_id, self.engine.processing_npcs)
+        routed.assert_not_called()
+        self._tick()                              # asked again next turn
+        self.assertEqual(self.pm.sent.count(npc_id), 2)
+        self.assertEqual(self.pm.restarted, [], "a live process is kept")
+
+
+class TestProcessResponses(unittest.TestCase):
+    def _manager(self):
+        import queue
+        from engine.npc_process_manager import NPCProcessManager
+        pm = NPCProcessManager.__new__(NPCProcessManager)  # no processes
+        pm.response_queues = {"goren": queue.Queue()}
+        pm.held_responses = {}
+        return pm
+
+    def test_dialog_wait_holds_an_earlier_action_answer(self):
+        pm = self._manager()
+        action = {"type": "action", "action_data": {"action": "wait"}}
+        pm.response_queues["goren"].put(action)
+        pm.response_queues["goren"].put({"type": "dialog", "response": "Hi"})
+        resp = pm.get_response("goren", timeout=1.0, kind="dialog")
+        self.assertEqual(resp["response"], "Hi")
+        self.assertEqual(pm.get_responses(), {"goren": action})
+        self.assertEqual(pm.get_responses(), {})
+
+    def test_response_returned_without_polling_delay(self):
+        import threading
+        from unittest.mock import patch
+        pm = self._manager()
+        threading.Timer(0.02, pm.response_queues["goren"].put,
+                        [{"type": "dialog", "response": "Hi"}]).start()
+        # blocks on the queue itself: no sleep-and-poll loop, and the reply
+        # arrives well inside a generous timeout
+        with patch("time.sleep", side_effect=AssertionError("polled")):
+            self.assertIsNotNone(pm.get_response("goren", timeout=30.0))
+        self.assertIsNone(pm.get_response("goren", timeout=0.05))
+
+    def test_update_npc_is_pickled_when_sent(self):
+        import pickle
+        import queue
+        from characters.npc_manager import NPCManager
+        npc = NPCManager().create_random_npc()
+        npc.goals[:] = ["pour ale"]
+        pm = self._manager()
+        pm.command_queues = {npc.id: queue.Queue()}
+        self.assertTrue(pm.update_npc(npc))
+        npc.goals.append("close up")            # after the send
+        sent = pm.command_queues[npc.id].get_nowait()
+        self.assertEqual(sent["command"], "update_npc")
+        self.assertEqual(pickle.loads(sent["data"])["goals"], ["pour ale"])
+
 
 if __name__ == "__main__":
     unittest.main()
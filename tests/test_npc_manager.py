@@ -0,0 +1,149 @@
+"""NPCManager lookup tests."""
+
+import unittest
+
+from characters.character_types import CharacterClass, CharacterRace
+from characters.npc_manager import NPCManager
+
+
+class TestNameLookup(unittest.TestCase):
+    def setUp(self):
+        self.mgr = NPCManager()
+
+    def test_lookup_is_case_insensitive(self):
+        npc = self.mgr.create_random_npc(race=CharacterRace.HUMAN)
+        self.assertIs(self.mgr.get_npc_by_name(npc.name.upper()), npc)
+        self.assertIsNone(self.mgr.get_npc_by_name("Nobody-at-all"))
+
+    def test_first_match_wins_and_survives_removal(self):
+        a = self.mgr.create_random_npc(char_class=CharacterClass.GUARD)
+        b = self.mgr.create_random_npc(char_class=CharacterClass.GUARD)
+        b.name = a.name
+        self.assertIs(self.mgr.get_npc_by_name(a.name), a)
+        self.mgr.remove_npc(a.id)
+        self.assertIs(self.mgr.get_npc_by_name(a.name), b)
+
+    def test_all_namesakes_in_registration_order(self):
+        a = self.mgr.create_random_npc()
+        b = self.mgr.create_random_npc()
+        c = self.mgr.create_random_npc()
+        b.name = c.name = a.name                # renamed after add_npc
+        self.mgr.remove_npc(a.id)
+        self.assertEqual(self.mgr.get_npcs_by_name(a.name.upper()), [b, c])
+        d = self.mgr.create_random_npc()
+        d.name = a.name
+        self.mgr.reindex()
+        self.assertEqual(self.mgr.get_npcs_by_name(a.name), [b, c, d])
+        self.assertEqual(self.mgr.get_npcs_by_name("Nobody-at-all"), [])
+
+    def test_direct_dict_edits_do_not_return_stale_npcs(self):
+        npc = self.mgr.create_random_npc()
+        self.mgr.npcs.pop(npc.id)              # as tutorial/colosseum do
+        self.assertIsNone(self.mgr.get_npc_by_name(npc.name))
+        self.mgr.npcs[npc.id] = npc            # as save_load does
+        self.assertIs(self.mgr.get_npc_by_name(npc.name), npc)
+
+    def test_mentioned_in_follows_text_order_and_roster(self):
+        a = self.mgr.create_random_npc()
+        b = self.mgr.create_random_npc()
+        a.name, b.name = "Bran", "Bran Stoutarm"
+        c = self.mgr.create_random_npc()
+        c.name = "Mira"
+        self.assertEqual(self.mgr.mentioned_in("ask bran stoutarm, then bran"),
+                         [b, a])
+        self.mgr.npcs.pop(a.id)
+        self.assertEqual(self.mgr.mentioned_in("bran and mira"), [c])
+        self.assertEqual(self.mgr.mentioned_in("the forge"), [])
+
+    def test_mentioned_in_sees_a_same_size_roster_swap(self):
+        a = self.mgr.create_random_npc()
+        b = self.mgr.create_random_npc()
+        a.name, b.name = "Alda Reed", "Bram Cole"
+        self.mgr.reindex()
+        self.assertEqual(self.mgr.mentioned_in("walk to bram cole"), [b])
+        self.mgr.remove_npc(a.id)
+        c = self.mgr.create_random_npc()       # same count as before
+        c.name = "Cyril Moss"
+        self.mgr.reindex()
+        self.assertEqual(self.mgr.mentioned_in("walk to cyril moss"), [c])
+        self.assertEqual(self.mgr.mentioned_in("walk to alda reed"), [])
+
+    def test_named_like_matches_either_way_round(self):
+        a = self.mgr.create_random_npc()
+        b = self.mgr.create_random_npc()
+        a.name, b.name = "Wandering Troll", "Troll Shaman"
+        self.assertEqual(self.mgr.named_like("troll"), [a, b])
+        self.assertEqual(self.mgr.named_like("attack the troll shaman now"),
+                         [b])
+        self.mgr.npcs.pop(b.id)
+        self.assertEqual(self.mgr.named_like("troll"), [a])
+
+
+class TestRandomNPC(unittest.TestCase):
+    def test_class_and_race_bonuses_apply_within_jitter(self):
+        mgr = NPCManager()
+        for _ in range(20):
+            npc = mgr.create_random_npc(char_class=CharacterClass.WARRIOR,
+                                        race=CharacterRace.DWARF)
+            self.assertTrue(13 <= npc.strength <= 16)      # 10 + 4
+            self.assertTrue(13 <= npc.constitution <= 16)  # 10 + 2 + 2
+            self.assertTrue(10 <= npc.wisdom <= 13)        # 10 + 1
+            self.assertTrue(9 <= npc.charisma <= 12)
+            self.assertEqual(npc.max_hp, npc.constitution + npc.level * 4)
+
+
+class TestBucketLookups(unittest.TestCase):
+    def setUp(self):
+        self.mgr = NPCManager()
+
+    def test_by_class_keeps_insertion_order_and_drops_removed(self):
+        g1 = self.mgr.create_random_npc(char_class=CharacterClass.GUARD)
+        self.mgr.create_random_npc(char_class=CharacterClass.MERCHANT)
+        g2 = self.mgr.create_random_npc(char_class=CharacterClass.GUARD)
+        self.assertEqual(
+            self.mgr.get_npcs_by_class(CharacterClass.GUARD), [g1, g2])
+        self.mgr.npcs.pop(g1.id)
+        self.assertEqual(
+            self.mgr.get_npcs_by_class(CharacterClass.GUARD), [g2])
+
+    def test_by_location_follows_rehoming(self):
+        npc = self.mgr.create_random_npc(location="Mill")
+        self.assertEqual(self.mgr.get_npcs_by_location("Mill"), [npc])
+        self.mgr.set_home_location(npc, "Forge")
+        self.assertEqual(self.mgr.get_npcs_by_location("Mill"), [])
+        self.assertEqual(self.mgr.get_npcs_by_location("Forge"), [npc])
+
+    def test_npcs_within_reads_live_positions(self):
+        a = self.mgr.create_random_npc()
+        b = self.mgr.create_random_npc()
+        a.position, b.position = (3, 4), (4, 4)
+        self.assertEqual(self.mgr.npcs_within((0, 0), 5), [a])
+        b.position = (0, 1)                     # moved without the map
+        self.assertEqual(self.mgr.npcs_within((0, 0), 5), [a, b])
+
+    def test_reindex_after_direct_fill(self):
+        npc = self.mgr.create_random_npc(location="Mill")
+        fresh = NPCManager()
+        fresh.npcs[npc.id] = npc                # as save_load does
+        fresh.reindex()
+        self.assertEqual(fresh.get_npcs_by_location("Mill"), [npc])
+        self.assertEqual(fresh.get_npcs_by_class(npc.character_class), [npc])
+
+
+class TestRevive(unittest.TestCase):
+    def test_revive_places_npc_at_home_location_centre(self):
+        from world.location import Location
+        from world.world import World
+        mgr = NPCManager()
+        mgr.world = World(40, 40)
+        mill = Location("Mill", "", 10, 10, 4, 4)
+        mgr.world.add_location(Location("Mill", "A later namesake", 30, 30, 2, 2))
+        mgr.world.locations.insert(0, mill)     # first match wins
+        npc = mgr.create_random_npc(location="Mill")
+        npc.defeat()
+        self.assertTrue(mgr.revive_npc(npc.id))
+        self.assertEqual(npc.position, mill.center())
+
+
+if __name__ == "__main__":
+    unittest.main()
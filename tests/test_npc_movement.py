@@ -36,6 +36,17 @@ class TestActionRouterLocations(unittest.TestCase):
             goren, "home")
         self.assertIsNotNone(pos)
 
+    def test_step_follows_dominant_axis(self):
+        router = self.engine.action_router
+        goren = self.engine.npc_manager.get_npc("tavernkeeper_01")
+        goren.position = (10, 10)
+        for player_pos, step in (((14, 12), (1, 0)), ((7, 11), (-1, 0)),
+                                 ((12, 6), (0, -1)), ((13, 13), (0, 1)),
+                                 ((10, 10), (0, 0))):
+            self.engine.player.position = player_pos
+            self.assertEqual(router._interpret_direction(goren, "the player"),
+                             step, player_pos)
+
     def test_resolve_unknown_keyword(self):
         npc = self.engine.npc_manager.get_npc("tavernkeeper_01")
         pos = self.engine.action_router._resolve_location_target(
@@ -44,10 +55,11 @@ class TestActionRouterLocations(unittest.TestCase):
 
     def test_npc_moves_toward_target_keyword(self):
         # Move guard far from tavern, then issue "move tavern" — he should
-        # step closer.
+        # step closer. Far = beyond LOITER_RADIUS of the tavern centre;
+        # inside it he has "arrived" and ambles at random.
         guard = self.engine.npc_manager.get_npc("guard_01")
         self.engine.world.map.remove_character(guard)
-        guard.position = (40, 35)
+        guard.position = (46, 37)
         self.engine.world.map.place_character(guard, *guard.position)
 
         # Tavern center should be in the village area
@@ -107,6 +119,59 @@ class TestActionRouterLocations(unittest.TestCase):
             guard, {"action": "move", "target": "north"})
         self.assertEqual(guard.position, (before[0], before[1] - 1))
 
+    def test_dispatch_table_routes_by_verb(self):
+        from unittest.mock import MagicMock
+        router = self.engine.action_router
+        guard = self.engine.npc_manager.get_npc("guard_01")
+        attack = MagicMock(return_value=True)
+        self.engine.combat_system.npc_attack = attack   # looked up per call
+        router._handle_rest = MagicMock(return_value=True)
+        router.process(guard, {"action": "Strike", "target": "troll"})
+        attack.assert_called_once_with(guard, "troll", "strike")
+        router.process(guard, {"action": "sleep", "target": ""})
+        router._handle_rest.assert_called_once_with(guard, "", "sleep")
+        self.assertTrue(router.process(guard, {"action": "ponders",
+                                               "target": "life"}))
+        self.assertIn("ponders life",
+                      self.engine.memory_manager.game_history[-1]["event"])
+
+    def test_social_verbs_read_their_mood_table(self):
+        router = self.engine.action_router
+        goren = self.engine.npc_manager.get_npc("tavernkeeper_01")
+        durgan = self.engine.npc_manager.get_npc("blacksmith_01")
+        router._adjacent = lambda a, b: True
+        before = (goren.get_relationship(durgan.id),
+                  durgan.get_relationship(goren.id))
+        self.assertTrue(router._handle_social(goren, durgan.name, "insult"))
+        self.assertEqual((goren.get_relationship(durgan.id),
+                          durgan.get_relationship(goren.id)),
+                         (before[0] - 10, before[1] - 10))
+        self.assertEqual(self.engine.memory_manager.game_history[-1]["event"],
+                         f"{goren.name} insults {durgan.name}!")
+        self.assertFalse(router._handle_social(goren, durgan.name, "persuade"))
+
+
+class TestDirectionWords(unittest.TestCase):
+    def test_first_direction_follows_table_order_not_text_order(self):
+        from engine.directions import DIRECTIONS, first_direction
+        for text in ("go east then north", "northeast", "left, up the road",
+                     "the tavern", "", "backwards"):
+            expected = next((v for w, v in DIRECTIONS.items() if w in text),
+                            None)
+            self.assertEqual(first_direction(text), expected, text)
+
+    def test_mentions_player(self):
+        from engine.directions import mentions_player
+        self.assertTrue(mentions_player("follow the traveler"))
+        self.assertFalse(mentions_player("the forge"))
+
+    def test_step_toward_takes_the_dominant_axis(self):
+        from engine.directions import step_toward
+        self.assertEqual(step_toward((5, 5), (9, 7)), (1, 0))
+        self.assertEqual(step_toward((5, 5), (4, 1)), (0, -1))
+        self.assertEqual(step_toward((5, 5), (8, 2)), (0, -1))   # tie
+        self.assertEqual(step_toward((5, 5), [5, 5]), (0, 0))
+
 
 if __name__ == "__main__":
     unittest.main()
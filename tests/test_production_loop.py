@@ -93,11 +93,12 @@ class TestProductionLoop(unittest.TestCase):
             self.ps.run_day()
         before = {k: dict(v) for k, v in self.ps.stores.items()}
         self.assertTrue(any(before.values()), "there is something to save")
-        self.engine.save_game(name="p162_roundtrip")
+        path = _os.path.join(_tempfile.mkdtemp(), "p162_roundtrip.json")
+        self.engine.save_game(name=path)
         e2 = GameEngine(llm_provider="heuristic",
                         enable_npc_processes=False)
         e2.start_game()
-        self.assertTrue(e2.load_game(name="p162_roundtrip"))
+        self.assertTrue(e2.load_game(name=path))
         self.assertEqual(e2.production.stores, before)
         e2.end_game()
 
@@ -115,11 +115,12 @@ class TestResourceNodes(unittest.TestCase):
         for _ in range(node["max"]):
             self.rn.harvest(x, y, "woodcutting")   # fell it
         before = {k: dict(v) for k, v in self.rn.nodes.items()}
-        self.engine.save_game(name="p164_roundtrip")
+        path = _os.path.join(_tempfile.mkdtemp(), "p164_roundtrip.json")
+        self.engine.save_game(name=path)
         e2 = GameEngine(llm_provider="heuristic",
                         enable_npc_processes=False)
         e2.start_game()
-        self.assertTrue(e2.load_game(name="p164_roundtrip"))
+        self.assertTrue(e2.load_game(name=path))
         self.assertEqual(e2.resource_nodes.nodes, before)
         e2.end_game()
 
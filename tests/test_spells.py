@@ -72,6 +72,16 @@ class TestSpellsInEngine(unittest.TestCase):
         after, _ = self.engine.get_player_mana()
         self.assertLess(after, before)
 
+    def test_range_is_euclidean_at_the_edge(self):
+        troll = self.engine.npc_manager.get_npc("troll_brigand_01")
+        px, py = self.engine.player.position
+        from engine.spells import SpellSystem
+        ss = SpellSystem(self.engine)
+        troll.position = (px + 3, py + 4)       # exactly 5 tiles
+        self.assertTrue(ss._in_range(self.engine.player, troll, 5.0))
+        troll.position = (px + 4, py + 4)       # ~5.66: diagonals count
+        self.assertFalse(ss._in_range(self.engine.player, troll, 5.0))
+
     def test_cast_unknown_spell(self):
         msg = self.engine.cast_spell("nonsense_spell")
         self.assertIn("unknown", msg.lower())
@@ -4,7 +4,8 @@ import unittest
 
 from engine.game_engine import GameEngine
 from engine.squad_tactics import (surround_step, flank_tile,
-                                  player_focus_target, greedy_step)
+                                  player_focus_target, greedy_step,
+                                  straight_step)
 from world.monsters import build_monster
 from world.world_map import TerrainType
 
@@ -141,6 +142,15 @@ class TestSquadTactics(unittest.TestCase):
         self.assertTrue(moved)
         self.assertNotEqual(wolf.position, (px, py))
 
+    def test_straight_step_does_not_slide(self):
+        px, py = self._mid()
+        wolf = self._spawn("wolf", px, py)
+        self.wmap.terrain[py][px + 1] = TerrainType.WATER
+        self.assertFalse(straight_step(self.wmap, wolf, (px + 4, py + 1)))
+        self.assertEqual(wolf.position, (px, py))
+        self.assertTrue(straight_step(self.wmap, wolf, (px + 1, py + 3)))
+        self.assertEqual(wolf.position, (px, py + 1))
+
     def test_surround_step_prefers_own_position(self):
         px, py = self._mid()
         self._put(self.engine.player, px, py)
@@ -8,6 +8,10 @@ from engine.topics import TOPICS
 
 class TestTopicJournal(unittest.TestCase):
     def setUp(self):
+        # no bones from earlier tests: a "[Legend] ... fell to Gorkash"
+        # line would teach the topic before the test says its name
+        from tests import clean_dm_library
+        clean_dm_library()
         self.engine = GameEngine(
             llm_provider="heuristic", enable_npc_processes=False)
         self.engine.start_game()
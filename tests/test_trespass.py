@@ -72,7 +72,7 @@ class TestTrespass(unittest.TestCase):
         self.assertLess(owner.relationships.get(self.player.id, 0),
                         rel_before)
         self.assertIn("broke into my home",
-                      " ".join(owner.memories))
+                      " ".join(m["event"] for m in owner.memories))
 
     def test_unwitnessed_daytime_sneak_is_free_but_counted(self):
         loc = self._home()
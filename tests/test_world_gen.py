@@ -2,6 +2,7 @@
 
 import unittest
 
+from world.location import Location
 from world.world import World
 from world.world_map import TerrainType
 from world.world_generator import WorldGenerator
@@ -53,5 +54,72 @@ class TestWorldGenerator(unittest.TestCase):
         self.assertEqual(a.map.terrain, b.map.terrain)
 
 
+class TestVisibleDescription(unittest.TestCase):
+    def test_memo_tracks_direct_terrain_and_character_changes(self):
+        from characters.npc_manager import NPCManager
+        world = World(width=30, height=20)
+        wmap = world.map
+        npc = NPCManager().create_random_npc()
+        wmap.place_character(npc, 12, 10)
+        first = wmap.get_visible_description(10, 10)
+        self.assertIn(npc.name, first)
+        self.assertEqual(wmap.get_visible_description(10, 10), first)
+        wmap.terrain[10][8] = TerrainType.WATER        # direct tile write
+        self.assertEqual(wmap.get_visible_description(10, 10),
+                         wmap._describe_visible(10, 10, 5))
+        self.assertIn("water", wmap.get_visible_description(10, 10))
+        npc.name = "Renamed Wanderer"
+        self.assertIn("Renamed Wanderer", wmap.get_visible_description(10, 10))
+        wmap.move_character(npc, 19, 10)               # out of view
+        self.assertNotIn("Renamed", wmap.get_visible_description(10, 10))
+
+
+class TestLocationCaches(unittest.TestCase):
+    def test_location_index_follows_list_changes(self):
+        world = World(20, 20)
+        self.assertIsNone(world.get_location_by_name("Well"))
+        well = Location("Well", "", 1, 1, 1, 1)
+        world.add_location(well)
+        self.assertIs(world.get_location_by_name("Well"), well)
+        world.locations = []
+        self.assertIsNone(world.get_location_by_name("Well"))
+
+    def test_location_index_follows_a_remove_then_add(self):
+        world = World(20, 20)
+        world.add_location(Location("Town", "", 0, 0, 10, 10))
+        world.add_location(Location("Old Tower", "", 2, 2, 2, 2))
+        self.assertIsNotNone(world.get_location_by_name("Old Tower"))
+        world.remove_location("Old Tower")     # as a DM module's undo does
+        hall = Location("New Hall", "", 5, 5, 2, 2)
+        world.add_location(hall)                # same length as before
+        self.assertIs(world.get_location_by_name("New Hall"), hall)
+        self.assertIsNone(world.get_location_by_name("Old Tower"))
+
+    def test_location_at_memo_follows_list_and_turn_changes(self):
+        world = World(20, 20)
+        village = Location("Village", "", 0, 0, 10, 10)
+        world.add_location(village)
+        self.assertIs(world.get_location_at(2, 2), village)
+        inn = Location("Inn", "", 2, 2, 2, 2)
+        world.add_location(inn)                  # innermost now wins
+        self.assertIs(world.get_location_at(2, 2), inn)
+        world.locations[:] = [village, village]  # same length, new contents
+        world.advance_time(1)
+        self.assertIs(world.get_location_at(2, 2), village)
+        self.assertIsNone(world.get_location_at(15, 15))
+
+    def test_lowered_names_follow_a_remove_then_add(self):
+        world = World(20, 20)
+        town = Location("Town", "", 0, 0, 10, 10)
+        world.add_location(town)
+        world.add_location(Location("Old Tower", "", 2, 2, 2, 2))
+        self.assertEqual(len(world.lowered_names()), 2)
+        world.remove_location("Old Tower")
+        hall = Location("New Hall", "", 5, 5, 2, 2)
+        world.add_location(hall)
+        self.assertEqual(world.lowered_names(),
+                         [("town", town), ("new hall", hall)])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -17,6 +17,7 @@ from ui.renderer import MapRenderer
 from ui.hud import HUD
 from ui.input_handler import InputHandler
 from ui import projectile_anim
+from engine import npc_worker
 
 logger = logging.getLogger("llm_rpg.gui")
 
@@ -61,6 +62,7 @@ class GameGUI:
             raise RuntimeError("pygame is not installed")
         self.engine = engine
         projectile_anim.enable(engine)      # arrows animate in flight (George)
+        npc_worker.enable(engine)           # LLM NPC actions off the frame
         self.width = width
         self.height = height
         self.tile_size = tile_size
@@ -424,6 +426,7 @@ class GameGUI:
         )
         self.engine._has_gui = True
         self.engine.start_game()
+        npc_worker.enable(self.engine)     # end_game shut the old one down
         self.input_handler.engine = self.engine
         self.mode = "play"
         self.overlay = None
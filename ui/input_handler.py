@@ -549,9 +549,9 @@ class InputHandler:
         for npc in self.engine.npc_manager.npcs.values():
             if not npc.is_active():
                 continue
-            d = ((npc.position[0] - px) ** 2 +
-                 (npc.position[1] - py) ** 2) ** 0.5
-            if d > 1.5:
+            d2 = ((npc.position[0] - px) ** 2 +
+                  (npc.position[1] - py) ** 2)
+            if d2 > 2.25:          # beyond 1.5 tiles
                 continue
             klass = getattr(npc.character_class, "value", "")
             # Prefer hostile classes
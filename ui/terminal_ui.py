@@ -201,8 +201,8 @@ class TerminalUI:
         for pos, npc in self.engine.world.map.characters.items():
             if npc.id != self.engine.player.id:  # Skip player
                 npc_x, npc_y = pos
-                distance = ((player_x - npc_x) ** 2 + (player_y - npc_y) ** 2) ** 0.5
-                if distance <= 1.5:  # Adjacent or diagonal
+                dist2 = (player_x - npc_x) ** 2 + (player_y - npc_y) ** 2
+                if dist2 <= 2.25:  # Adjacent or diagonal (1.5 tiles)
                     nearby_npcs.append(npc)
 
         if not nearby_npcs:
@@ -8,6 +8,7 @@ within FOV. Encounter tables can be expanded later.
 import logging
 import random
 import uuid
+from math import sqrt
 from typing import List, Optional, Tuple
 
 from world.world_map import TerrainType
@@ -224,10 +225,10 @@ class EncounterManager:
                 cx, cy = loc.center()
             except Exception:
                 cx, cy = getattr(loc, "x", px), getattr(loc, "y", py)
-            dd = ((cx - px) ** 2 + (cy - py) ** 2) ** 0.5
+            dd = (cx - px) ** 2 + (cy - py) ** 2
             if best is None or dd < best:
                 best = dd
-        return best
+        return None if best is None else sqrt(best)
 
     def _in_safe_zone(self, pos) -> bool:
         """Inside a settlement's FOOTPRINT (+ a SAFE_RADIUS margin) — no
@@ -285,10 +286,10 @@ class EncounterManager:
         wmap = self.engine.world.map
         px, py = self.engine.player.position
         out, hi_i = [], int(hi) + 1
+        lo2, hi2 = lo * lo, hi * hi
         for dy in range(-hi_i, hi_i + 1):
             for dx in range(-hi_i, hi_i + 1):
-                d = (dx * dx + dy * dy) ** 0.5
-                if not (lo <= d <= hi):
+                if not (lo2 <= dx * dx + dy * dy <= hi2):
                     continue
                 x, y = px + dx, py + dy
                 if not (0 <= x < wmap.width and 0 <= y < wmap.height):
@@ -304,11 +305,11 @@ class EncounterManager:
         wmap = self.engine.world.map
         px, py = self.engine.player.position
         hi_i = int(hi) + 1
+        lo2, hi2 = lo * lo, hi * hi
         caves = []
         for dy in range(-hi_i, hi_i + 1):
             for dx in range(-hi_i, hi_i + 1):
-                d = (dx * dx + dy * dy) ** 0.5
-                if not (lo <= d <= hi):
+                if not (lo2 <= dx * dx + dy * dy <= hi2):
                     continue
                 x, y = px + dx, py + dy
                 if 0 <= x < wmap.width and 0 <= y < wmap.height and \
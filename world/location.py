@@ -10,7 +10,12 @@ logger = logging.getLogger("llm_rpg.location")
 
 class Location:
     """Represents a named location in the world"""
-    
+
+    # Slotted like Character: no per-instance __dict__ (a world holds
+    # dozens to hundreds of these, probed by get_location_at)
+    __slots__ = ("name", "description", "x", "y", "width", "height",
+                 "properties", "npcs")
+
     def __init__(self, name: str, description: str, x: int, y: int, width: int, height: int):
         self.name = name
         self.description = description
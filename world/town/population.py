@@ -54,7 +54,7 @@ def _free_tile_in(engine, loc):
 def _seat(engine, klass, role, workplace, pos):
     npc = engine.npc_manager.create_random_npc(char_class=klass)
     if workplace:
-        npc.home_location = workplace            # → shop category + presence
+        engine.npc_manager.set_home_location(npc, workplace)  # → shop category + presence
         npc.metadata["workplace"] = workplace
     npc.metadata["role"] = role
     npc.metadata["townsfolk"] = True
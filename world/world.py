@@ -7,6 +7,7 @@ import logging
 from typing import List, Optional
 from world.world_map import WorldMap, TerrainType
 from world.location import Location
+from characters.character import item_name as name_of
 import config
 
 logger = logging.getLogger("llm_rpg.world")
@@ -17,27 +18,82 @@ class World:
     def __init__(self, width=config.DEFAULT_MAP_WIDTH, height=config.DEFAULT_MAP_HEIGHT):
         self.map = WorldMap(width, height)
         self.locations = []
+        self._by_name = {}        # name -> first Location of that name
+        self._by_name_key = None  # (id, len) of the list it was built from
+        self._lowered = []        # [(name.lower(), Location)] in list order
+        self._lowered_key = None  # (id, len) of the list it was built from
+        self._loc_at = {}         # (x, y) -> innermost Location (or None)
+        self._loc_at_key = None   # (id, len) of the list it was built from
         self.time = 0  # Game time in minutes
+        self._date = (None, None)  # (time, Date) last handed out by get_date
         logger.info(f"World initialized with size {width}x{height}")
 
     def add_location(self, location: Location):
         """Add a named location to the world"""
         self.locations.append(location)
+        self.locations_changed()
         logger.debug(f"Added location: {location.name}")
 
+    def remove_location(self, name: str) -> None:
+        """Drop every location called `name` (in place)"""
+        self.locations[:] = [loc for loc in self.locations
+                             if loc.name != name]
+        self.locations_changed()
+        logger.debug(f"Removed location: {name}")
+
+    def locations_changed(self) -> None:
+        """Drop the location caches; call after editing `locations` in
+        place other than by appending."""
+        self._by_name_key = None
+        self._lowered_key = None
+        self._loc_at_key = None
+
+    def get_location_by_name(self, name: str) -> Optional[Location]:
+        """First location called `name`, via a name index. The index is
+        dropped by add_location / remove_location / locations_changed, and
+        rebuilt when the list's identity or length changes (save/load and
+        chunk swaps assign or append to it directly)."""
+        key = (id(self.locations), len(self.locations))
+        if key != self._by_name_key:
+            self._by_name = {}
+            for loc in self.locations:
+                self._by_name.setdefault(loc.name, loc)
+            self._by_name_key = key
+        return self._by_name.get(name)
+
+    def lowered_names(self) -> List[tuple]:
+        """(lowercased name, Location) pairs in list order, for callers that
+        match free text against every name. Dropped and rebuilt on the same
+        rules as the name index; callers must not mutate the list."""
+        key = (id(self.locations), len(self.locations))
+        if key != self._lowered_key:
+            self._lowered = [(loc.name.lower(), loc) for loc in self.locations]
+            self._lowered_key = key
+        return self._lowered
+
     def get_location_at(self, x: int, y: int) -> Optional[Location]:
         """Get the most-specific (smallest) location containing the coords.
 
         When a tile lies inside multiple locations (e.g. a building inside
         a village area), we return the innermost one so callers can detect
         the specific room/building.
+
+        Answers are memoised per tile until the location list changes
+        (add_location, a swapped or resized list) or the turn advances.
         """
+        key = (id(self.locations), len(self.locations))
+        if key != self._loc_at_key:
+            self._loc_at = {}
+            self._loc_at_key = key
+        pos = (x, y)
+        if pos in self._loc_at:
+            return self._loc_at[pos]
         candidates = [loc for loc in self.locations if loc.contains(x, y)]
-        if not candidates:
-            return None
         # Smallest area wins (innermost / most specific)
-        candidates.sort(key=lambda l: l.width * l.height)
-        return candidates[0]
+        loc = min(candidates, key=lambda l: l.width * l.height) \
+            if candidates else None
+        self._loc_at[pos] = loc
+        return loc
 
     def get_locations_at(self, x: int, y: int) -> List[Location]:
         """All locations containing the coords, sorted innermost-first."""
@@ -48,10 +104,16 @@ class World:
     def advance_time(self, minutes: int):
         """Advance game time by specified minutes"""
         self.time += minutes
+        self._loc_at = {}
 
     def get_date(self):
-        from world.calendar import date_from_minutes
-        return date_from_minutes(self.time)
+        """The calendar Date for the current time. Dates are frozen, so one
+        is reused until `time` moves: the HUD, the game state and each NPC
+        tick all ask for the time of day or season within a turn."""
+        if self._date[0] != self.time:
+            from world.calendar import date_from_minutes
+            self._date = (self.time, date_from_minutes(self.time))
+        return self._date[1]
 
     def get_time_of_day(self) -> str:
         return self.get_date().time_of_day()
@@ -115,7 +177,7 @@ class World:
             self.ground_items[pos] = []
 
         self.ground_items[pos].append(item)
-        logger.debug(f"Added item {item} to ground at {pos}")
+        logger.debug("Added item %s to ground at %s", item, pos)
 
     def remove_item_from_ground(self, item, x, y):
         """Remove an item from the ground at the specified location"""
@@ -123,9 +185,13 @@ class World:
             return False
 
         pos = (x, y)
-        if pos in self.ground_items and item in self.ground_items[pos]:
-            self.ground_items[pos].remove(item)
-            logger.debug(f"Removed item {item} from ground at {pos}")
+        items = self.ground_items.get(pos)
+        if items:
+            try:
+                items.remove(item)
+            except ValueError:
+                return False
+            logger.debug("Removed item %s from ground at %s", item, pos)
 
             # Clean up empty lists
             if not self.ground_items[pos]:
@@ -192,19 +258,18 @@ class World:
                     # Check for body items
                     items = self.get_items_at(check_x, check_y)
                     for item in list(items):  # Use list to allow removal during iteration
-                        item_str = item if isinstance(item, str) else item.name if hasattr(item, 'name') else str(item)
+                        item_str = name_of(item)
 
                         # Check if it's a body
                         if "'s body" in item_str:
                             # Extract character name
                             npc_name = item_str.split("'s body")[0]
 
-                            # Find the corresponding NPC
-                            npc_id = None
-                            for id, npc in self.npc_manager.npcs.items():
-                                if npc.name == npc_name:
-                                    npc_id = id
-                                    break
+                            # Find the corresponding NPC (name index, exact case)
+                            npc_id = next(
+                                (npc.id for npc in
+                                 self.npc_manager.get_npcs_by_name(npc_name)
+                                 if npc.name == npc_name), None)
 
                             if npc_id:
                                 # Attempt to revive
@@ -4,6 +4,7 @@ Handles the map representation, terrain, and movement
 """
 
 import logging
+from math import hypot
 from typing import Dict, List, Tuple, Optional, Any
 from enum import Enum
 
@@ -60,6 +61,9 @@ class WorldMap:
         self.characters = {}  # Key: (x, y), Value: Character at that location
         self._tile_callbacks = []  # fired by set_terrain (P10.0)
         self.wall_guard = None  # engine-installed wall check (2026-07-12)
+        # (x, y, range) -> (terrain rows, occupants, text) for
+        # get_visible_description; re-validated on every read (below)
+        self._view_cache = {}
         logger.info(f"Map initialized with size {width}x{height}")
 
     def register_tile_callback(self, fn) -> None:
@@ -106,20 +110,22 @@ class WorldMap:
         # Add character to new position
         self.characters[(x, y)] = character
         character.position = (x, y)
-        logger.debug(f"Placed character {character.name} at ({x},{y})")
+        logger.debug("Placed character %s at (%s,%s)", character.name, x, y)
 
     def move_character(self, character, new_x, new_y):
         """Move a character to a new position if possible"""
         # Check if position is valid
         if not (0 <= new_x < self.width and 0 <= new_y < self.height):
-            logger.debug(f"Move failed for {character.name}: Position ({new_x},{new_y}) is out of bounds")
+            logger.debug("Move failed for %s: Position (%s,%s) is out of bounds",
+                         character.name, new_x, new_y)
             return False
 
         # Check if terrain is traversable (fliers ignore ground rules)
         if self.terrain[new_y][new_x] == TerrainType.WATER or self.terrain[new_y][new_x] == TerrainType.MOUNTAIN:
             tval = self.terrain[new_y][new_x].value
             if not _is_flier(character) and not _mount_crosses(character, tval):
-                logger.debug(f"Move failed for {character.name}: Terrain {tval} is not traversable")
+                logger.debug("Move failed for %s: Terrain %s is not traversable",
+                             character.name, tval)
                 return False
 
         # Walls are solid (bug-fix 2026-07-12): the installed guard rejects
@@ -129,39 +135,41 @@ class WorldMap:
         if guard is not None:
             old = getattr(character, "position", None)
             if old is not None and guard(character, old, (new_x, new_y)):
-                logger.debug(f"Move failed for {character.name}: wall guard blocked ({new_x},{new_y})")
+                logger.debug("Move failed for %s: wall guard blocked (%s,%s)",
+                             character.name, new_x, new_y)
                 return False
 
         # Check if position is occupied by another character
         if (new_x, new_y) in self.characters:
             occupant = self.characters[(new_x, new_y)]
-            logger.debug(f"Move failed for {character.name}: Position ({new_x},{new_y}) is occupied by {occupant.name}")
+            logger.debug("Move failed for %s: Position (%s,%s) is occupied by %s",
+                         character.name, new_x, new_y, occupant.name)
             return False
 
-        # Current position of the character
-        old_pos = None
-        for pos, char in self.characters.items():
-            if char.id == character.id:
-                old_pos = pos
-                break
+        # Current position of the character: normally the tile its own
+        # position names; scan the map only when that is out of step
+        old_pos = self._tile_of(character)
 
         # Move character
         if old_pos:
-            logger.debug(f"Moving {character.name} from {old_pos} to ({new_x},{new_y})")
+            logger.debug("Moving %s from %s to (%s,%s)",
+                         character.name, old_pos, new_x, new_y)
             del self.characters[old_pos]
         else:
-            logger.debug(f"Adding {character.name} to map at ({new_x},{new_y})")
+            logger.debug("Adding %s to map at (%s,%s)", character.name, new_x, new_y)
 
         # Update character position
         self.characters[(new_x, new_y)] = character
         character.position = (new_x, new_y)
-        logger.debug(f"Character {character.name} is now at position {character.position}")
+        logger.debug("Character %s is now at position %s",
+                     character.name, character.position)
 
         return True
 
     def get_visible_area(self, x: int, y: int, visibility_range=5) -> List[Dict]:
         """Return a description of the area visible from position (x,y)"""
         visible_area = []
+        reach2 = visibility_range * visibility_range
 
         for j in range(max(0, y - visibility_range), min(self.height, y + visibility_range + 1)):
             for i in range(max(0, x - visibility_range), min(self.width, x + visibility_range + 1)):
@@ -169,34 +177,63 @@ class WorldMap:
                 if i == x and j == y:
                     continue
 
-                distance = ((i - x) ** 2 + (j - y) ** 2) ** 0.5
-                if distance <= visibility_range:
-                    # Add terrain
-                    terrain_type = self.terrain[j][i].value
-
-                    # Add objects
-                    obj = None
-                    if (i, j) in self.objects:
-                        obj = self.objects[(i, j)]
-
-                    # Add characters
-                    char = None
-                    if (i, j) in self.characters:
-                        char = self.characters[(i, j)]
-
-                    visible_area.append({
-                        "position": (i, j),
-                        "direction": self._get_direction(x, y, i, j),
-                        "distance": int(distance),
-                        "terrain": terrain_type,
-                        "object": obj.name if obj and hasattr(obj, "name") else str(obj) if obj else None,
-                        "character": char.name if char else None
-                    })
+                if (i - x) ** 2 + (j - y) ** 2 > reach2:
+                    continue
+                distance = hypot(i - x, j - y)
+                # Add terrain
+                terrain_type = self.terrain[j][i].value
+
+                # Add objects
+                obj = None
+                if (i, j) in self.objects:
+                    obj = self.objects[(i, j)]
+
+                # Add characters
+                char = None
+                if (i, j) in self.characters:
+                    char = self.characters[(i, j)]
+
+                visible_area.append({
+                    "position": (i, j),
+                    "direction": self._get_direction(x, y, i, j),
+                    "distance": int(distance),
+                    "terrain": terrain_type,
+                    "object": obj.name if obj and hasattr(obj, "name") else str(obj) if obj else None,
+                    "character": char.name if char else None
+                })
 
         return visible_area
 
     def get_visible_description(self, x: int, y: int, visibility_range=5) -> str:
-        """Get a text description of the visible area"""
+        """Get a text description of the visible area.
+
+        Asked for every acting NPC each NPC tick, usually about a view that
+        has not changed. Terrain, characters and objects are all written
+        directly from many systems, so rather than a version counter the
+        memo re-reads the view window itself: its terrain rows and who or
+        what stands in it (by name). Far cheaper than re-describing it."""
+        r = visibility_range
+        x0, x1 = max(0, x - r), min(self.width, x + r + 1)
+        y0, y1 = max(0, y - r), min(self.height, y + r + 1)
+        rows = [row[x0:x1] for row in self.terrain[y0:y1]]
+        chars, objects = self.characters, self.objects
+        occupants = []
+        for j in range(y0, y1):
+            for i in range(x0, x1):
+                c, o = chars.get((i, j)), objects.get((i, j))
+                if c is not None or o is not None:
+                    occupants.append((i, j, c and c.name, o))
+        key = (x, y, r)
+        hit = self._view_cache.get(key)
+        if hit is not None and hit[0] == rows and hit[1] == occupants:
+            return hit[2]
+        text = self._describe_visible(x, y, r)
+        if len(self._view_cache) >= 512:
+            self._view_cache.clear()
+        self._view_cache[key] = (rows, occupants, text)
+        return text
+
+    def _describe_visible(self, x: int, y: int, visibility_range: int) -> str:
         visible_area = self.get_visible_area(x, y, visibility_range)
         description = []
 
@@ -326,6 +363,7 @@ class WorldMap:
         # Handle visibility if specified
         if highlight_pos and visibility_range:
             px, py = highlight_pos
+            reach2 = visibility_range * visibility_range
 
             # Create a new map with only visible areas
             visible_map = [["?" for _ in range(self.width)] for _ in range(self.height)]
@@ -333,8 +371,7 @@ class WorldMap:
             # Mark the visible area
             for j in range(max(0, py - visibility_range), min(self.height, py + visibility_range + 1)):
                 for i in range(max(0, px - visibility_range), min(self.width, px + visibility_range + 1)):
-                    distance = ((i - px) ** 2 + (j - py) ** 2) ** 0.5
-                    if distance <= visibility_range:
+                    if (i - px) ** 2 + (j - py) ** 2 <= reach2:
                         visible_map[j][i] = map_repr[j][i]
 
             # Mark the player position
@@ -350,10 +387,24 @@ class WorldMap:
 
     def remove_character(self, character):
         """Remove a character from the map without updating its position"""
-        for pos, char in list(self.characters.items()):
-            if char.id == character.id:
-                del self.characters[pos]
-                logger.debug(f"Removed character {character.name} from map at {pos}")
-                return True
+        pos = self._tile_of(character)
+        if pos is None:
+            return False
+        del self.characters[pos]
+        logger.debug("Removed character %s from map at %s", character.name, pos)
+        return True
 
-        return False
+    def _tile_of(self, character):
+        """The key `character` is stored under in self.characters, or None.
+        Positions are also assigned directly (teleports, loads), so the
+        tile its position names is only a first guess, checked by identity
+        before falling back to a scan by id."""
+        pos = getattr(character, "position", None)
+        if pos is not None:
+            pos = tuple(pos)
+            if self.characters.get(pos) is character:
+                return pos
+        for pos, char in self.characters.items():
+            if char.id == character.id:
+                return pos
+        return None